@@ -4,9 +4,19 @@
 import asyncio
 import json
 import time
+
+import orjson
 import websockets
 from loguru import logger
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+from src.rlx_datapipe.capture.websocket_handler import MAX_FRAME_SIZE
+
 
 async def test_websocket_connection():
     """Test basic WebSocket connection to Binance."""
@@ -21,13 +31,13 @@ async def test_websocket_connection():
     for url in urls:
         logger.info(f"\nTesting URL: {url}")
         try:
-            async with websockets.connect(url) as websocket:
+            async with websockets.connect(url, max_size=MAX_FRAME_SIZE, compression=None) as websocket:
                 logger.success(f"Connected to {url}")
                 
                 # Receive a few messages
                 for i in range(5):
                     message = await websocket.recv()
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     logger.info(f"Message {i+1}: {data.get('e', data.get('stream', 'unknown'))}")
                     
                 await websocket.close()
@@ -41,13 +51,13 @@ async def test_websocket_connection():
     
     logger.info(f"\nTesting capture script URL: {capture_url}")
     try:
-        async with websockets.connect(capture_url) as websocket:
+        async with websockets.connect(capture_url, max_size=MAX_FRAME_SIZE, compression=None) as websocket:
             logger.success("Connected successfully!")
             
             # Check message format
             for i in range(10):
                 message = await websocket.recv()
-                data = json.loads(message)
+                data = orjson.loads(message)
                 logger.info(f"Stream: {data.get('stream')} - Has data: {'data' in data}")
                 
                 if i == 0:
@@ -59,4 +69,6 @@ async def test_websocket_connection():
 
 if __name__ == "__main__":
     logger.info("Starting WebSocket connection test...")
+    if HAS_UVLOOP:
+        uvloop.install()
     asyncio.run(test_websocket_connection())
\ No newline at end of file
@@ -1,82 +1,139 @@
 #!/usr/bin/env python3
 """Detailed debug script to trace message flow."""
 
+import argparse
 import asyncio
 import json
+import mmap
 import time
 from pathlib import Path
 import sys
 sys.path.insert(0, ".")
 
 from loguru import logger
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 from src.rlx_datapipe.capture.websocket_handler import WebSocketHandler
 from src.rlx_datapipe.capture.jsonl_writer import JSONLWriter
 
-# Configure very detailed logging
-logger.remove()
-logger.add(sys.stderr, level="TRACE")
+# Upper bound on how long a record may sit in the writer buffer
+FLUSH_INTERVAL = 0.05
+
+# Every combined stream frame starts with this envelope prefix
+STREAM_PREFIX = b'{"stream":"'
+
+# Window used when counting lines so large captures are not read whole
+COUNT_CHUNK_SIZE = 64 * 1024 * 1024
+
+def count_lines(path: Path) -> int:
+    """Count newline-terminated records without decoding the file."""
+    if path.stat().st_size == 0:
+        return 0
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return sum(
+            mm[start:start + COUNT_CHUNK_SIZE].count(b"\n")
+            for start in range(0, len(mm), COUNT_CHUNK_SIZE)
+        )
 
 class DebugCapture:
     def __init__(self):
         self.symbol = "btcusdt"
         self.message_count = 0
         self.write_count = 0
+        self.trade_count = 0
+        self.depth_count = 0
+        
+        # Streams are known at connect time, so route frames by the raw
+        # stream name bytes instead of parsing the envelope
+        trade_stream = f"{self.symbol}@trade"
+        depth_stream = f"{self.symbol}@depth@100ms"
+        self._dispatch = {
+            trade_stream.encode(): self._handle_trade,
+            depth_stream.encode(): self._handle_depth,
+        }
         
         # Create test output directory
         self.output_dir = Path("data/debug_capture")
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create writer with small buffer
+        # Create buffered writer; a timer flushes it every FLUSH_INTERVAL
         logger.info(f"Creating JSONLWriter with output_dir={self.output_dir}")
         self.writer = JSONLWriter(
             str(self.output_dir),
             f"debug_capture_{int(time.time())}",
-            buffer_size=1,  # Write immediately
             compress=False  # No compression for debugging
         )
+        self._flush_handle = None
+        self._flush_tasks: set[asyncio.Task] = set()
         
         # WebSocket URL
-        self.ws_url = f"wss://stream.binance.com:9443/stream?streams={self.symbol}@trade/{self.symbol}@depth@100ms"
+        self.ws_url = f"wss://stream.binance.com:9443/stream?streams={trade_stream}/{depth_stream}"
         logger.info(f"WebSocket URL: {self.ws_url}")
         
-    async def on_message(self, message: dict, receive_ns: int):
-        """Handle incoming message with detailed logging."""
+    async def on_message(self, message: str | bytes, receive_ns: int):
+        """Handle incoming raw frame."""
         self.message_count += 1
-        logger.trace(f"on_message called - message #{self.message_count}")
-        logger.debug(f"Message stream: {message.get('stream', 'NO STREAM')}")
         
-        # Check message structure
-        if "stream" not in message:
-            logger.error(f"Missing 'stream' in message: {message}")
-            return
+        if isinstance(message, str):
+            message = message.encode()
             
-        if "data" not in message:
-            logger.error(f"Missing 'data' in message: {message}")
+        # Combined stream frames are {"stream":"<name>","data":...}; look the
+        # name up directly in the raw bytes
+        handler = None
+        if message.startswith(STREAM_PREFIX):
+            handler = self._dispatch.get(message[len(STREAM_PREFIX):message.find(b'"', len(STREAM_PREFIX))])
+        if handler is None:
+            logger.error(f"Unexpected message format: {message[:200]!r}")
             return
-            
-        # Create output record
-        output = {
-            "capture_ns": receive_ns,
-            "stream": message["stream"],
-            "data": message["data"]
-        }
+        handler(message, receive_ns)
         
-        logger.trace(f"Writing record #{self.write_count + 1}")
+        # Schedule a flush so buffered records reach disk within FLUSH_INTERVAL
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                FLUSH_INTERVAL, self._flush
+            )
         
-        # Write to file
-        self.writer.write(output)
-        self.write_count += 1
-        
-        # Force flush every write for debugging
-        logger.trace("Forcing flush")
-        self.writer.flush()
-        
-        # Log progress every 10 messages
+        # Only steady-state log: progress every 10 messages
         if self.message_count % 10 == 0:
             logger.info(f"Progress: {self.message_count} messages received, {self.write_count} written")
             stats = self.writer.get_stats()
             logger.info(f"Writer stats: {stats}")
             
+    def _handle_trade(self, message: bytes, receive_ns: int):
+        """Record a trade frame."""
+        self.trade_count += 1
+        self._write(message, receive_ns)
+        
+    def _handle_depth(self, message: bytes, receive_ns: int):
+        """Record a depth update frame."""
+        self.depth_count += 1
+        self._write(message, receive_ns)
+        
+    def _write(self, message: bytes, receive_ns: int):
+        """Splice the capture timestamp into the raw frame and buffer it."""
+        # The memoryview skips the opening brace without copying the frame
+        self.writer.write_bytes(b'{"capture_ns":%d,%b\n' % (receive_ns, memoryview(message)[1:]))
+        self.write_count += 1
+            
+    def _flush(self):
+        """Hand buffered records to the writer thread."""
+        self._flush_handle = None
+        logger.trace("Flushing writer buffer")
+        task = asyncio.ensure_future(self.writer.flush_async())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task):
+        """Forget a finished flush and report its failure."""
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Writer flush failed: {task.exception()}")
+        
     def on_connect(self):
         """Handle connection event."""
         logger.success("WebSocket connected!")
@@ -94,7 +151,8 @@ class DebugCapture:
             url=self.ws_url,
             on_message=self.on_message,
             on_connect=self.on_connect,
-            on_disconnect=self.on_disconnect
+            on_disconnect=self.on_disconnect,
+            decode=False
         )
         
         try:
@@ -105,12 +163,19 @@ class DebugCapture:
         finally:
             # Stop and close
             ws_handler.stop()
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            if self._flush_tasks:
+                # Failures are logged by _flush_done
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
             self.writer.close()
             
             # Final stats
             logger.info("=== FINAL STATISTICS ===")
             logger.info(f"Messages received: {self.message_count}")
             logger.info(f"Messages written: {self.write_count}")
+            logger.info(f"Trades: {self.trade_count}, depth updates: {self.depth_count}")
             logger.info(f"Writer stats: {self.writer.get_stats()}")
             
             # Check output files
@@ -119,8 +184,7 @@ class DebugCapture:
             
             for file in jsonl_files:
                 size = file.stat().st_size
-                with open(file) as f:
-                    lines = sum(1 for _ in f)
+                lines = count_lines(file)
                 logger.info(f"File: {file.name} - Size: {size} bytes - Lines: {lines}")
                 
                 # Show first message if any
@@ -129,6 +193,29 @@ class DebugCapture:
                         first_line = f.readline()
                         logger.info(f"First message: {first_line[:100]}...")
 
+def configure_logging(level: str):
+    """Install the stderr sink at the requested level."""
+    logger.remove()
+    if level in ("TRACE", "DEBUG"):
+        # Debug runs: format on a background thread and skip variable
+        # inspection so the capture loop only enqueues records
+        logger.add(sys.stderr, level=level, enqueue=True, backtrace=False, diagnose=False)
+    else:
+        logger.add(sys.stderr, level=level)
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Debug capture of Binance combined streams")
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        choices=["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level"
+    )
+    args = parser.parse_args()
+    configure_logging(args.log_level)
+    
+    if HAS_UVLOOP:
+        uvloop.install()
     capture = DebugCapture()
     asyncio.run(capture.run())
\ No newline at end of file
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """CLI interface for Crypto Lake data acquisition."""
 
-import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -12,17 +11,36 @@ from loguru import logger
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from rlx_datapipe.acquisition.crypto_lake_client import CryptoLakeClient
-from rlx_datapipe.acquisition.data_downloader import DataDownloader
-from rlx_datapipe.acquisition.integrity_validator import IntegrityValidator
-from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+# Acquisition modules pull in boto3/polars; each command imports only what it
+# uses so that e.g. `status` and `--help` start quickly.
+
+# Status glyphs; the ASCII set is used with --ascii or when stdout cannot
+# encode the emoji (e.g. non-UTF-8 locales and redirected output on Windows)
+EMOJI_ICONS = {
+    "ok": "✅", "fail": "❌", "warn": "⚠️ ", "search": "🔍", "stats": "📊",
+    "date": "📅", "folder": "📁", "total": "📈", "start": "🚀", "hint": "💡",
+    "cert": "📋", "done": "🎉",
+}
+ASCII_ICONS = {
+    "ok": "[OK]", "fail": "[FAIL]", "warn": "[WARN]", "search": "[..]", "stats": "[==]",
+    "date": "[--]", "folder": "[--]", "total": "[==]", "start": "[>>]", "hint": "[i]",
+    "cert": "[==]", "done": "[OK]",
+}
+
+
+def _stdout_supports_emoji() -> bool:
+    """Check whether stdout uses a Unicode encoding."""
+    encoding = getattr(sys.stdout, "encoding", None) or ""
+    return encoding.lower().replace("-", "").startswith("utf")
 
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--bucket", help="Specific S3 bucket name (if known)")
+@click.option("--refresh", is_flag=True, help="Ignore the cached S3 inventory and re-list")
+@click.option("--ascii", "ascii_only", is_flag=True, help="Use plain ASCII status markers")
 @click.pass_context
-def cli(ctx, verbose, bucket):
+def cli(ctx, verbose, bucket, refresh, ascii_only):
     """Crypto Lake Data Acquisition CLI
     
     This tool helps acquire historical market data from Crypto Lake S3.
@@ -44,44 +62,63 @@ def cli(ctx, verbose, bucket):
     ctx.ensure_object(dict)
     ctx.obj["bucket"] = bucket
     ctx.obj["verbose"] = verbose
+    ctx.obj["refresh"] = refresh
+    ctx.obj["icons"] = (
+        ASCII_ICONS if ascii_only or not _stdout_supports_emoji() else EMOJI_ICONS
+    )
+
+
+def _make_client(ctx):
+    """Create a client honouring the --bucket and --refresh group options."""
+    from rlx_datapipe.acquisition.crypto_lake_client import CryptoLakeClient
+
+    kwargs = {"bucket_name": ctx.obj.get("bucket")}
+    if ctx.obj.get("refresh"):
+        kwargs["cache_ttl"] = 0
+    return CryptoLakeClient(**kwargs)
 
 
 @cli.command()
 @click.pass_context
 def test_connection(ctx):
     """Test connection to Crypto Lake S3."""
-    bucket_name = ctx.obj.get("bucket")
+    import polars as pl
+
+    from rlx_datapipe.acquisition.crypto_lake_client import DATA_TYPES
+
+    icons = ctx.obj["icons"]
 
     try:
-        client = CryptoLakeClient(bucket_name=bucket_name)
-        click.echo(f"✅ Connected to bucket: {client.bucket_name}")
+        client = _make_client(ctx)
+        click.echo(f"{icons['ok']} Connected to bucket: {client.bucket_name}")
 
         if client.test_connection():
-            click.echo("✅ Connection test passed")
+            click.echo(f"{icons['ok']} Connection test passed")
 
             # Try to list some data
-            data = client.list_available_data()
+            inventory = client.list_inventory_frame()
+            counts = dict(inventory["data_type"].value_counts().iter_rows())
             click.echo("\nData inventory:")
-            click.echo(f"  Trades files: {len(data['trades'])}")
-            click.echo(f"  Book files: {len(data['book'])}")
-            click.echo(f"  Delta files: {len(data['book_delta_v2'])}")
+            click.echo(f"  Trades files: {counts.get('trades', 0)}")
+            click.echo(f"  Book files: {counts.get('book', 0)}")
+            click.echo(f"  Delta files: {counts.get('book_delta_v2', 0)}")
 
             # Show sample files
-            for data_type, files in data.items():
-                if files:
+            for data_type in DATA_TYPES:
+                files = inventory.filter(pl.col("data_type") == data_type)
+                if files.height:
                     click.echo(f"\n{data_type.upper()} sample files:")
-                    for file_info in files[:3]:
-                        size_mb = file_info["size"] / (1024 * 1024)
-                        click.echo(f"  - {file_info['key']} ({size_mb:.1f} MB)")
-                    if len(files) > 3:
-                        click.echo(f"  ... and {len(files) - 3} more files")
+                    for key, size in files.head(3).select("key", "size").iter_rows():
+                        click.echo(f"  - {key} ({size / (1024 * 1024):.1f} MB)")
+                    if files.height > 3:
+                        click.echo(f"  ... and {files.height - 3} more files")
 
         else:
-            click.echo("❌ Connection test failed")
+            click.echo(f"{icons['fail']} Connection test failed")
             raise click.Abort()
 
     except Exception as e:
-        click.echo(f"❌ Connection failed: {e}")
+        click.echo(f"{icons['fail']} Connection failed: {e}")
         if ctx.obj.get("verbose"):
             import traceback
             click.echo(traceback.format_exc())
@@ -97,37 +134,49 @@ def test_connection(ctx):
 @click.pass_context
 def list_inventory(ctx, symbol, exchange, data_type):
     """List available data in Crypto Lake."""
-    bucket_name = ctx.obj.get("bucket")
+    import polars as pl
+
+    from rlx_datapipe.acquisition.crypto_lake_client import DATA_TYPES
+
+    icons = ctx.obj["icons"]
 
     try:
-        client = CryptoLakeClient(bucket_name=bucket_name)
-        data = client.list_available_data(symbol, exchange)
+        client = _make_client(ctx)
+        inventory = client.list_inventory_frame(symbol, exchange)
 
         if data_type:
             # Show specific data type
-            files = data.get(data_type, [])
+            files = inventory.filter(pl.col("data_type") == data_type)
             click.echo(f"\n{data_type.upper()} files for {symbol} on {exchange}:")
-            click.echo(f"Found {len(files)} files")
+            click.echo(f"Found {files.height} files")
 
-            total_size = sum(f["size"] for f in files)
+            total_size = files["size"].sum()
             click.echo(f"Total size: {total_size / (1024**3):.2f} GB")
 
-            if files:
+            if files.height:
                 click.echo("\nSample files:")
-                for file_info in files[:10]:
-                    size_mb = file_info["size"] / (1024 * 1024)
-                    modified = file_info["last_modified"].strftime("%Y-%m-%d")
-                    click.echo(f"  - {file_info['key']} ({size_mb:.1f} MB, {modified})")
+                sample = files.head(10).select("key", "size", "last_modified")
+                for key, size, last_modified in sample.iter_rows():
+                    size_mb = size / (1024 * 1024)
+                    modified = last_modified.strftime("%Y-%m-%d")
+                    click.echo(f"  - {key} ({size_mb:.1f} MB, {modified})")
         else:
             # Show all data types
             click.echo(f"\nData inventory for {symbol} on {exchange}:")
 
-            for dtype, files in data.items():
-                total_size = sum(f["size"] for f in files) / (1024**3)
-                click.echo(f"  {dtype}: {len(files)} files ({total_size:.2f} GB)")
+            totals = {
+                dtype: (count, size)
+                for dtype, count, size in inventory.group_by("data_type").agg(
+                    pl.col("size").count().alias("count"),
+                    pl.col("size").sum().alias("size"),
+                ).iter_rows()
+            }
+            for dtype in DATA_TYPES:
+                count, size = totals.get(dtype, (0, 0))
+                click.echo(f"  {dtype}: {count} files ({size / (1024**3):.2f} GB)")
 
     except Exception as e:
-        click.echo(f"❌ Failed to list inventory: {e}")
+        click.echo(f"{icons['fail']} Failed to list inventory: {e}")
         if ctx.obj.get("verbose"):
             import traceback
             click.echo(traceback.format_exc())
@@ -144,14 +193,22 @@ def list_inventory(ctx, symbol, exchange, data_type):
 @click.option("--end-date", required=True, help="End date (YYYY-MM-DD)")
 @click.option("--dry-run", is_flag=True, help="Show what would be downloaded without downloading")
 @click.option("--staging-path", default="data/staging", help="Staging directory path")
+@click.option("--max-concurrent", default=8, show_default=True,
+              help="Maximum concurrent S3 downloads")
 @click.pass_context
-def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, staging_path):
+def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, staging_path,
+             max_concurrent):
     """Download historical data from Crypto Lake.
     
     Example:
       acquire_data download --start-date 2024-01-01 --end-date 2024-01-02
     """
-    bucket_name = ctx.obj.get("bucket")
+    import asyncio
+
+    from rlx_datapipe.acquisition.data_downloader import DataDownloader
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+
+    icons = ctx.obj["icons"]
 
     try:
         # Parse dates
@@ -159,45 +216,45 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
         end_dt = datetime.fromisoformat(end_date)
 
         if start_dt > end_dt:
-            click.echo("❌ Start date must be before end date")
+            click.echo(f"{icons['fail']} Start date must be before end date")
             raise click.Abort()
 
         # Initialize components
-        client = CryptoLakeClient(bucket_name=bucket_name)
+        client = _make_client(ctx)
         staging_manager = DataStagingManager(Path(staging_path))
 
         if dry_run:
-            click.echo("🔍 DRY RUN - No files will be downloaded")
+            click.echo(f"{icons['search']} DRY RUN - No files will be downloaded")
 
-        click.echo(f"📊 Planning download for {symbol} on {exchange}")
-        click.echo(f"📅 Date range: {start_date} to {end_date}")
-        click.echo(f"📁 Data types: {', '.join(data_types)}")
+        click.echo(f"{icons['stats']} Planning download for {symbol} on {exchange}")
+        click.echo(f"{icons['date']} Date range: {start_date} to {end_date}")
+        click.echo(f"{icons['folder']} Data types: {', '.join(data_types)}")
 
         total_files = 0
         total_size = 0
 
-        # Check what's available
+        # Check what's available; one inventory listing serves every data type
         for data_type in data_types:
-            files = client.list_files_in_date_range(
+            files = client.files_in_date_range_frame(
                 symbol, exchange, data_type, start_dt, end_dt
             )
 
-            type_size = sum(f["size"] for f in files)
-            total_files += len(files)
+            type_size = files["size"].sum()
+            total_files += files.height
             total_size += type_size
 
             click.echo(f"\n{data_type}:")
-            click.echo(f"  Files: {len(files)}")
+            click.echo(f"  Files: {files.height}")
             click.echo(f"  Size: {type_size / (1024**2):.1f} MB")
 
-        click.echo(f"\n📈 Total: {total_files} files, {total_size / (1024**3):.2f} GB")
+        click.echo(f"\n{icons['total']} Total: {total_files} files, {total_size / (1024**3):.2f} GB")
 
         if total_files == 0:
-            click.echo("❌ No files found for the specified criteria")
+            click.echo(f"{icons['fail']} No files found for the specified criteria")
             return
 
         if dry_run:
-            click.echo("✅ Dry run complete")
+            click.echo(f"{icons['ok']} Dry run complete")
             return
 
         # Confirm download
@@ -206,16 +263,14 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
             return
 
         # Execute download
-        downloader = DataDownloader(client, Path(staging_path) / "raw")
-
-        async def run_download():
-            results = downloader.download_batch(
-                symbol, exchange, list(data_types), start_dt, end_dt
-            )
-            return results
+        downloader = DataDownloader(
+            client, Path(staging_path) / "raw", max_concurrent=max_concurrent
+        )
 
-        click.echo("\n🚀 Starting download...")
-        results = asyncio.run(run_download())
+        click.echo(f"\n{icons['start']} Starting download...")
+        results = asyncio.run(downloader.download_batch_async(
+            symbol, exchange, list(data_types), start_dt, end_dt
+        ))
 
         # Report results
         total_downloaded = 0
@@ -226,8 +281,8 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
             total_failed += len(failed)
 
             click.echo(f"\n{data_type}:")
-            click.echo(f"  ✅ Downloaded: {len(successful)}")
-            click.echo(f"  ❌ Failed: {len(failed)}")
+            click.echo(f"  {icons['ok']} Downloaded: {len(successful)}")
+            click.echo(f"  {icons['fail']} Failed: {len(failed)}")
 
             if failed and ctx.obj.get("verbose"):
                 for failure in failed[:3]:
@@ -235,18 +290,18 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
 
         # Summary
         summary = downloader.get_download_summary()
-        click.echo("\n📊 Download Summary:")
+        click.echo(f"\n{icons['stats']} Download Summary:")
         click.echo(f"  Success rate: {summary['success_rate']:.1%}")
         click.echo(f"  Downloaded: {summary['mb_downloaded']:.1f} MB")
         click.echo(f"  Speed: {summary['speed_mbps']:.1f} MB/s")
         click.echo(f"  Duration: {summary['duration_seconds']:.1f} seconds")
 
         if total_downloaded > 0:
-            click.echo(f"\n✅ Download complete! Files are in {staging_path}/raw")
-            click.echo("💡 Next step: Run 'acquire_data validate' to validate the files")
+            click.echo(f"\n{icons['ok']} Download complete! Files are in {staging_path}/raw")
+            click.echo(f"{icons['hint']} Next step: Run 'acquire_data validate' to validate the files")
 
     except Exception as e:
-        click.echo(f"❌ Download failed: {e}")
+        click.echo(f"{icons['fail']} Download failed: {e}")
         if ctx.obj.get("verbose"):
             import traceback
             click.echo(traceback.format_exc())
@@ -259,6 +314,10 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
 @click.pass_context
 def validate(ctx, staging_path, data_type):
     """Validate downloaded files and move them through staging pipeline."""
+    from rlx_datapipe.acquisition.integrity_validator import IntegrityValidator
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+
+    icons = ctx.obj["icons"]
 
     try:
         staging_manager = DataStagingManager(Path(staging_path))
@@ -274,7 +333,7 @@ def validate(ctx, staging_path, data_type):
             click.echo("No files found to validate")
             return
 
-        click.echo(f"🔍 Validating {len(raw_files)} files...")
+        click.echo(f"{icons['search']} Validating {len(raw_files)} files...")
 
         validated = 0
         moved_to_ready = 0
@@ -282,10 +341,13 @@ def validate(ctx, staging_path, data_type):
 
         for manifest in raw_files:
             click.echo(f"\nValidating: {manifest.key}")
+            # Collect this file's results and emit them with a single echo
+            lines = []
 
             # Move to validating
             if not staging_manager.move_to_validating(manifest.key):
-                click.echo("  ❌ Failed to move to validating")
+                lines.append(f"  {icons['fail']} Failed to move to validating")
+                click.echo("\n".join(lines))
                 continue
 
             # Validate
@@ -297,38 +359,38 @@ def validate(ctx, staging_path, data_type):
             if result.passed:
                 # Move to ready
                 if staging_manager.move_to_ready(manifest.key, result):
-                    click.echo("  ✅ Moved to ready")
+                    lines.append(f"  {icons['ok']} Moved to ready")
                     moved_to_ready += 1
                 else:
-                    click.echo("  ❌ Failed to move to ready")
+                    lines.append(f"  {icons['fail']} Failed to move to ready")
             else:
                 # Move to quarantine
                 error_msg = "; ".join(result.errors)
                 if staging_manager.move_to_quarantine(manifest.key, result, error_msg):
-                    click.echo(f"  ⚠️  Quarantined: {error_msg}")
+                    lines.append(f"  {icons['warn']} Quarantined: {error_msg}")
                     quarantined += 1
                 else:
-                    click.echo("  ❌ Failed to quarantine")
+                    lines.append(f"  {icons['fail']} Failed to quarantine")
 
             # Show validation details if verbose
             if ctx.obj.get("verbose") and (result.warnings or result.errors):
-                for warning in result.warnings:
-                    click.echo(f"    ⚠️  {warning}")
-                for error in result.errors:
-                    click.echo(f"    ❌ {error}")
+                lines.extend(f"    {icons['warn']} {warning}" for warning in result.warnings)
+                lines.extend(f"    {icons['fail']} {error}" for error in result.errors)
+
+            click.echo("\n".join(lines))
 
         # Summary
-        click.echo("\n📊 Validation Summary:")
+        click.echo(f"\n{icons['stats']} Validation Summary:")
         click.echo(f"  Validated: {validated}")
-        click.echo(f"  ✅ Ready: {moved_to_ready}")
-        click.echo(f"  ⚠️  Quarantined: {quarantined}")
+        click.echo(f"  {icons['ok']} Ready: {moved_to_ready}")
+        click.echo(f"  {icons['warn']} Quarantined: {quarantined}")
 
         if moved_to_ready > 0:
-            click.echo(f"\n✅ Validation complete! Files are in {staging_path}/ready")
-            click.echo("💡 Next step: Run 'acquire_data status' to check overall progress")
+            click.echo(f"\n{icons['ok']} Validation complete! Files are in {staging_path}/ready")
+            click.echo(f"{icons['hint']} Next step: Run 'acquire_data status' to check overall progress")
 
     except Exception as e:
-        click.echo(f"❌ Validation failed: {e}")
+        click.echo(f"{icons['fail']} Validation failed: {e}")
         if ctx.obj.get("verbose"):
             import traceback
             click.echo(traceback.format_exc())
@@ -337,14 +399,18 @@ def validate(ctx, staging_path, data_type):
 
 @cli.command()
 @click.option("--staging-path", default="data/staging", help="Staging directory path")
-def status(staging_path):
+@click.pass_context
+def status(ctx, staging_path):
     """Show staging area status and statistics."""
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+
+    icons = ctx.obj["icons"]
 
     try:
         staging_manager = DataStagingManager(Path(staging_path))
         summary = staging_manager.get_staging_summary()
 
-        click.echo("📊 Staging Area Status\n")
+        click.echo(f"{icons['stats']} Staging Area Status\n")
 
         # File counts by status
         click.echo("File Status:")
@@ -366,7 +432,7 @@ def status(staging_path):
             click.echo(f"  {name}: {path}")
 
     except Exception as e:
-        click.echo(f"❌ Failed to get status: {e}")
+        click.echo(f"{icons['fail']} Failed to get status: {e}")
         raise click.Abort()
 
 
@@ -379,8 +445,12 @@ def status(staging_path):
               default=["trades", "book", "book_delta_v2"],
               help="Required data types")
 @click.option("--staging-path", default="data/staging", help="Staging directory path")
-def certify(symbol, exchange, start_date, end_date, data_types, staging_path):
+@click.pass_context
+def certify(ctx, symbol, exchange, start_date, end_date, data_types, staging_path):
     """Generate data readiness certificate."""
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+
+    icons = ctx.obj["icons"]
 
     try:
         staging_manager = DataStagingManager(Path(staging_path))
@@ -389,7 +459,7 @@ def certify(symbol, exchange, start_date, end_date, data_types, staging_path):
             symbol, exchange, start_date, end_date, list(data_types)
         )
 
-        click.echo("📋 Data Readiness Certificate\n")
+        click.echo(f"{icons['cert']} Data Readiness Certificate\n")
 
         click.echo(f"Symbol: {certificate['symbol']}")
         click.echo(f"Exchange: {certificate['exchange']}")
@@ -397,9 +467,9 @@ def certify(symbol, exchange, start_date, end_date, data_types, staging_path):
         click.echo(f"Generated: {certificate['generated_at']}")
 
         if certificate["ready"]:
-            click.echo("\n✅ STATUS: READY")
+            click.echo(f"\n{icons['ok']} STATUS: READY")
         else:
-            click.echo("\n❌ STATUS: NOT READY")
+            click.echo(f"\n{icons['fail']} STATUS: NOT READY")
 
         # Summary by data type
         click.echo("\nData Summary:")
@@ -412,17 +482,17 @@ def certify(symbol, exchange, start_date, end_date, data_types, staging_path):
 
         # Issues
         if certificate["issues"]:
-            click.echo(f"\n⚠️  Issues ({len(certificate['issues'])}):")
+            click.echo(f"\n{icons['warn']} Issues ({len(certificate['issues'])}):")
             for issue in certificate["issues"]:
                 click.echo(f"  - {issue}")
 
         if certificate["ready"]:
-            click.echo("\n🎉 Data is ready for Epic 1 validation work!")
+            click.echo(f"\n{icons['done']} Data is ready for Epic 1 validation work!")
         else:
-            click.echo("\n💡 Fix the issues above before proceeding to Epic 1")
+            click.echo(f"\n{icons['hint']} Fix the issues above before proceeding to Epic 1")
 
     except Exception as e:
-        click.echo(f"❌ Failed to generate certificate: {e}")
+        click.echo(f"{icons['fail']} Failed to generate certificate: {e}")
         raise click.Abort()
 
 
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 """CLI interface for Crypto Lake data acquisition using lakeapi."""
 
-import asyncio
-import json
+import functools
+import os
 import sys
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
 import click
@@ -13,16 +13,166 @@ from loguru import logger
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from rlx_datapipe.acquisition.crypto_lake_api_client import CryptoLakeAPIClient
-from rlx_datapipe.acquisition.integrity_validator import IntegrityValidator
-from rlx_datapipe.acquisition.lakeapi_downloader import LakeAPIDownloader
-from rlx_datapipe.acquisition.staging_manager import DataStagingManager
+# Acquisition modules pull in lakeapi/pandas/polars; each command imports only
+# what it uses so that e.g. `status` and `--help` start quickly.
+
+
+# Concurrency limit passed to LakeAPIDownloader (conservative for lakeapi)
+MAX_CONCURRENT_DOWNLOADS = 2
+
+# LakeAPIDownloader.download_task runs the blocking lakeapi read inside its
+# coroutine, so downloads actually run one at a time. The concurrency the pool
+# has to cover is that one read's fan-out, a reader thread per CPU
+# (lakeapi's ensure_cpu_count)
+MAX_POOL_CONNECTIONS = max(10, os.cpu_count() or 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Return the process-wide CryptoLakeAPIClient.
+
+    Reusing one client keeps its boto3 session and S3 connection pool, so
+    callers running several commands in one process pay for them once.
+    """
+    from rlx_datapipe.acquisition.crypto_lake_api_client import CryptoLakeAPIClient
+
+    return CryptoLakeAPIClient(max_pool_connections=MAX_POOL_CONNECTIONS)
+
+
+def _iter_parquet(dirpath):
+    """List Parquet files in a directory with a single scandir pass.
+
+    Args:
+        dirpath: Directory to scan (a missing directory yields no files)
+
+    Returns:
+        List of os.DirEntry objects; their cached stat avoids re-stat'ing
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            return [entry for entry in it if entry.is_file() and entry.name.endswith(".parquet")]
+    except FileNotFoundError:
+        return []
+
+
+def _register_raw_files(staging_manager):
+    """Add lakeapi downloads in raw/ to the staging manifest.
+
+    LakeAPIDownloader writes ``{exchange}_{symbol}_{data_type}_{start}_{end}.parquet``
+    straight into raw/ without registering it, while every staging move works
+    off the manifest. Each unregistered file is keyed by its file name and
+    dated by the start of its download chunk.
+
+    Args:
+        staging_manager: DataStagingManager whose raw/ directory is scanned
+    """
+    for entry in _iter_parquet(staging_manager.raw_dir):
+        if entry.name in staging_manager.manifest:
+            continue
+
+        try:
+            exchange, symbol, rest = entry.name.removesuffix(".parquet").split("_", 2)
+            file_data_type, start, _end = rest.rsplit("_", 2)
+            file_date = date.fromisoformat(start).isoformat()
+        except ValueError:
+            logger.warning("⚠️ Could not parse download file name {}", entry.name)
+            continue
+
+        staging_manager.register_file(
+            s3_key=entry.name,
+            local_path=Path(entry.path),
+            data_type=file_data_type,
+            symbol=symbol,
+            exchange=exchange,
+            date=file_date,
+            size_bytes=entry.stat().st_size
+        )
+
+
+# Availability probes query lakeapi for every data type; repeat CLI runs
+# reuse the last answer for up to AVAILABILITY_CACHE_TTL seconds
+AVAILABILITY_CACHE_DIR = Path.home() / ".cache" / "rlx" / "availability"
+AVAILABILITY_CACHE_TTL = 3600
+
+
+def _cached_availability(symbol, exchange, client=None, ttl=AVAILABILITY_CACHE_TTL, refresh=False):
+    """Return client.list_available_data(), served from a disk cache when fresh.
+
+    Args:
+        symbol: Trading pair symbol
+        exchange: Exchange name
+        client: CryptoLakeAPIClient to probe with (created on a cache miss if None)
+        ttl: Maximum age of a cached entry in seconds
+        refresh: Skip the cache and probe lakeapi
+
+    Returns:
+        Availability dictionary as returned by the client
+    """
+    import hashlib
+    import json
+    import time
+
+    key = hashlib.sha256(f"{symbol}|{exchange}".encode()).hexdigest()
+    cache_path = AVAILABILITY_CACHE_DIR / f"{key}.json"
+
+    cached = None
+    fresh = False
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        cached = json.loads(cache_path.read_bytes())
+        fresh = age < ttl
+    except (OSError, ValueError):
+        pass
+
+    if fresh and not refresh:
+        logger.debug("Using cached availability for {} on {}", symbol, exchange)
+        return cached["payload"]
+
+    if client is None:
+        client = _get_client()
+
+    availability = client.list_available_data(symbol=symbol, exchange=exchange)
+    if "error" in availability:
+        return availability
+
+    # A failed probe may be transient (network, auth), so only answers where
+    # every data type probed cleanly are cached
+    if any("error" in probe for probe in availability.get("availability", {}).values()):
+        logger.debug("Not caching availability for {} on {}: a probe failed", symbol, exchange)
+        return availability
+
+    # The etag is a hash of the payload, so a refresh can report whether
+    # anything changed since the previous probe
+    payload = json.dumps(availability, sort_keys=True).encode()
+    etag = hashlib.sha256(payload).hexdigest()
+    if cached and cached.get("etag") == etag:
+        logger.debug("Availability unchanged since last probe")
+
+    AVAILABILITY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".tmp")
+    _write_json(tmp_path, {"etag": etag, "payload": availability})
+    os.replace(tmp_path, cache_path)
+
+    return availability
+
+
+def _write_json(path, obj):
+    """Write obj as indented JSON with a single write, using orjson if available."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        Path(path).write_text(json.dumps(obj, indent=2))
+    else:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+@click.option("--no-cache", is_flag=True, help="Ignore cached availability probes and re-query")
 @click.pass_context
-def cli(ctx, verbose):
+def cli(ctx, verbose, no_cache):
     """Crypto Lake Data Acquisition CLI (lakeapi version)
     
     This tool helps acquire historical market data from Crypto Lake using the official lakeapi package.
@@ -43,6 +193,7 @@ def cli(ctx, verbose):
     # Store context
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
+    ctx.obj["no_cache"] = no_cache
 
 
 @cli.command()
@@ -53,7 +204,7 @@ def test_connection(ctx):
 
     try:
         # Initialize client
-        client = CryptoLakeAPIClient()
+        client = _get_client()
 
         # Test connection
         success = client.test_connection()
@@ -63,27 +214,32 @@ def test_connection(ctx):
 
             # Show available data sample
             logger.info("📊 Checking data availability...")
-            availability = client.list_available_data()
-
-            click.echo("\n" + "="*60)
-            click.echo("📊 DATA AVAILABILITY SAMPLE")
-            click.echo("="*60)
-            click.echo(f"Symbol: {availability['symbol']}")
-            click.echo(f"Exchange: {availability['exchange']}")
-            click.echo(f"Date Range Tested: {availability['tested_date_range']['start']} to {availability['tested_date_range']['end']}")
-            click.echo()
+            availability = _cached_availability(
+                "BTC-USDT", "BINANCE", client=client, refresh=ctx.obj.get("no_cache")
+            )
+
+            out = []
+            emit = out.append
+            emit("\n" + "="*60)
+            emit("📊 DATA AVAILABILITY SAMPLE")
+            emit("="*60)
+            emit(f"Symbol: {availability['symbol']}")
+            emit(f"Exchange: {availability['exchange']}")
+            emit(f"Date Range Tested: {availability['tested_date_range']['start']} to {availability['tested_date_range']['end']}")
+            emit("")
 
             for data_type, info in availability["availability"].items():
                 status = "✅ Available" if info["available"] else "❌ Not Available"
-                click.echo(f"{data_type:15} | {status}")
+                emit(f"{data_type:15} | {status}")
                 if info["available"]:
-                    click.echo(f"                | Sample rows: {info['sample_rows']:,}")
+                    emit(f"                | Sample rows: {info['sample_rows']:,}")
                     if info.get("columns"):
-                        click.echo(f"                | Columns: {len(info['columns'])} ({', '.join(info['columns'][:3])}...)")
+                        emit(f"                | Columns: {len(info['columns'])} ({', '.join(info['columns'][:3])}...)")
                 else:
-                    click.echo(f"                | Error: {info.get('error', 'Unknown')}")
-                click.echo()
+                    emit(f"                | Error: {info.get('error', 'Unknown')}")
+                emit("")
 
+            click.echo("\n".join(out))
             return True
 
         logger.error("❌ Connection failed!")
@@ -104,18 +260,18 @@ def list_inventory(ctx, symbol, exchange, data_type):
     logger.info(f"📋 Listing available data for {symbol} on {exchange}")
 
     try:
-        client = CryptoLakeAPIClient()
-
-        # Get data availability
-        availability = client.list_available_data(symbol=symbol, exchange=exchange)
-
-        click.echo("\n" + "="*60)
-        click.echo("📋 CRYPTO LAKE DATA INVENTORY")
-        click.echo("="*60)
-        click.echo(f"Symbol: {availability['symbol']}")
-        click.echo(f"Exchange: {availability['exchange']}")
-        click.echo(f"Date Range Tested: {availability['tested_date_range']['start']} to {availability['tested_date_range']['end']}")
-        click.echo()
+        # Get data availability; the client is only created on a cache miss
+        availability = _cached_availability(symbol, exchange, refresh=ctx.obj.get("no_cache"))
+
+        out = []
+        emit = out.append
+        emit("\n" + "="*60)
+        emit("📋 CRYPTO LAKE DATA INVENTORY")
+        emit("="*60)
+        emit(f"Symbol: {availability['symbol']}")
+        emit(f"Exchange: {availability['exchange']}")
+        emit(f"Date Range Tested: {availability['tested_date_range']['start']} to {availability['tested_date_range']['end']}")
+        emit("")
 
         data_types_to_show = [data_type] if data_type else ["trades", "book", "book_delta_v2"]
 
@@ -124,20 +280,22 @@ def list_inventory(ctx, symbol, exchange, data_type):
                 info = availability["availability"][dt]
                 status = "✅ Available" if info["available"] else "❌ Not Available"
 
-                click.echo(f"Data Type: {dt}")
-                click.echo(f"Status: {status}")
+                emit(f"Data Type: {dt}")
+                emit(f"Status: {status}")
 
                 if info["available"]:
-                    click.echo(f"Sample Rows: {info['sample_rows']:,}")
+                    emit(f"Sample Rows: {info['sample_rows']:,}")
                     if info.get("columns"):
-                        click.echo(f"Columns ({len(info['columns'])}): {', '.join(info['columns'][:5])}...")
+                        emit(f"Columns ({len(info['columns'])}): {', '.join(info['columns'][:5])}...")
                         if len(info["columns"]) > 5:
-                            click.echo(f"  ... and {len(info['columns']) - 5} more")
+                            emit(f"  ... and {len(info['columns']) - 5} more")
                 else:
-                    click.echo(f"Error: {info.get('error', 'Unknown')}")
+                    emit(f"Error: {info.get('error', 'Unknown')}")
 
-                click.echo("-" * 40)
-                click.echo()
+                emit("-" * 40)
+                emit("")
+
+        click.echo("\n".join(out))
 
     except Exception as e:
         logger.error(f"❌ Failed to list inventory: {e}")
@@ -155,11 +313,14 @@ def list_inventory(ctx, symbol, exchange, data_type):
 @click.pass_context
 def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, staging_path, chunk_days):
     """Download historical data from Crypto Lake."""
+    import asyncio
+
+    from rlx_datapipe.acquisition.lakeapi_downloader import LakeAPIDownloader
 
     # Parse dates
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_dt = datetime.fromisoformat(start_date)
+        end_dt = datetime.fromisoformat(end_date)
     except ValueError as e:
         logger.error(f"❌ Invalid date format: {e}")
         return
@@ -168,18 +329,18 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
     if not data_types:
         data_types = ["trades", "book", "book_delta_v2"]
 
-    logger.info(f"📥 {'DRY RUN: ' if dry_run else ''}Downloading {symbol} from {exchange}")
-    logger.info(f"Date range: {start_date} to {end_date}")
-    logger.info(f"Data types: {', '.join(data_types)}")
-    logger.info(f"Staging path: {staging_path}")
+    logger.info("📥 {}Downloading {} from {}", "DRY RUN: " if dry_run else "", symbol, exchange)
+    logger.info("Date range: {} to {}", start_date, end_date)
+    logger.info("Data types: {}", ", ".join(data_types))
+    logger.info("Staging path: {}", staging_path)
 
     try:
         # Initialize components
-        client = CryptoLakeAPIClient()
+        client = _get_client()
         downloader = LakeAPIDownloader(
             crypto_lake_client=client,
             staging_path=Path(staging_path),
-            max_concurrent=2  # Conservative for lakeapi
+            max_concurrent=MAX_CONCURRENT_DOWNLOADS
         )
 
         # Generate download tasks
@@ -228,8 +389,7 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
             manifest = downloader.get_download_manifest(tasks)
             manifest["summary"] = summary
 
-            with open(manifest_path, "w") as f:
-                json.dump(manifest, f, indent=2)
+            _write_json(manifest_path, manifest)
 
             click.echo(f"Manifest saved: {manifest_path}")
 
@@ -243,6 +403,11 @@ def download(ctx, symbol, exchange, data_types, start_date, end_date, dry_run, s
 @click.pass_context
 def validate(ctx, staging_path, data_type):
     """Validate downloaded files and move through staging pipeline."""
+    import asyncio
+
+    from rlx_datapipe.acquisition.integrity_validator import IntegrityValidator
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager, FileStatus
+
     logger.info("🔍 Validating downloaded data...")
 
     try:
@@ -250,57 +415,89 @@ def validate(ctx, staging_path, data_type):
         staging_manager = DataStagingManager(staging_root=Path(staging_path))
         validator = IntegrityValidator()
 
+        # lakeapi downloads land in raw/ without a manifest entry
+        _register_raw_files(staging_manager)
+
         # Find files to validate
-        raw_files = list((Path(staging_path) / "raw").glob("*.parquet"))
+        raw_files = staging_manager.get_files_by_status(FileStatus.RAW)
 
         if data_type:
-            raw_files = [f for f in raw_files if data_type in f.name]
+            raw_files = [m for m in raw_files if m.data_type == data_type]
 
         if not raw_files:
             logger.warning("⚠️ No files found to validate")
             return
 
-        logger.info(f"Found {len(raw_files)} files to validate")
-
-        # Validate each file
-        for file_path in raw_files:
-            logger.info(f"Validating {file_path.name}...")
-
-            # Move to validating
-            validating_path = staging_manager.move_to_validating(file_path)
-
-            # Determine data type from filename
-            if "trades" in file_path.name:
-                file_data_type = "trades"
-            elif "book_delta" in file_path.name:
-                file_data_type = "book_delta_v2"
-            elif "book" in file_path.name:
-                file_data_type = "book"
-            else:
-                logger.warning(f"⚠️ Could not determine data type for {file_path.name}")
-                continue
-
-            # Validate
-            is_valid, errors = validator.validate_file(validating_path, file_data_type)
-
-            if is_valid:
-                # Move to ready
-                ready_path = staging_manager.move_to_ready(validating_path, file_data_type)
-                logger.info(f"✅ {file_path.name} → ready")
-            else:
-                # Move to quarantine
-                quarantine_path = staging_manager.move_to_quarantine(validating_path, errors)
-                logger.error(f"❌ {file_path.name} → quarantine: {errors}")
+        logger.info("Found {} files to validate", len(raw_files))
+
+        # Files are independent: validate them on worker threads, capped so
+        # Parquet decoding does not oversubscribe the CPU. Staging moves
+        # update the shared manifest and are serialized.
+        semaphore = asyncio.Semaphore(min(8, os.cpu_count() or 1))
+        staging_lock = asyncio.Lock()
+
+        async def validate_one(manifest):
+            async with semaphore:
+                logger.info("Validating {}...", manifest.key)
+
+                # Move to validating; this updates manifest.local_path
+                async with staging_lock:
+                    moved = await asyncio.to_thread(
+                        staging_manager.move_to_validating, manifest.key
+                    )
+                if not moved:
+                    logger.error("❌ {}: failed to move to validating", manifest.key)
+                    return
+
+                # Validate
+                result = await asyncio.to_thread(
+                    validator.validate_file,
+                    Path(manifest.local_path),
+                    manifest.data_type
+                )
+
+                async with staging_lock:
+                    if result.passed:
+                        # Move to ready
+                        await asyncio.to_thread(
+                            staging_manager.move_to_ready, manifest.key, result
+                        )
+                        logger.info("✅ {} → ready", manifest.key)
+                    else:
+                        # Move to quarantine
+                        error_msg = "; ".join(result.errors)
+                        await asyncio.to_thread(
+                            staging_manager.move_to_quarantine,
+                            manifest.key,
+                            result,
+                            error_msg
+                        )
+                        logger.error(
+                            "❌ {} → quarantine: {}", manifest.key, error_msg
+                        )
+
+        async def validate_all():
+            # One failing file must not cancel the others
+            return await asyncio.gather(
+                *(validate_one(manifest) for manifest in raw_files),
+                return_exceptions=True
+            )
+
+        outcomes = asyncio.run(validate_all())
+        for manifest, outcome in zip(raw_files, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error("❌ {}: validation failed: {}", manifest.key, outcome)
 
         # Show status
-        status = staging_manager.get_status()
+        summary = staging_manager.get_staging_summary()
 
         click.echo("\n" + "="*60)
         click.echo("🔍 VALIDATION SUMMARY")
         click.echo("="*60)
-        click.echo(f"Ready files: {status['ready_count']}")
-        click.echo(f"Quarantined files: {status['quarantine_count']}")
-        click.echo(f"Total validated data: {status['total_size_mb']:.1f} MB")
+        status_counts = summary["status_counts"]
+        click.echo(f"Ready files: {status_counts.get('ready', 0)}")
+        click.echo(f"Quarantined files: {status_counts.get('quarantined', 0)}")
+        click.echo(f"Total validated data: {summary['total_size_mb']:.1f} MB")
 
     except Exception as e:
         logger.error(f"❌ Validation failed: {e}")
@@ -311,69 +508,79 @@ def validate(ctx, staging_path, data_type):
 @click.pass_context
 def status(ctx, staging_path):
     """Show staging area status and statistics."""
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager, FileStatus
+
     logger.info("📊 Checking staging area status...")
 
     try:
         staging_manager = DataStagingManager(staging_root=Path(staging_path))
-        status = staging_manager.get_status()
-
-        click.echo("\n" + "="*60)
-        click.echo("📊 STAGING AREA STATUS")
-        click.echo("="*60)
-        click.echo(f"Staging Path: {staging_path}")
-        click.echo()
-
-        click.echo("File Counts:")
-        click.echo(f"  Raw: {status['raw_count']}")
-        click.echo(f"  Validating: {status['validating_count']}")
-        click.echo(f"  Ready: {status['ready_count']}")
-        click.echo(f"  Quarantined: {status['quarantine_count']}")
-        click.echo()
-
-        click.echo(f"Total Data Size: {status['total_size_mb']:.1f} MB")
-        click.echo()
+        summary = staging_manager.get_staging_summary()
+        status_counts = summary["status_counts"]
+
+        out = []
+        emit = out.append
+        emit("\n" + "="*60)
+        emit("📊 STAGING AREA STATUS")
+        emit("="*60)
+        emit(f"Staging Path: {staging_path}")
+        emit("")
+
+        emit("File Counts:")
+        emit(f"  Raw: {status_counts.get('raw', 0)}")
+        emit(f"  Validating: {status_counts.get('validating', 0)}")
+        emit(f"  Ready: {status_counts.get('ready', 0)}")
+        emit(f"  Quarantined: {status_counts.get('quarantined', 0)}")
+        emit("")
+
+        emit(f"Total Data Size: {summary['total_size_mb']:.1f} MB")
+        emit("")
 
         # Show ready files by data type
-        if status["ready_files"]:
-            click.echo("Ready Files by Data Type:")
+        ready_files = staging_manager.get_files_by_status(FileStatus.READY)
+        if ready_files:
+            emit("Ready Files by Data Type:")
             by_type = {}
-            for file_info in status["ready_files"]:
-                data_type = file_info["data_type"]
+            for manifest in ready_files:
+                data_type = manifest.data_type
                 if data_type not in by_type:
                     by_type[data_type] = []
-                by_type[data_type].append(file_info)
+                by_type[data_type].append(manifest)
 
             for data_type, files in by_type.items():
-                total_size = sum(f["size_mb"] for f in files)
-                click.echo(f"  {data_type}: {len(files)} files ({total_size:.1f} MB)")
+                total_size = sum(m.size_bytes for m in files) / (1024 * 1024)
+                emit(f"  {data_type}: {len(files)} files ({total_size:.1f} MB)")
 
         # Show quarantine summary
-        if status["quarantine_count"] > 0:
-            click.echo()
-            click.echo("⚠️ Quarantined Files:")
+        if status_counts.get("quarantined", 0) > 0:
+            emit("")
+            emit("⚠️ Quarantined Files:")
             quarantine_path = Path(staging_path) / "quarantine"
-            for file_path in quarantine_path.glob("*.parquet"):
-                click.echo(f"  {file_path.name}")
+            for entry in _iter_parquet(quarantine_path):
+                emit(f"  {entry.name} ({entry.stat().st_size / (1024 * 1024):.1f} MB)")
+
+        click.echo("\n".join(out))
 
     except Exception as e:
         logger.error(f"❌ Status check failed: {e}")
 
 
 @cli.command()
-@click.option("--symbol", default="BTC-USDT", help="Trading symbol")
+@click.option("--symbol", "symbols", multiple=True, default=["BTC-USDT"],
+              help="Trading symbol (repeat to certify several)")
 @click.option("--exchange", default="BINANCE", help="Exchange name")
 @click.option("--start-date", required=True, help="Start date (YYYY-MM-DD)")
 @click.option("--end-date", required=True, help="End date (YYYY-MM-DD)")
 @click.option("--data-types", multiple=True, help="Required data types")
 @click.option("--staging-path", default="data/staging", help="Staging directory")
 @click.pass_context
-def certify(ctx, symbol, exchange, start_date, end_date, data_types, staging_path):
-    """Generate data readiness certificate for a date range."""
+def certify(ctx, symbols, exchange, start_date, end_date, data_types, staging_path):
+    """Generate data readiness certificates for a date range."""
+    from rlx_datapipe.acquisition.staging_manager import DataStagingManager
 
     # Parse dates
     try:
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        start_day = date.fromisoformat(start_date)
+        end_day = date.fromisoformat(end_date)
     except ValueError as e:
         logger.error(f"❌ Invalid date format: {e}")
         return
@@ -382,56 +589,74 @@ def certify(ctx, symbol, exchange, start_date, end_date, data_types, staging_pat
     if not data_types:
         data_types = ["trades", "book", "book_delta_v2"]
 
-    logger.info(f"📜 Generating readiness certificate for {symbol}")
+    logger.info(f"📜 Generating readiness certificates for {', '.join(symbols)}")
     logger.info(f"Date range: {start_date} to {end_date}")
     logger.info(f"Required data types: {', '.join(data_types)}")
 
     try:
         staging_manager = DataStagingManager(staging_root=Path(staging_path))
 
-        certificate = staging_manager.generate_readiness_certificate(
-            symbol=symbol,
-            exchange=exchange,
-            start_date=start_dt,
-            end_date=end_dt,
-            required_data_types=list(data_types)
-        )
+        # One pass over the manifest serves every symbol
+        ready_index = staging_manager.snapshot_ready_index()
+
+        certificates = {
+            symbol: staging_manager.generate_readiness_certificate(
+                symbol=symbol,
+                exchange=exchange,
+                start_date=start_day.isoformat(),
+                end_date=end_day.isoformat(),
+                required_data_types=list(data_types),
+                ready_index=ready_index,
+                save=False
+            )
+            for symbol in symbols
+        }
+
+        out = []
+        emit = out.append
+
+        for symbol, certificate in certificates.items():
+            # Show certificate summary
+            emit("\n" + "="*60)
+            emit("📜 DATA READINESS CERTIFICATE")
+            emit("="*60)
+            emit(f"Symbol: {certificate['symbol']}")
+            emit(f"Exchange: {certificate['exchange']}")
+            emit(f"Date Range: {certificate['start_date']} to {certificate['end_date']}")
+            emit(f"Generated: {certificate['generated_at']}")
+            emit("")
+
+            emit("Data Type Coverage:")
+            for data_type, info in certificate["summary"].items():
+                emit(f"  {data_type}: {info['file_count']} files ({info['total_size_mb']:.1f} MB)")
+                if info["date_range"]["start"]:
+                    emit(f"    Coverage: {info['date_range']['start']} to {info['date_range']['end']}")
+
+            for issue in certificate["issues"]:
+                emit(f"  ⚠️ {issue}")
+
+            emit("")
+            overall_status = "✅ READY" if certificate["ready"] else "❌ NOT READY"
+            emit(f"Overall Status: {overall_status}")
+
+        if all(certificate["ready"] for certificate in certificates.values()):
+            emit("")
+            emit("🎉 All required data is available!")
+            emit("Epic 1 work can now begin with real data.")
+        else:
+            emit("")
+            emit("⚠️ Some data is missing or incomplete.")
+            emit("Please download missing data before proceeding.")
 
-        # Show certificate summary
-        click.echo("\n" + "="*60)
-        click.echo("📜 DATA READINESS CERTIFICATE")
-        click.echo("="*60)
-        click.echo(f"Symbol: {certificate['symbol']}")
-        click.echo(f"Exchange: {certificate['exchange']}")
-        click.echo(f"Date Range: {certificate['date_range']['start']} to {certificate['date_range']['end']}")
-        click.echo(f"Generated: {certificate['generated_at']}")
-        click.echo()
-
-        click.echo("Data Type Coverage:")
-        for data_type, coverage in certificate["coverage"].items():
-            status = "✅ Complete" if coverage["complete"] else "❌ Incomplete"
-            click.echo(f"  {data_type}: {status}")
-            click.echo(f"    Available: {coverage['available_days']}/{coverage['total_days']} days")
-            if coverage.get("missing_dates"):
-                click.echo(f"    Missing: {', '.join(coverage['missing_dates'][:5])}...")
-
-        click.echo()
-        overall_status = "✅ READY" if certificate["overall_ready"] else "❌ NOT READY"
-        click.echo(f"Overall Status: {overall_status}")
-
-        if certificate["overall_ready"]:
-            click.echo()
-            click.echo("🎉 All required data is available!")
-            click.echo("Epic 1 work can now begin with real data.")
+        click.echo("\n".join(out))
+
+        # Save certificates; a single symbol keeps the per-symbol file name
+        if len(symbols) == 1:
+            cert_path = Path(staging_path) / f"readiness_certificate_{symbols[0]}_{start_date}_{end_date}.json"
+            _write_json(cert_path, certificates[symbols[0]])
         else:
-            click.echo()
-            click.echo("⚠️ Some data is missing or incomplete.")
-            click.echo("Please download missing data before proceeding.")
-
-        # Save certificate
-        cert_path = Path(staging_path) / f"readiness_certificate_{symbol}_{start_date}_{end_date}.json"
-        with open(cert_path, "w") as f:
-            json.dump(certificate, f, indent=2)
+            cert_path = Path(staging_path) / f"readiness_certificates_{start_date}_{end_date}.json"
+            _write_json(cert_path, certificates)
 
         click.echo(f"\nCertificate saved: {cert_path}")
 
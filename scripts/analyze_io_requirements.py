@@ -7,23 +7,101 @@ and document SSD wear calculations (TBW) for hardware planning.
 """
 
 import argparse
-import json
+import functools
+import mmap
 import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
-from dataclasses import asdict, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # Add src to path to import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import numpy as np
+# numpy is imported inside the calculations that need it, keeping
+# --help and argument errors fast
+import orjson
 from loguru import logger
 
 from rlx_datapipe.common.logging import setup_logging
 
+# Random block tiled to build throughput test payloads
+PAYLOAD_PATTERN_BYTES = 4096
+
+# File sizes (MB) measured by --sweep
+SWEEP_BLOCK_SIZES_MB = (1, 4, 16, 64, 256)
+
+# Files written between fsyncs, and files rotated through by the read test;
+# both are raised to the worker count when it is higher
+WRITE_BATCH_FILES = 16
+MIN_READ_FILES = 10
+
+# Free space left untouched on the test filesystem by a sweep step
+FREE_SPACE_MARGIN = 0.1
+
+
+def _test_payload(size: int) -> bytes:
+    """Build a test payload by tiling one block of random bytes.
+
+    Tiling a single ``os.urandom`` block is far cheaper than generating
+    ``size`` random bytes and is still opaque enough to defeat filesystem
+    compression and deduplication.
+
+    Args:
+        size: Payload size in bytes
+
+    Returns:
+        Payload of exactly ``size`` bytes
+    """
+    pattern = os.urandom(PAYLOAD_PATTERN_BYTES)
+    repeats, remainder = divmod(size, PAYLOAD_PATTERN_BYTES)
+    return pattern * repeats + pattern[:remainder]
+
+
+def _throughput_stats(label: str, throughput_samples: list[float]) -> dict[str, float]:
+    """Summarize throughput samples, including the slow tail.
+
+    Percentiles are taken from the low end, so ``p99_mbps`` is the throughput
+    met or exceeded by 99% of samples. SSD garbage collection shows up as a
+    tail that drops well below the median while the mean barely moves.
+
+    Args:
+        label: Test name used in log messages
+        throughput_samples: Per-sample throughput in MB/s
+
+    Returns:
+        Dictionary of sustained (mean), peak and tail percentile throughput
+    """
+    import numpy as np
+
+    samples = np.asarray(throughput_samples)
+    p50, p95, p99, p999 = np.percentile(samples, [50, 5, 1, 0.1])
+
+    stats = {
+        "sustained_mbps": samples.mean(),
+        "peak_mbps": samples.max(),
+        "p50_mbps": p50,
+        "p95_mbps": p95,
+        "p99_mbps": p99,
+        "p999_mbps": p999,
+        "samples": len(samples),
+    }
+
+    logger.info("{} test completed: {} samples", label, len(samples))
+    logger.info(
+        "{} sustained: {:.2f} MB/s, peak: {:.2f} MB/s, p50: {:.2f} MB/s, p95: {:.2f} MB/s, "
+        "p99: {:.2f} MB/s, p99.9: {:.2f} MB/s",
+        label, stats["sustained_mbps"], stats["peak_mbps"], p50, p95, p99, p999,
+    )
+    if p99 < 0.5 * p50:
+        logger.warning("{} p99 throughput is under half the median; likely SSD garbage collection stalls", label)
+
+    return stats
+
 
 @dataclass
 class IORequirements:
@@ -39,6 +117,8 @@ class IORequirements:
     sustained_write_mbps: float = 0.0
     peak_read_mbps: float = 0.0
     peak_write_mbps: float = 0.0
+    read_p99_mbps: float = 0.0
+    write_p99_mbps: float = 0.0
 
     # Hardware requirements
     ssd_tbw_required: float = 0.0
@@ -58,14 +138,24 @@ class IORequirements:
 class IOEnduranceAnalyzer:
     """Analyzes I/O requirements and endurance for 12-month processing."""
 
-    def __init__(self, test_duration_seconds: int = 300):
+    def __init__(
+        self,
+        test_duration_seconds: int = 300,
+        concurrency: int | None = None,
+        test_dir: Path | None = None,
+    ):
         """
         Initialize I/O analyzer.
         
         Args:
             test_duration_seconds: Duration for sustained I/O testing
+            concurrency: Parallel I/O workers for throughput testing
+                (defaults to the assumed CPU core count)
+            test_dir: Directory throughput test files are written under
+                (defaults to the system temp directory, which is often tmpfs)
         """
         self.test_duration_seconds = test_duration_seconds
+        self.test_dir = test_dir
         self.requirements = IORequirements()
 
         # Market data assumptions (based on research)
@@ -95,47 +185,67 @@ class IOEnduranceAnalyzer:
             "parallel_efficiency": 0.7,  # 70% efficiency for parallel processing
         }
 
+        # Test I/O under the same concurrency the pipeline workers will use
+        self.concurrency = concurrency or self.hardware_assumptions["cpu_cores"]
+
+        # Removes the previous throughput test directory in the background
+        self._cleanup_thread: threading.Thread | None = None
+
+    @functools.cached_property
+    def _aggregates(self) -> dict:
+        """Yearly event and byte volumes, computed once and shared by the calculations."""
+        import numpy as np
+
+        assumptions = self.market_data_assumptions
+        symbol_events_per_hour = assumptions["events_per_hour"]
+        hours_per_year = assumptions["hours_per_day"] * assumptions["days_per_year"]
+        bytes_per_event = assumptions["bytes_per_event"]
+        raw_event_bytes = bytes_per_event["raw_delta"]
+        compressed_event_bytes = bytes_per_event["compressed_delta"]
+        unified_event_bytes = bytes_per_event["unified_event"]
+        symbols = list(symbol_events_per_hour)
+
+        # One vector op across all symbols instead of a per-symbol loop
+        events_per_hour = np.fromiter(symbol_events_per_hour.values(), dtype=np.int64, count=len(symbols))
+        events_per_year = events_per_hour * hours_per_year
+        raw_bytes = events_per_year * raw_event_bytes
+        compressed_bytes = events_per_year * compressed_event_bytes
+        unified_bytes = events_per_year * unified_event_bytes
+
+        return {
+            "symbols": symbols,
+            "events_per_year": events_per_year,
+            "raw_bytes": raw_bytes,
+            "compressed_bytes": compressed_bytes,
+            "total_events": int(events_per_year.sum()),
+            "raw_tb": int(raw_bytes.sum()) / 1e12,
+            "compressed_tb": int(compressed_bytes.sum()) / 1e12,
+            "unified_tb": int(unified_bytes.sum()) / 1e12,
+        }
+
     def calculate_data_volumes(self) -> dict[str, float]:
         """Calculate total data volumes for 12-month processing."""
         logger.info("Calculating data volumes for 12-month processing")
 
-        total_events = 0
-        total_raw_bytes = 0
-        total_compressed_bytes = 0
-        total_unified_bytes = 0
-
-        # Calculate for each symbol
-        for symbol, events_per_hour in self.market_data_assumptions["events_per_hour"].items():
-            # Events per year
-            events_per_year = (
-                events_per_hour *
-                self.market_data_assumptions["hours_per_day"] *
-                self.market_data_assumptions["days_per_year"]
+        aggregates = self._aggregates
+        total_events = aggregates["total_events"]
+
+        # Built only if a sink accepts INFO
+        logger.opt(lazy=True).info("{}", lambda: "\n".join(
+            f"{symbol}: {events:,} events/year, {raw / 1e12:.2f}TB raw, {compressed / 1e12:.2f}TB compressed"
+            for symbol, events, raw, compressed in zip(
+                aggregates["symbols"],
+                aggregates["events_per_year"],
+                aggregates["raw_bytes"],
+                aggregates["compressed_bytes"],
+                strict=True,
             )
+        ))
 
-            total_events += events_per_year
-
-            # Raw data volume
-            raw_bytes = events_per_year * self.market_data_assumptions["bytes_per_event"]["raw_delta"]
-            total_raw_bytes += raw_bytes
-
-            # Compressed data volume
-            compressed_bytes = events_per_year * self.market_data_assumptions["bytes_per_event"]["compressed_delta"]
-            total_compressed_bytes += compressed_bytes
-
-            # Unified event volume (output)
-            unified_bytes = events_per_year * self.market_data_assumptions["bytes_per_event"]["unified_event"]
-            total_unified_bytes += unified_bytes
-
-            logger.info(f"{symbol}: {events_per_year:,} events/year, "
-                       f"{raw_bytes / 1e12:.2f}TB raw, "
-                       f"{compressed_bytes / 1e12:.2f}TB compressed")
-
-        # Convert to TB
-        self.requirements.uncompressed_read_volume_tb = total_raw_bytes / 1e12
-        self.requirements.compressed_read_volume_tb = total_compressed_bytes / 1e12
-        self.requirements.total_read_volume_tb = total_compressed_bytes / 1e12  # We read compressed
-        self.requirements.total_write_volume_tb = total_unified_bytes / 1e12
+        self.requirements.uncompressed_read_volume_tb = aggregates["raw_tb"]
+        self.requirements.compressed_read_volume_tb = aggregates["compressed_tb"]
+        self.requirements.total_read_volume_tb = aggregates["compressed_tb"]  # We read compressed
+        self.requirements.total_write_volume_tb = aggregates["unified_tb"]
 
         logger.info(f"Total events: {total_events:,}")
         logger.info(f"Total read volume (compressed): {self.requirements.total_read_volume_tb:.2f}TB")
@@ -148,10 +258,16 @@ class IOEnduranceAnalyzer:
             "uncompressed_read_tb": self.requirements.uncompressed_read_volume_tb,
         }
 
-    def calculate_processing_time(self, total_events: int) -> dict[str, float]:
+    def calculate_processing_time(self, total_events: int | None = None) -> dict[str, float]:
         """Calculate processing time estimates."""
         logger.info("Calculating processing time estimates")
 
+        if total_events is None:
+            total_events = self._aggregates["total_events"]
+
+        hardware = self.hardware_assumptions
+        cpu_cores = hardware["cpu_cores"]
+
         # Assume 100k events/sec throughput (validation target)
         target_throughput_eps = 100_000
 
@@ -162,8 +278,8 @@ class IOEnduranceAnalyzer:
         # Parallel processing time (with efficiency factor)
         parallel_throughput = (
             target_throughput_eps *
-            self.hardware_assumptions["cpu_cores"] *
-            self.hardware_assumptions["parallel_efficiency"]
+            cpu_cores *
+            hardware["parallel_efficiency"]
         )
         parallel_seconds = total_events / parallel_throughput
         parallel_days = parallel_seconds / (24 * 3600)
@@ -172,7 +288,7 @@ class IOEnduranceAnalyzer:
         self.requirements.parallel_processing_days = parallel_days
 
         logger.info(f"Single-threaded processing: {single_thread_days:.1f} days")
-        logger.info(f"Parallel processing ({self.hardware_assumptions['cpu_cores']} cores): {parallel_days:.1f} days")
+        logger.info(f"Parallel processing ({cpu_cores} cores): {parallel_days:.1f} days")
 
         # Check if meets 24-hour processing requirement
         # We need to process 1 month of data in 24 hours, not 12 months
@@ -191,7 +307,8 @@ class IOEnduranceAnalyzer:
         logger.info("Calculating SSD wear and lifetime")
 
         # Total data written (read + write operations)
-        total_written_tb = self.requirements.total_read_volume_tb + self.requirements.total_write_volume_tb
+        aggregates = self._aggregates
+        total_written_tb = aggregates["compressed_tb"] + aggregates["unified_tb"]
 
         # Add overhead for temporary files, checkpoints, etc.
         overhead_factor = 1.5  # 50% overhead
@@ -201,13 +318,14 @@ class IOEnduranceAnalyzer:
 
         # Calculate lifetime
         ssd_tbw_rating = self.hardware_assumptions["ssd_tbw_rating"]
+        ssd_warranty_years = self.hardware_assumptions["ssd_warranty_years"]
         if total_written_with_overhead <= ssd_tbw_rating:
             # If we can do it in one processing run
-            self.requirements.ssd_lifetime_years = self.hardware_assumptions["ssd_warranty_years"]
+            self.requirements.ssd_lifetime_years = ssd_warranty_years
         else:
             # Calculate how many processing runs the SSD can handle
             processing_runs = ssd_tbw_rating / total_written_with_overhead
-            self.requirements.ssd_lifetime_years = processing_runs * self.hardware_assumptions["ssd_warranty_years"]
+            self.requirements.ssd_lifetime_years = processing_runs * ssd_warranty_years
 
         logger.info(f"SSD TBW required: {self.requirements.ssd_tbw_required:.2f}TB")
         logger.info(f"SSD lifetime: {self.requirements.ssd_lifetime_years:.1f} years")
@@ -218,147 +336,266 @@ class IOEnduranceAnalyzer:
             "adequate": self.requirements.ssd_lifetime_years >= 1.0,
         }
 
+    def _test_bytes(self, test_size_mb: int) -> int:
+        """Bytes the write and read test files of one measurement occupy at once."""
+        write_files = max(WRITE_BATCH_FILES, self.concurrency)
+        read_files = max(MIN_READ_FILES, self.concurrency)
+        return (write_files + read_files) * test_size_mb * 1024 * 1024
+
+    def wait_for_cleanup(self) -> None:
+        """Wait until the previous throughput test directory has been removed."""
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join()
+            self._cleanup_thread = None
+
     def measure_sustained_throughput(self, test_size_mb: int = 10) -> dict[str, float]:
         """Measure sustained disk throughput."""
-        logger.info(f"Measuring sustained disk throughput for {self.test_duration_seconds} seconds")
+        logger.info(
+            f"Measuring sustained disk throughput for {self.test_duration_seconds} seconds "
+            f"with {self.concurrency} concurrent workers"
+        )
+
+        # The previous test's deletion must not overlap (and skew) this one
+        self.wait_for_cleanup()
 
         # Create test directory
-        test_dir = Path(tempfile.mkdtemp(prefix="io_endurance_test_"))
+        test_dir = Path(
+            tempfile.mkdtemp(prefix="io_endurance_test_", dir=self.test_dir)
+        )
 
         try:
-            # Measure write throughput
-            write_throughput = self._measure_write_throughput(test_dir, test_size_mb)
-
-            # Measure read throughput
-            read_throughput = self._measure_read_throughput(test_dir, test_size_mb)
+            write_dir = test_dir / "w"
+            read_dir = test_dir / "r"
+            write_dir.mkdir()
+            read_dir.mkdir()
+
+            # Run the write and read tests side by side on separate files, as
+            # a mixed workload, instead of one after the other
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="io-test") as executor:
+                write_future = executor.submit(self._measure_write_throughput, write_dir, test_size_mb)
+                read_future = executor.submit(self._measure_read_throughput, read_dir, test_size_mb)
+                write_throughput = write_future.result()
+                read_throughput = read_future.result()
 
             # Update requirements
             self.requirements.sustained_write_mbps = write_throughput["sustained_mbps"]
             self.requirements.sustained_read_mbps = read_throughput["sustained_mbps"]
             self.requirements.peak_write_mbps = write_throughput["peak_mbps"]
             self.requirements.peak_read_mbps = read_throughput["peak_mbps"]
+            self.requirements.write_p99_mbps = write_throughput["p99_mbps"]
+            self.requirements.read_p99_mbps = read_throughput["p99_mbps"]
 
             # Check if can sustain 150-200 MB/s
             min_required_mbps = 150
 
-            # Use the lower of read/write as the limiting factor
-            limiting_throughput = min(write_throughput["sustained_mbps"], read_throughput["sustained_mbps"])
+            # Use the lower of read/write as the limiting factor, judged on the
+            # throughput 95% of samples reach so GC stalls cannot hide in the mean
+            limiting_throughput = min(write_throughput["p95_mbps"], read_throughput["p95_mbps"])
             self.requirements.can_sustain_150_200_mbps = limiting_throughput >= min_required_mbps
 
             logger.info(f"Sustained write: {write_throughput['sustained_mbps']:.2f} MB/s")
             logger.info(f"Sustained read: {read_throughput['sustained_mbps']:.2f} MB/s")
-            logger.info(f"Limiting throughput: {limiting_throughput:.2f} MB/s")
+            logger.info(f"Limiting throughput (p95): {limiting_throughput:.2f} MB/s")
 
             return {
                 "write_sustained_mbps": write_throughput["sustained_mbps"],
                 "read_sustained_mbps": read_throughput["sustained_mbps"],
                 "write_peak_mbps": write_throughput["peak_mbps"],
                 "read_peak_mbps": read_throughput["peak_mbps"],
+                "write_p99_mbps": write_throughput["p99_mbps"],
+                "read_p99_mbps": read_throughput["p99_mbps"],
                 "limiting_mbps": limiting_throughput,
                 "meets_150_200_mbps": self.requirements.can_sustain_150_200_mbps,
             }
 
         finally:
-            # Clean up test directory
-            shutil.rmtree(test_dir, ignore_errors=True)
-
-    def _measure_write_throughput(self, test_dir: Path, test_size_mb: int) -> dict[str, float]:
-        """Measure write throughput."""
-        logger.info(f"Measuring write throughput with {test_size_mb}MB test size")
-
-        # Create test data
-        test_data = np.random.bytes(test_size_mb * 1024 * 1024)
-
-        throughput_samples = []
-        start_time = time.time()
-
-        file_counter = 0
-        while time.time() - start_time < self.test_duration_seconds:
-            file_path = test_dir / f"test_write_{file_counter}.dat"
-
-            # Measure single write
-            write_start = time.time()
-            with open(file_path, "wb") as f:
-                f.write(test_data)
-                f.flush()
-                os.fsync(f.fileno())  # Force write to disk
-
-            write_time = time.time() - write_start
-            throughput_mbps = test_size_mb / write_time
-            throughput_samples.append(throughput_mbps)
-
-            file_counter += 1
+            # Clean up test directory in the background; the next measurement
+            # waits for it via wait_for_cleanup(), and the thread is not a
+            # daemon, so the interpreter waits for it before exiting
+            self._cleanup_thread = threading.Thread(
+                target=shutil.rmtree,
+                args=(test_dir,),
+                kwargs={"ignore_errors": True},
+                name="io-test-cleanup",
+            )
+            self._cleanup_thread.start()
+
+    def _iter_write_batch(
+        self,
+        test_dir: Path,
+        test_size_mb: int,
+        executor: ThreadPoolExecutor,
+        batch: int = WRITE_BATCH_FILES,
+    ):
+        """Write batches of files with one group commit per batch.
+
+        Each batch writes ``batch`` files concurrently on ``executor`` from a
+        single page-aligned buffer, bypassing the page cache with O_DIRECT
+        where the filesystem allows it, then fsyncs the files and the
+        directory once. File names are reused across batches so disk usage
+        stays bounded.
 
-            # Small delay to prevent overwhelming the system
-            time.sleep(0.1)
+        Args:
+            test_dir: Directory to write into
+            test_size_mb: Size of each file in MB
+            executor: Pool the file writes are submitted to
+            batch: Files written between fsyncs
 
-        # Calculate statistics
-        sustained_mbps = np.mean(throughput_samples)
-        peak_mbps = np.max(throughput_samples)
+        Yields:
+            Nanoseconds taken to write and commit one batch
+        """
+        size = test_size_mb * 1024 * 1024
+        # Anonymous mmap memory is page aligned, as O_DIRECT requires;
+        # fill it once and reuse it for every write
+        buf = mmap.mmap(-1, size)
+        buf.write(_test_payload(size))
+        view = memoryview(buf)
+
+        def write_file(fd: int) -> None:
+            written = 0
+            while written < size:
+                written += os.write(fd, view[written:])
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        direct = getattr(os, "O_DIRECT", 0)
+        dir_fd = os.open(test_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
 
-        logger.info(f"Write test completed: {len(throughput_samples)} samples")
-        logger.info(f"Write sustained: {sustained_mbps:.2f} MB/s, peak: {peak_mbps:.2f} MB/s")
+        try:
+            while True:
+                batch_start_ns = time.perf_counter_ns()
+                fds = []
+                try:
+                    for i in range(batch):
+                        file_path = test_dir / f"test_write_{i}.dat"
+                        try:
+                            fds.append(os.open(file_path, flags | direct))
+                        except OSError:
+                            # e.g. tmpfs rejects O_DIRECT; fall back to buffered writes
+                            logger.debug("O_DIRECT not supported in {}, using buffered writes", test_dir)
+                            direct = 0
+                            fds.append(os.open(file_path, flags))
+
+                    # os.write releases the GIL, so the writes overlap on disk
+                    list(executor.map(write_file, fds))
+
+                    # Group commit: one flush for the whole batch
+                    for fd in fds:
+                        os.fsync(fd)
+                    os.fsync(dir_fd)
+                finally:
+                    for fd in fds:
+                        os.close(fd)
+
+                yield time.perf_counter_ns() - batch_start_ns
+        finally:
+            os.close(dir_fd)
+            view.release()
+            buf.close()
+
+    def _measure_write_throughput(
+        self, test_dir: Path, test_size_mb: int, batch: int = WRITE_BATCH_FILES
+    ) -> dict[str, float]:
+        """Measure aggregate write throughput across concurrent workers."""
+        logger.info(f"Measuring write throughput with {test_size_mb}MB test size")
 
-        return {
-            "sustained_mbps": sustained_mbps,
-            "peak_mbps": peak_mbps,
-            "samples": len(throughput_samples),
-        }
+        batch = max(batch, self.concurrency)
+        batch_mb = batch * test_size_mb
+        throughput_samples = []
+        # Batch times are summed rather than re-reading the clock every batch
+        duration_ns = self.test_duration_seconds * 1_000_000_000
+        elapsed_ns = 0
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            batches = self._iter_write_batch(test_dir, test_size_mb, executor, batch)
+            try:
+                for batch_ns in batches:
+                    throughput_samples.append(batch_mb / (batch_ns * 1e-9))
+                    elapsed_ns += batch_ns
+                    if elapsed_ns >= duration_ns:
+                        break
+            finally:
+                batches.close()
+
+        return _throughput_stats("Write", throughput_samples)
 
     def _measure_read_throughput(self, test_dir: Path, test_size_mb: int) -> dict[str, float]:
-        """Measure read throughput."""
+        """Measure aggregate read throughput across concurrent workers."""
         logger.info(f"Measuring read throughput with {test_size_mb}MB test size")
 
-        # Create test files first
-        test_files = []
-        for i in range(10):  # Create 10 test files
-            file_path = test_dir / f"test_read_{i}.dat"
-            test_data = np.random.bytes(test_size_mb * 1024 * 1024)
-            with open(file_path, "wb") as f:
-                f.write(test_data)
-            test_files.append(file_path)
+        size = test_size_mb * 1024 * 1024
+        fadvise = getattr(os, "posix_fadvise", None)
 
-        # Clear file system cache (Linux)
-        try:
-            os.system("sync")
-            # Note: echo 3 > /proc/sys/vm/drop_caches requires root
-            # We'll just use sync to ensure writes are flushed
-        except:
-            pass
+        test_data = _test_payload(size)
 
+        def create_file(i: int) -> Path:
+            file_path = test_dir / f"test_read_{i}.dat"
+            # Unbuffered: the payload is already one contiguous buffer
+            with open(file_path, "wb", buffering=0) as f:
+                f.write(test_data)
+                os.fsync(f.fileno())
+                if fadvise:
+                    # Evict so the reads below hit the disk
+                    fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            return file_path
+
+        # One page-aligned buffer per worker, as O_DIRECT requires
+        bufs = [mmap.mmap(-1, size) for _ in range(self.concurrency)]
+        direct = getattr(os, "O_DIRECT", 0)
+
+        def read_file(file_path: Path, buf: mmap.mmap) -> None:
+            try:
+                fd = os.open(file_path, os.O_RDONLY | direct)
+            except OSError:
+                # e.g. tmpfs rejects O_DIRECT; fall back to buffered reads
+                fd = os.open(file_path, os.O_RDONLY)
+            try:
+                if fadvise:
+                    fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                with memoryview(buf) as view:
+                    offset = 0
+                    while offset < size:
+                        n = os.preadv(fd, [view[offset:]], offset)
+                        if not n:
+                            break
+                        offset += n
+                if fadvise:
+                    # Keep the file out of the cache for its next turn in the rotation
+                    fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+        batch_mb = self.concurrency * test_size_mb
         throughput_samples = []
-        start_time = time.time()
 
-        file_index = 0
-        while time.time() - start_time < self.test_duration_seconds:
-            file_path = test_files[file_index % len(test_files)]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # Create test files first, in parallel from one payload,
+            # with at least one file per worker
+            num_files = max(MIN_READ_FILES, self.concurrency)
+            test_files = list(executor.map(create_file, range(num_files)))
 
-            # Measure single read
-            read_start = time.time()
-            with open(file_path, "rb") as f:
-                data = f.read()
+            deadline_ns = time.perf_counter_ns() + self.test_duration_seconds * 1_000_000_000
+            read_end_ns = 0
+            file_index = 0
 
-            read_time = time.time() - read_start
-            throughput_mbps = test_size_mb / read_time
-            throughput_samples.append(throughput_mbps)
+            # The end of the previous round doubles as the deadline check
+            while read_end_ns < deadline_ns:
+                # Each worker reads a distinct file
+                paths = [test_files[(file_index + i) % len(test_files)] for i in range(self.concurrency)]
 
-            file_index += 1
+                # Measure one concurrent round of reads
+                read_start_ns = time.perf_counter_ns()
+                list(executor.map(read_file, paths, bufs))
+                read_end_ns = time.perf_counter_ns()
 
-            # Small delay to prevent overwhelming the system
-            time.sleep(0.1)
+                throughput_mbps = batch_mb / ((read_end_ns - read_start_ns) * 1e-9)
+                throughput_samples.append(throughput_mbps)
 
-        # Calculate statistics
-        sustained_mbps = np.mean(throughput_samples)
-        peak_mbps = np.max(throughput_samples)
+                file_index += self.concurrency
 
-        logger.info(f"Read test completed: {len(throughput_samples)} samples")
-        logger.info(f"Read sustained: {sustained_mbps:.2f} MB/s, peak: {peak_mbps:.2f} MB/s")
+        for buf in bufs:
+            buf.close()
 
-        return {
-            "sustained_mbps": sustained_mbps,
-            "peak_mbps": peak_mbps,
-            "samples": len(throughput_samples),
-        }
+        return _throughput_stats("Read", throughput_samples)
 
     def calculate_memory_bandwidth(self) -> dict[str, float]:
         """Calculate memory bandwidth requirements."""
@@ -388,24 +625,79 @@ class IOEnduranceAnalyzer:
             "adequate": required_mbps < available_mbps * 0.5,  # Use <50% of available
         }
 
-    def run_full_analysis(self) -> IORequirements:
-        """Run the complete I/O endurance analysis."""
+    def sweep_block_sizes(self, sizes_mb: tuple[int, ...] = SWEEP_BLOCK_SIZES_MB) -> dict[int, dict[str, float]]:
+        """Measure sustained throughput across a range of file sizes.
+
+        The requirements recorded by the main analysis are left untouched.
+
+        A size whose test files would not fit in the free space of the test
+        filesystem (less a safety margin) is skipped with a warning.
+
+        Args:
+            sizes_mb: File sizes to test, in MB
+
+        Returns:
+            Throughput results keyed by file size in MB, for the sizes measured
+        """
+        logger.info(f"Sweeping throughput across file sizes: {sizes_mb} MB")
+
+        test_root = self.test_dir or Path(tempfile.gettempdir())
+
+        # Measure into scratch requirements so the recorded ones stay as they are
+        requirements = self.requirements
+        self.requirements = IORequirements()
+        sweep = {}
+        try:
+            for size_mb in sizes_mb:
+                # Free space only counts once the previous step's files are gone
+                self.wait_for_cleanup()
+                free_bytes = shutil.disk_usage(test_root).free
+                needed_bytes = self._test_bytes(size_mb)
+                if needed_bytes > free_bytes * (1 - FREE_SPACE_MARGIN):
+                    logger.warning(
+                        f"Skipping {size_mb} MB files: the test needs "
+                        f"{needed_bytes / 1e9:.1f} GB, {free_bytes / 1e9:.1f} GB "
+                        f"free in {test_root}"
+                    )
+                    continue
+                sweep[size_mb] = self.measure_sustained_throughput(test_size_mb=size_mb)
+        finally:
+            self.requirements = requirements
+
+        if not sweep:
+            return sweep
+
+        best_size_mb = max(sweep, key=lambda size_mb: sweep[size_mb]["limiting_mbps"])
+        logger.info(f"Best file size: {best_size_mb} MB ({sweep[best_size_mb]['limiting_mbps']:.2f} MB/s limiting)")
+
+        return sweep
+
+    def run_full_analysis(self, test_size_mb: int = 10) -> IORequirements:
+        """Run the complete I/O endurance analysis.
+
+        Args:
+            test_size_mb: File size used for throughput testing, in MB
+        """
         logger.info("Starting I/O endurance analysis")
 
-        # Calculate data volumes
-        volume_data = self.calculate_data_volumes()
+        # Measure sustained throughput in the background; the calculations
+        # below are independent of it and write disjoint requirement fields
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="io-throughput") as executor:
+            throughput_future = executor.submit(self.measure_sustained_throughput, test_size_mb)
+
+            # Calculate data volumes
+            volume_data = self.calculate_data_volumes()
 
-        # Calculate processing time
-        processing_data = self.calculate_processing_time(volume_data["total_events"])
+            # Calculate processing time
+            processing_data = self.calculate_processing_time(volume_data["total_events"])
 
-        # Calculate SSD wear
-        ssd_data = self.calculate_ssd_wear()
+            # Calculate SSD wear
+            ssd_data = self.calculate_ssd_wear()
 
-        # Measure sustained throughput
-        throughput_data = self.measure_sustained_throughput()
+            # Calculate memory bandwidth
+            memory_data = self.calculate_memory_bandwidth()
 
-        # Calculate memory bandwidth
-        memory_data = self.calculate_memory_bandwidth()
+            throughput_data = throughput_future.result()
 
         # Overall hardware adequacy
         self.requirements.hardware_adequate = (
@@ -425,6 +717,20 @@ def main():
     parser = argparse.ArgumentParser(description="Analyze I/O endurance requirements")
     parser.add_argument("--test-duration", type=int, default=60, help="Duration for I/O testing in seconds")
     parser.add_argument("--test-size", type=int, default=100, help="Test file size in MB")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Parallel I/O workers for throughput testing (default: CPU cores)"
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help=f"Also measure throughput at {', '.join(map(str, SWEEP_BLOCK_SIZES_MB))} MB file sizes",
+    )
+    parser.add_argument(
+        "--test-dir",
+        type=Path,
+        default=None,
+        help="Directory for throughput test files (default: temp dir, often tmpfs)",
+    )
     parser.add_argument("--output", "-o", help="Output JSON file path", default="data/io_analysis/io_requirements.json")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
@@ -439,11 +745,15 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Run analysis
-    analyzer = IOEnduranceAnalyzer(test_duration_seconds=args.test_duration)
+    analyzer = IOEnduranceAnalyzer(
+        test_duration_seconds=args.test_duration,
+        concurrency=args.concurrency,
+        test_dir=args.test_dir,
+    )
 
     try:
         logger.info("Starting I/O endurance analysis")
-        requirements = analyzer.run_full_analysis()
+        requirements = analyzer.run_full_analysis(test_size_mb=args.test_size)
 
         # Save results
         results = {
@@ -451,8 +761,9 @@ def main():
             "test_parameters": {
                 "test_duration_seconds": args.test_duration,
                 "test_size_mb": args.test_size,
+                "concurrency": analyzer.concurrency,
             },
-            "requirements": asdict(requirements),
+            "requirements": requirements,  # orjson serializes dataclasses natively
             "market_data_assumptions": analyzer.market_data_assumptions,
             "hardware_assumptions": analyzer.hardware_assumptions,
             "validation_results": {
@@ -463,8 +774,19 @@ def main():
             }
         }
 
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2, default=str)
+        sweep = analyzer.sweep_block_sizes() if args.sweep else None
+        # The cleanup thread is not a daemon, so an early exit still waits
+        # for it; on success, leave no test files behind once results are in
+        analyzer.wait_for_cleanup()
+        if sweep:
+            results["block_size_sweep"] = sweep
+
+        output_path.write_bytes(
+            orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        )
 
         logger.info(f"Analysis completed. Results saved to {output_path}")
 
@@ -478,6 +800,17 @@ def main():
         print(f"Parallel processing: {requirements.parallel_processing_days:.1f} days")
         print(f"Sustained read: {requirements.sustained_read_mbps:.2f} MB/s")
         print(f"Sustained write: {requirements.sustained_write_mbps:.2f} MB/s")
+        print(f"p99 read: {requirements.read_p99_mbps:.2f} MB/s")
+        print(f"p99 write: {requirements.write_p99_mbps:.2f} MB/s")
+
+        if sweep:
+            print("\n=== FILE SIZE SWEEP ===")
+            for size_mb, throughput in sweep.items():
+                print(
+                    f"{size_mb:>4} MB: write {throughput['write_sustained_mbps']:.2f} MB/s, "
+                    f"read {throughput['read_sustained_mbps']:.2f} MB/s, "
+                    f"limiting (p95) {throughput['limiting_mbps']:.2f} MB/s"
+                )
 
         # Validation results
         print("\n=== VALIDATION RESULTS ===")
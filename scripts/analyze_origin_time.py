@@ -2,7 +2,10 @@
 """CLI script for analyzing origin_time completeness in Crypto Lake data."""
 
 import argparse
+import fnmatch
+import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from loguru import logger
@@ -29,6 +32,31 @@ def parse_date_range(date_range_str: str) -> tuple[str, str]:
         ) from None
 
 
+def _iter_matches(directory: Path, pattern: str) -> Iterator[Path]:
+    """Yield files in directory whose names match pattern.
+
+    Simple name patterns are matched against a single ``os.scandir`` pass,
+    whose entries carry the file type from the directory listing, so no
+    extra ``stat`` is issued per file. Patterns that span directories
+    fall back to ``Path.glob``.
+
+    Args:
+        directory: Directory to search
+        pattern: File pattern to match
+
+    Yields:
+        Matching file paths
+    """
+    if os.sep in pattern or "/" in pattern or "**" in pattern:
+        yield from directory.glob(pattern)
+        return
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                yield Path(entry.path)
+
+
 def collect_files(directory: Path, pattern: str) -> list[Path]:
     """Collect files matching pattern from directory.
 
@@ -43,7 +71,7 @@ def collect_files(directory: Path, pattern: str) -> list[Path]:
         logger.warning(f"Directory not found: {directory}")
         return []
 
-    files = list(directory.glob(pattern))
+    files = list(_iter_matches(directory, pattern))
     logger.info(f"Found {len(files)} files matching pattern '{pattern}' in {directory}")
 
     return files
@@ -57,7 +85,10 @@ def main():
         epilog="""
 Examples:
   # Analyze trades data
-  python analyze_origin_time.py --trades-dir /path/to/trades --trades-pattern "*.csv"
+  python analyze_origin_time.py --trades-dir /path/to/trades
+
+  # Analyze CSV exports instead of Parquet
+  python analyze_origin_time.py --trades-dir /path/to/trades --format csv
 
   # Analyze both trades and book data
   python analyze_origin_time.py --trades-dir /path/to/trades --book-dir /path/to/book
@@ -76,11 +107,17 @@ Examples:
         "--trades-dir", type=Path, help="Directory containing trades data files"
     )
 
+    parser.add_argument(
+        "--format",
+        choices=["parquet", "csv"],
+        default="parquet",
+        help="Input file format, used for the default file patterns (default: parquet)",
+    )
+
     parser.add_argument(
         "--trades-pattern",
         type=str,
-        default="*.csv",
-        help="File pattern for trades data (default: *.csv)",
+        help="File pattern for trades data (default: *.<format>)",
     )
 
     parser.add_argument(
@@ -90,8 +127,7 @@ Examples:
     parser.add_argument(
         "--book-pattern",
         type=str,
-        default="*.csv",
-        help="File pattern for book data (default: *.csv)",
+        help="File pattern for book data (default: *.<format>)",
     )
 
     # Analysis parameters
@@ -144,6 +180,10 @@ Examples:
     if not args.trades_dir and not args.book_dir:
         parser.error("At least one of --trades-dir or --book-dir must be specified")
 
+    default_pattern = f"*.{args.format}"
+    args.trades_pattern = args.trades_pattern or default_pattern
+    args.book_pattern = args.book_pattern or default_pattern
+
     # Collect data files
     trades_files = []
     book_files = []
@@ -2,67 +2,126 @@
 """Simple origin_time analysis for real Crypto Lake data."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Try to import necessary libraries
-try:
-    import pandas as pd
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
-    print("Warning: pandas not available, will use basic analysis")
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+def analyze_parquet_basic(file_path, parquet_file=None):
+    """Basic analysis using pyarrow.
+
+    Has no side effects, so files can be analyzed concurrently; see
+    print_file_analysis for the console output.
+
+    Args:
+        file_path: Path to the Parquet file
+        parquet_file: Already opened ParquetFile for file_path, if any
+
+    Returns:
+        Dictionary with the file's row count and columns, plus origin_time
+        statistics under "origin_time" (None if the column is missing)
+    """
+    # Row count and column names come from the footer; only the
+    # origin_time column is decoded, from pre-buffered (coalesced) reads
+    # on Arrow's thread pool
+    if parquet_file is None:
+        parquet_file = pq.ParquetFile(file_path, pre_buffer=True)
+    column_names = parquet_file.schema_arrow.names
+
+    analysis = {
+        "file_path": file_path,
+        "num_rows": parquet_file.metadata.num_rows,
+        "columns": column_names,
+        "origin_time": None,
+    }
+
+    if "origin_time" in column_names:
+        metadata = parquet_file.metadata
+        column_type = parquet_file.schema_arrow.field("origin_time").type
+        column_index = parquet_file.schema_arrow.get_field_index("origin_time")
+        try:
+            zero = pa.scalar(0, column_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # A non-numeric origin_time (e.g. strings) never equals zero
+            zero = None
+        total_rows = metadata.num_rows
+
+        # Footer statistics give the null count, and rule out zeros in row
+        # groups whose range excludes zero, without decoding the column
+        footer_nulls = 0
+        zero_possible = False
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            if stats is None or not stats.has_null_count:
+                footer_nulls = None
+                break
+            footer_nulls += stats.null_count
+            if zero is None or (stats.has_min_max and not stats.min <= zero.as_py() <= stats.max):
+                continue
+            # num_values counts non-null values
+            if stats.has_min_max or stats.num_values > 0:
+                zero_possible = True
+
+        if footer_nulls is not None and not zero_possible:
+            null_count = footer_nulls
+            zero_count = 0
+            # Decode only as many leading batches as the sample needs
+            chunks = []
+            for batch in parquet_file.iter_batches(batch_size=1024, columns=["origin_time"]):
+                chunks.append(batch.column(0))
+                if sum(len(chunk) - chunk.null_count for chunk in chunks) >= 5:
+                    break
+            col = pa.chunked_array(chunks, type=column_type)
+        else:
+            # Analyze origin_time directly on the Arrow column
+            col = parquet_file.read(columns=["origin_time"], use_threads=True).column("origin_time")
+            null_count = col.null_count
+            zero_count = pc.sum(pc.equal(col, zero)).as_py() or 0
 
-try:
-    import pyarrow.parquet as pq
-    HAS_PYARROW = True
-except ImportError:
-    HAS_PYARROW = False
-    print("Warning: pyarrow not available")
+        if total_rows:
+            null_pct = (null_count / total_rows) * 100
+            zero_pct = (zero_count / total_rows) * 100
+        else:
+            # Percentages are undefined for an empty file
+            null_pct = zero_pct = float("nan")
 
+        analysis["origin_time"] = {
+            "total_rows": total_rows,
+            "null_count": null_count,
+            "zero_count": zero_count,
+            "null_percentage": null_pct,
+            "zero_percentage": zero_pct,
+            "invalid_percentage": null_pct + zero_pct,
+            "sample": col.drop_null().slice(0, 5).to_pylist(),
+        }
 
-def analyze_parquet_basic(file_path):
-    """Basic analysis using pyarrow."""
-    print(f"\nAnalyzing file: {file_path}")
+    return analysis
 
-    if HAS_PYARROW:
-        # Read parquet file
-        table = pq.read_table(file_path)
-        df = table.to_pandas() if HAS_PANDAS else None
 
-        print(f"Total rows: {table.num_rows:,}")
-        print(f"Columns: {table.column_names}")
+def print_file_analysis(analysis):
+    """Print the result of analyze_parquet_basic for one file."""
+    print(f"\nAnalyzing file: {analysis['file_path']}")
+    print(f"Total rows: {analysis['num_rows']:,}")
+    print(f"Columns: {analysis['columns']}")
 
-        if df is not None and "origin_time" in df.columns:
-            # Analyze origin_time
-            total_rows = len(df)
-            null_count = df["origin_time"].isnull().sum()
-            zero_count = (df["origin_time"] == 0).sum()
+    origin_time = analysis["origin_time"]
+    if origin_time is None:
+        return
 
-            null_pct = (null_count / total_rows) * 100
-            zero_pct = (zero_count / total_rows) * 100
-            invalid_pct = null_pct + zero_pct
-
-            print("\nOrigin Time Analysis:")
-            print(f"- Null values: {null_count:,} ({null_pct:.2f}%)")
-            print(f"- Zero values: {zero_count:,} ({zero_pct:.2f}%)")
-            print(f"- Total invalid: {invalid_pct:.2f}%")
-
-            # Check sample values
-            print("\nSample origin_time values:")
-            sample = df["origin_time"].dropna().head(5)
-            for val in sample:
-                print(f"  - {val}")
-
-            return {
-                "total_rows": total_rows,
-                "null_percentage": null_pct,
-                "zero_percentage": zero_pct,
-                "invalid_percentage": invalid_pct
-            }
-    else:
-        print("Cannot analyze parquet file without pyarrow")
-        return None
+    print("\nOrigin Time Analysis:")
+    print(f"- Null values: {origin_time['null_count']:,} ({origin_time['null_percentage']:.2f}%)")
+    print(f"- Zero values: {origin_time['zero_count']:,} ({origin_time['zero_percentage']:.2f}%)")
+    print(f"- Total invalid: {origin_time['invalid_percentage']:.2f}%")
+
+    # Check sample values
+    print("\nSample origin_time values:")
+    for val in origin_time["sample"]:
+        print(f"  - {val}")
 
 
 def main():
@@ -73,16 +132,33 @@ def main():
 
     # Find data files
     data_dir = Path("data/staging/raw")
-    parquet_files = list(data_dir.glob("*.parquet"))
+    parquet_files = []
+    if data_dir.is_dir():
+        with os.scandir(data_dir) as entries:
+            parquet_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".parquet") and entry.is_file()
+            ]
 
     print(f"\nFound {len(parquet_files)} parquet files in {data_dir}")
 
     results = []
-    for file_path in parquet_files:
-        result = analyze_parquet_basic(file_path)
-        if result:
-            result["file"] = file_path.name
-            results.append(result)
+    # Arrow releases the GIL while reading and decoding, so files are
+    # analyzed in parallel, footer reads included. Results are reported in
+    # file order as they arrive, while the pool keeps reading the rest
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for analysis in executor.map(analyze_parquet_basic, parquet_files):
+            print_file_analysis(analysis)
+            origin_time = analysis["origin_time"]
+            # Empty files have nothing to contribute to the summary
+            if origin_time and origin_time["total_rows"]:
+                results.append({
+                    "total_rows": origin_time["total_rows"],
+                    "null_percentage": origin_time["null_percentage"],
+                    "zero_percentage": origin_time["zero_percentage"],
+                    "invalid_percentage": origin_time["invalid_percentage"],
+                    "file": analysis["file_path"].name,
+                })
 
     # Summary
     print("\n" + "=" * 80)
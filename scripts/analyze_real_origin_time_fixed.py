@@ -2,24 +2,64 @@
 """Fixed origin_time analysis for real Crypto Lake data with proper datetime handling."""
 
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import polars as pl
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from loguru import logger
 
 
+# Rows held in memory at once while scanning origin_time
+SCAN_BATCH_SIZE = 1_000_000
+
+# Comparison bounds in the physical int64 domain, computed once per run
+_NOW_NS = time.time_ns()
+_EPOCH_SCALAR = pa.scalar(0, type=pa.int64())
+_NS_PER_UNIT = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+
+
+def _physical_now(column_type):
+    """Return the current time as an int64 in the origin_time column's units.
+
+    Timestamps are compared in their physical int64 domain, where the epoch
+    is simply 0. Integer-encoded columns are taken to hold nanoseconds since
+    the epoch.
+    """
+    if pa.types.is_timestamp(column_type):
+        return _NOW_NS // _NS_PER_UNIT[column_type.unit]
+    return _NOW_NS
+
+
+def _as_int64(column):
+    """View an origin_time array as int64, zero-copy for int64 timestamps."""
+    if column.type == pa.int64():
+        return column
+    if pa.types.is_timestamp(column.type):
+        return column.view(pa.int64())
+    return column.cast(pa.int64())
+
+
+def _as_datetime(value, column_type):
+    """Convert a physical int64 origin_time value to a datetime."""
+    timestamp_type = column_type if pa.types.is_timestamp(column_type) else pa.timestamp("ns")
+    return pa.scalar(value, type=pa.int64()).cast(timestamp_type).as_py()
+
+
 def analyze_origin_time_completeness(file_path: Path):
     """Analyze origin_time completeness in the real data."""
     logger.info(f"🔍 Analyzing {file_path}")
 
-    # Read the data
-    df = pl.read_parquet(file_path)
+    # Row counts and per-row-group statistics come from the footer. Scanned
+    # column chunks are pre-buffered into coalesced reads and decoded on
+    # Arrow's thread pool, at the cost of holding a batch's chunks in memory
+    parquet_file = pq.ParquetFile(file_path, pre_buffer=True)
+    metadata = parquet_file.metadata
 
-    total_rows = len(df)
+    total_rows = metadata.num_rows
     logger.info(f"📊 Total rows: {total_rows:,}")
 
     # Analysis results
@@ -37,21 +77,83 @@ def analyze_origin_time_completeness(file_path: Path):
         "invalid_percentage": 0.0
     }
 
-    if "origin_time" in df.columns:
-        # Check nulls
-        null_count = df.filter(pl.col("origin_time").is_null()).height
+    if "origin_time" in parquet_file.schema_arrow.names:
+        column_index = parquet_file.schema_arrow.get_field_index("origin_time")
+        column_type = parquet_file.schema_arrow.field("origin_time").type
+        # Bounds in the physical int64 domain; the epoch is 0
+        current_time = _physical_now(column_type)
+        now_scalar = pa.scalar(current_time, type=pa.int64())
+
+        null_count = zero_count = future_count = 0
+        mins, maxs = [], []
+        # Row groups that need their data read, keyed by whether the footer
+        # lacks their (min/max range, null count)
+        to_scan = {}
+
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column_index).statistics
+            # Raw statistics are the physical int64 values, no datetime decode
+            has_range = stats is not None and stats.has_min_max and stats.physical_type == "INT64"
+            has_nulls = stats is not None and stats.has_null_count
+
+            if has_nulls:
+                null_count += stats.null_count
+                # num_values counts non-null values; an all-null row group
+                # has nothing else to check
+                if stats.num_values == 0:
+                    continue
+
+            if has_range:
+                mins.append(stats.min_raw)
+                maxs.append(stats.max_raw)
+                # Skip row groups whose statistics rule out any invalid value
+                if has_nulls and stats.min_raw > 0 and stats.max_raw <= current_time:
+                    continue
+
+            to_scan.setdefault((not has_range, not has_nulls), []).append(i)
+
+        if to_scan:
+            # Stream the column in bounded batches, keeping only running totals
+            for (needs_range, needs_nulls), row_groups in to_scan.items():
+                for batch in parquet_file.iter_batches(
+                    batch_size=SCAN_BATCH_SIZE,
+                    row_groups=row_groups,
+                    columns=["origin_time"],
+                    use_threads=True,
+                ):
+                    column = _as_int64(batch.column(0))
+                    if needs_nulls:
+                        null_count += column.null_count
+
+                    # One fused min/max sweep gives the batch range; the
+                    # compare kernels only run when that range reaches a bound
+                    batch_range = pc.min_max(column)
+                    if not batch_range["min"].is_valid:
+                        continue
+                    batch_min = batch_range["min"].as_py()
+                    batch_max = batch_range["max"].as_py()
+                    if batch_min <= 0:
+                        zero_count += pc.sum(pc.equal(column, _EPOCH_SCALAR)).as_py() or 0
+                    if batch_max > current_time:
+                        future_count += pc.sum(pc.greater(column, now_scalar)).as_py() or 0
+
+                    # Only row groups written without statistics need the
+                    # range taken from data
+                    if needs_range:
+                        mins.append(batch_min)
+                        maxs.append(batch_max)
+
+        scanned = sum(len(row_groups) for row_groups in to_scan.values())
+        logger.info(f"Scanned {scanned} of {metadata.num_row_groups} row groups")
+
         results["null_count"] = null_count
         results["null_percentage"] = (null_count / total_rows * 100) if total_rows > 0 else 0
 
-        # Check for epoch zero (1970-01-01)
-        epoch_zero = datetime(1970, 1, 1)
-        zero_count = df.filter(pl.col("origin_time") == epoch_zero).height
+        # Epoch zero (1970-01-01)
         results["zero_count"] = zero_count
         results["zero_percentage"] = (zero_count / total_rows * 100) if total_rows > 0 else 0
 
-        # Check for future dates
-        current_time = datetime.now()
-        future_count = df.filter(pl.col("origin_time") > current_time).height
+        # Future dates
         results["future_count"] = future_count
         results["future_percentage"] = (future_count / total_rows * 100) if total_rows > 0 else 0
 
@@ -59,9 +161,11 @@ def analyze_origin_time_completeness(file_path: Path):
         results["invalid_count"] = null_count + zero_count + future_count
         results["invalid_percentage"] = results["null_percentage"] + results["zero_percentage"] + results["future_percentage"]
 
-        # Get date range
-        min_time = df.select(pl.col("origin_time").min()).item()
-        max_time = df.select(pl.col("origin_time").max()).item()
+        # Get date range, reducing the per-row-group int64 bounds in numpy
+        min_time = max_time = None
+        if mins:
+            min_time = _as_datetime(int(np.fromiter(mins, dtype=np.int64, count=len(mins)).min()), column_type)
+            max_time = _as_datetime(int(np.fromiter(maxs, dtype=np.int64, count=len(maxs)).max()), column_type)
         results["date_range"] = {
             "min": min_time.isoformat() if min_time else None,
             "max": max_time.isoformat() if max_time else None
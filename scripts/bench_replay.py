@@ -8,26 +8,30 @@ memory allocation, GC pressure, and disk write throughput.
 
 import argparse
 import gc
-import json
+import heapq
 import sys
 import time
 import tracemalloc
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
+import numpy as np
+import orjson
 import psutil
 
 # Add src to path to import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 from loguru import logger
 
 from rlx_datapipe.analysis.delta_analyzer import (
     MemoryProfiler,
     ThroughputAnalyzer,
-    create_sample_delta_data,
 )
 from rlx_datapipe.common.logging import setup_logging
 
@@ -62,13 +66,44 @@ class PerformanceMetrics:
         }
 
 
+# Collector thresholds while profiling: young objects are collected far less
+# often than the default (700, 10, 10)
+GC_THRESHOLD = (100_000, 20, 20)
+
+# Memory is sampled (and checked against the limit) once per this many batches
+MEMORY_SAMPLE_INTERVAL = 10
+
+# Parse and order book timings are recorded for one batch in this many
+TIMING_SAMPLE_INTERVAL = 16
+
+# Batches append_to_disk may queue before the caller waits for the writer
+MAX_PENDING_WRITES = 2
+
+# Price increment of the benchmark's sample data (prices are cent-rounded)
+PRICE_TICK_SIZE = 0.01
+
+# Integer side codes used by OrderBookEngine.update_batch
+SIDE_BID = 0
+SIDE_ASK = 1
+
+
 class OrderBookEngine:
     """Simplified order book engine for performance testing."""
 
-    def __init__(self, max_levels: int = 20):
+    __slots__ = ("max_levels", "tick_size", "_inv_tick", "bids", "asks", "update_count", "last_update_id")
+
+    def __init__(self, max_levels: int = 20, tick_size: float | None = None):
+        """
+        Args:
+            max_levels: Price levels kept per side
+            tick_size: If set, levels are keyed by integer ticks of this size
+                instead of float prices, for cheaper hashing and exact matching
+        """
         self.max_levels = max_levels
-        self.bids = {}  # price -> quantity
-        self.asks = {}  # price -> quantity
+        self.tick_size = tick_size
+        self._inv_tick = 1.0 / tick_size if tick_size else None
+        self.bids = {}  # price (or ticks) -> quantity
+        self.asks = {}  # price (or ticks) -> quantity
         self.update_count = 0
         self.last_update_id = 0
 
@@ -80,43 +115,116 @@ class OrderBookEngine:
             True if update was successful, False if sequence gap detected
         """
         # Check for sequence gap
-        if self.last_update_id > 0 and update_id != self.last_update_id + 1:
-            logger.warning(f"Sequence gap detected: expected {self.last_update_id + 1}, got {update_id}")
+        last_update_id = self.last_update_id
+        if last_update_id > 0 and update_id != last_update_id + 1:
+            logger.warning(f"Sequence gap detected: expected {last_update_id + 1}, got {update_id}")
             # Continue processing despite gap for performance testing
 
         self.last_update_id = update_id
 
+        inv_tick = self._inv_tick
+        if inv_tick is not None:
+            price = round(price * inv_tick)
+
         # Update book
-        if side == "bid":
-            if quantity > 0:
-                self.bids[price] = quantity
-            else:
-                self.bids.pop(price, None)
-        elif quantity > 0:
-            self.asks[price] = quantity
+        book = self.bids if side == "bid" else self.asks
+        if quantity > 0:
+            book[price] = quantity
         else:
-            self.asks.pop(price, None)
+            book.pop(price, None)
+
+        # Only the side just updated can have grown past max_levels
+        if len(book) > self.max_levels:
+            self._enforce_max_levels()
+
+        self.update_count += 1
+        return True
+
+    def update_batch(
+        self,
+        prices: np.ndarray,
+        quantities: np.ndarray,
+        sides: np.ndarray,
+        update_ids: np.ndarray,
+    ) -> bool:
+        """
+        Apply a batch of deltas given as parallel arrays.
+
+        Sides are encoded as integers (SIDE_BID/SIDE_ASK) so the batch never
+        touches Python strings. Only the last delta per price and side matters
+        for the final book, so the batch is reduced to its last writer per
+        level before touching the dicts. The max levels constraint is enforced
+        once, at the end of the batch.
+
+        Returns:
+            True if the batch was applied (sequence gaps are logged, not fatal)
+        """
+        if len(update_ids) == 0:
+            return True
+
+        # Check for sequence gaps, including against the previous batch
+        expected = np.empty_like(update_ids)
+        expected[0] = self.last_update_id + 1 if self.last_update_id > 0 else update_ids[0]
+        expected[1:] = update_ids[:-1] + 1
+        gaps = np.flatnonzero(update_ids != expected)
+        if len(gaps):
+            first = gaps[0]
+            logger.warning(
+                f"{len(gaps)} sequence gaps detected in batch, first: "
+                f"expected {expected[first]}, got {update_ids[first]}"
+            )
+            # Continue processing despite gaps for performance testing
+
+        self.last_update_id = int(update_ids[-1])
+
+        if self._inv_tick is not None:
+            prices = np.rint(prices * self._inv_tick).astype(np.int64)
+
+        # Fold the side into the key (bids negated; prices are positive) so a
+        # single unique over the reversed keys finds the last writer per level
+        keys = np.where(sides == SIDE_BID, -prices, prices)
+        unique_keys, reversed_index = np.unique(keys[::-1], return_index=True)
+        last_quantities = quantities[len(keys) - 1 - reversed_index]
 
-        # Maintain max levels constraint
-        if len(self.bids) > self.max_levels:
+        # Unique keys are sorted, so the bids (negative keys) come first
+        split = np.searchsorted(unique_keys, 0)
+        for book, levels, level_quantities in (
+            (self.bids, -unique_keys[:split], last_quantities[:split]),
+            (self.asks, unique_keys[split:], last_quantities[split:]),
+        ):
+            live = level_quantities > 0
+            book.update(zip(levels[live].tolist(), level_quantities[live].tolist()))
+            for price in levels[~live].tolist():
+                book.pop(price, None)
+
+        self._enforce_max_levels()
+
+        self.update_count += len(update_ids)
+        return True
+
+    def _enforce_max_levels(self) -> None:
+        """Drop the levels furthest from the touch beyond max_levels."""
+        # Select only the overflow (usually a single level) instead of
+        # sorting the whole side
+        excess = len(self.bids) - self.max_levels
+        if excess > 0:
             # Remove lowest bids
-            sorted_bids = sorted(self.bids.keys(), reverse=True)
-            for price in sorted_bids[self.max_levels:]:
+            for price in heapq.nsmallest(excess, self.bids):
                 self.bids.pop(price)
 
-        if len(self.asks) > self.max_levels:
+        excess = len(self.asks) - self.max_levels
+        if excess > 0:
             # Remove highest asks
-            sorted_asks = sorted(self.asks.keys())
-            for price in sorted_asks[self.max_levels:]:
+            for price in heapq.nlargest(excess, self.asks):
                 self.asks.pop(price)
 
-        self.update_count += 1
-        return True
-
     def get_best_bid_ask(self) -> tuple[float | None, float | None]:
         """Get best bid and ask prices."""
         best_bid = max(self.bids.keys()) if self.bids else None
         best_ask = min(self.asks.keys()) if self.asks else None
+        if self.tick_size:
+            best_bid = best_bid * self.tick_size if best_bid is not None else None
+            best_ask = best_ask * self.tick_size if best_ask is not None else None
         return best_bid, best_ask
 
     def get_depth(self) -> int:
@@ -127,29 +235,137 @@ class OrderBookEngine:
 class PerformanceHarness:
     """Main performance testing harness."""
 
-    def __init__(self, memory_limit_gb: float = 24.0):
+    def __init__(self, memory_limit_gb: float = 24.0, profile_memory: bool = False):
         self.memory_limit_gb = memory_limit_gb
+        self.profile_memory = profile_memory
         self.process = psutil.Process()
         self.memory_profiler = MemoryProfiler(memory_limit_gb)
         self.throughput_analyzer = ThroughputAnalyzer()
-        self.order_book = OrderBookEngine()
+        self.order_book = OrderBookEngine(tick_size=PRICE_TICK_SIZE)
         self.metrics = PerformanceMetrics()
 
         # Performance tracking
-        self.parse_times = deque(maxlen=10000)
-        self.order_book_update_times = deque(maxlen=10000)
-        self.disk_write_times = deque(maxlen=1000)
+        # Running totals in nanoseconds with their sample counts; parse and
+        # update timings only cover sampled batches (see TIMING_SAMPLE_INTERVAL)
+        self.parse_total_ns = 0
+        self.parse_count = 0
+        self.order_book_update_total_ns = 0
+        self.order_book_update_count = 0
+        self.disk_write_total_ns = 0
+        self.disk_write_count = 0
+        self._time_batch = True
         self.gc_stats_start = None
+        self._gc_threshold = None
+
+        # Persistent writer and its background thread used by append_to_disk,
+        # created on first use
+        self._pq_writer = None
+        self._write_executor = None
+        self._pending_writes = deque()
+
+        # Reusable column buffers for generated batches, allocated on first use
+        self._rng = np.random.default_rng()
+        self._sample_buffers = []
+        self._sample_offsets = np.empty(0, dtype=np.int64)
+        self._sample_index = 0
+        # Background write still reading each buffer set (append_to_disk hands
+        # the writer a zero-copy view), and the set behind the latest batch
+        self._sample_writes = []
+        self._sample_slot = None
+        self._next_update_id = 1
+
+    def _sample_batch(self, num_events: int, batch_size: int) -> pl.DataFrame:
+        """Generate a batch of synthetic deltas into reusable buffers.
+
+        Produces the same columns and value ranges as create_sample_delta_data,
+        but refills preallocated NumPy buffers in place instead of building
+        Python lists, so the generator adds no per-event garbage. Buffers are
+        rotated through a pool, and a set that a queued append_to_disk write
+        still reads is waited on before it is refilled. Update ids carry on
+        from the previous batch, with a few gaps per batch.
+        """
+        if not self._sample_buffers or len(self._sample_offsets) < num_events:
+            self._sample_offsets = np.arange(batch_size, dtype=np.int64)
+            self._sample_buffers = [
+                {
+                    "update_id": np.empty(batch_size, dtype=np.int64),
+                    "origin_time": np.empty(batch_size, dtype=np.int64),
+                    "is_bid": np.empty(batch_size, dtype=np.bool_),
+                    "price": np.empty(batch_size, dtype=np.float64),
+                    "new_quantity": np.empty(batch_size, dtype=np.float64),
+                }
+                for _ in range(MAX_PENDING_WRITES + 1)
+            ]
+            self._sample_writes = [None] * len(self._sample_buffers)
+
+        slot = self._sample_index
+        if self._sample_writes[slot] is not None:
+            self._sample_writes[slot].result()
+            self._sample_writes[slot] = None
+        buffers = {
+            name: buffer[:num_events]
+            for name, buffer in self._sample_buffers[slot].items()
+        }
+        self._sample_slot = slot
+        self._sample_index = (slot + 1) % len(self._sample_buffers)
+
+        # Consecutive update ids with a few gaps, as in the sample data
+        offsets = self._sample_offsets[:num_events]
+        update_id = buffers["update_id"]
+        np.add(offsets, self._next_update_id, out=update_id)
+        if num_events > 100:
+            gap_positions = self._rng.integers(10, num_events - 10, size=min(5, num_events // 100))
+            for pos in gap_positions:
+                update_id[pos:] += self._rng.integers(2, 21)
+        self._next_update_id = int(update_id[-1]) + 1
+
+        origin_time = buffers["origin_time"]
+        np.multiply(offsets, 1_000_000, out=origin_time)
+        origin_time += time.time_ns()
+
+        # Prices within 45000 +/- 1000 at cent precision, quantities in [0, 10)
+        price = buffers["price"]
+        self._rng.random(out=price)
+        np.less(price, 0.5, out=buffers["is_bid"])
+        self._rng.random(out=price)
+        price *= 2000.0
+        price += 44000.0
+        np.round(price, 2, out=price)
+
+        new_quantity = buffers["new_quantity"]
+        self._rng.random(out=new_quantity)
+        new_quantity *= 10.0
+        np.round(new_quantity, 8, out=new_quantity)
+
+        return pl.DataFrame(buffers).select(
+            "update_id",
+            "origin_time",
+            pl.when(pl.col("is_bid")).then(pl.lit("bid")).otherwise(pl.lit("ask")).alias("side"),
+            "price",
+            "new_quantity",
+        )
 
     def start_profiling(self) -> None:
         """Start performance profiling."""
-        tracemalloc.start()
+        # tracemalloc hooks every allocation, so it is opt-in
+        if self.profile_memory:
+            tracemalloc.start()
+
+        # Move everything allocated so far into the permanent generation and
+        # collect young objects less often, so collections during the run
+        # only scan objects created by it
+        gc.collect()
+        gc.freeze()
+        self._gc_threshold = gc.get_threshold()
+        gc.set_threshold(*GC_THRESHOLD)
+
         self.gc_stats_start = gc.get_stats()
         self.throughput_analyzer.start_timing()
         logger.info("Performance profiling started")
 
     def stop_profiling(self) -> None:
         """Stop performance profiling."""
+        self.close_writer()
         self.throughput_analyzer.end_timing()
 
         # Get memory stats
@@ -164,6 +380,12 @@ class PerformanceHarness:
                 self.gc_stats_start, gc_stats_end
             )
 
+        # Restore the collector settings changed by start_profiling
+        if self._gc_threshold is not None:
+            gc.set_threshold(*self._gc_threshold)
+            gc.unfreeze()
+            self._gc_threshold = None
+
         # Get CPU usage
         self.metrics.cpu_usage_percent = self.process.cpu_percent()
 
@@ -172,23 +394,24 @@ class PerformanceHarness:
         self.metrics.throughput_eps = throughput_stats["events_per_second"]
 
         # Calculate parse rate
-        if self.parse_times:
-            total_parse_time = sum(self.parse_times)
-            self.metrics.parse_rate_eps = len(self.parse_times) / total_parse_time if total_parse_time > 0 else 0
+        if self.parse_count:
+            total_parse_time = self.parse_total_ns / 1e9
+            self.metrics.parse_rate_eps = self.parse_count / total_parse_time if total_parse_time > 0 else 0
 
         # Calculate order book update rate
-        if self.order_book_update_times:
-            total_update_time = sum(self.order_book_update_times)
-            self.metrics.order_book_update_rate_eps = len(self.order_book_update_times) / total_update_time if total_update_time > 0 else 0
+        if self.order_book_update_count:
+            total_update_time = self.order_book_update_total_ns / 1e9
+            self.metrics.order_book_update_rate_eps = self.order_book_update_count / total_update_time if total_update_time > 0 else 0
 
         # Calculate disk write throughput
-        if self.disk_write_times:
-            total_write_time = sum(self.disk_write_times)
+        if self.disk_write_count:
+            total_write_time = self.disk_write_total_ns / 1e9
             # Estimate bytes written (rough approximation)
             estimated_bytes = self.metrics.events_processed * 100  # ~100 bytes per event
             self.metrics.disk_write_throughput_mbps = (estimated_bytes / (1024 * 1024)) / total_write_time if total_write_time > 0 else 0
 
-        tracemalloc.stop()
+        if self.profile_memory:
+            tracemalloc.stop()
         logger.info("Performance profiling stopped")
 
     def _calculate_gc_pressure(self, start_stats: list, end_stats: list) -> float:
@@ -210,62 +433,127 @@ class PerformanceHarness:
 
     def parse_events(self, df: pl.DataFrame) -> pl.DataFrame:
         """Parse events from DataFrame."""
-        start_time = time.time()
-
-        # Simulate parsing operations
-        parsed_df = df.with_columns([
-            pl.col("price").cast(pl.Float64),
-            pl.col("new_quantity").cast(pl.Float64).alias("quantity"),
-            pl.col("update_id").cast(pl.Int64)
-        ])
-
-        # Add some computational work to simulate realistic parsing
-        parsed_df = parsed_df.with_columns([
-            (pl.col("price") * pl.col("quantity")).alias("notional"),
-            pl.col("origin_time").cast(pl.Datetime).alias("event_time")
-        ])
+        start_time = time.perf_counter_ns()
+
+        # Simulate parsing operations, plus some computational work to simulate
+        # realistic parsing, as one lazy query collected once
+        parsed_df = (
+            df.lazy()
+            .with_columns([
+                pl.col("price").cast(pl.Float64),
+                pl.col("new_quantity").cast(pl.Float64).alias("quantity"),
+                pl.col("update_id").cast(pl.Int64),
+                # Dictionary-encoded on the way to Parquet
+                pl.col("side").cast(pl.Categorical)
+            ])
+            .with_columns([
+                (pl.col("price") * pl.col("quantity")).alias("notional"),
+                pl.col("origin_time").cast(pl.Datetime).alias("event_time")
+            ])
+            .collect()
+        )
 
-        parse_time = time.time() - start_time
-        self.parse_times.append(parse_time)
+        if self._time_batch:
+            self.parse_total_ns += time.perf_counter_ns() - start_time
+            self.parse_count += 1
 
         return parsed_df
 
     def update_order_book(self, df: pl.DataFrame) -> None:
         """Update order book with events."""
-        start_time = time.time()
-
-        # Convert to list for processing
-        events = df.select(["price", "quantity", "side", "update_id"]).to_dicts()
-
-        for event in events:
-            self.order_book.update(
-                price=event["price"],
-                quantity=event["quantity"],
-                side=event["side"],
-                update_id=event["update_id"]
-            )
+        start_time = time.perf_counter_ns()
+
+        # Hand the batch over as column arrays rather than per-event dicts
+        self.order_book.update_batch(
+            prices=df["price"].to_numpy(),
+            quantities=df["quantity"].to_numpy(),
+            sides=df.select(
+                pl.when(pl.col("side") == "bid").then(SIDE_BID).otherwise(SIDE_ASK).cast(pl.Int8)
+            ).to_series().to_numpy(),
+            update_ids=df["update_id"].to_numpy(),
+        )
 
-        update_time = time.time() - start_time
-        self.order_book_update_times.append(update_time)
+        if self._time_batch:
+            self.order_book_update_total_ns += time.perf_counter_ns() - start_time
+            self.order_book_update_count += 1
 
     def write_to_disk(self, df: pl.DataFrame, output_path: Path) -> None:
         """Write DataFrame to disk."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Write to parquet
-        df.write_parquet(output_path)
+        df.write_parquet(output_path, compression="zstd", statistics=True)
+
+        self.disk_write_total_ns += time.perf_counter_ns() - start_time
+        self.disk_write_count += 1
 
-        write_time = time.time() - start_time
-        self.disk_write_times.append(write_time)
+    def append_to_disk(self, df: pl.DataFrame, output_path: Path) -> None:
+        """Append DataFrame to a single Parquet file as a new row group.
 
-    def run_benchmark(self, num_events: int = 5_000_000, batch_size: int = 100_000) -> PerformanceMetrics:
-        """Run the performance benchmark."""
+        The file is opened on the first call and stays open, so the open and
+        footer write are paid once per run instead of once per batch. Encoding
+        and writing happen on a background thread so the caller can carry on
+        with the next batch; at most MAX_PENDING_WRITES batches are in flight.
+        The file is only readable once close_writer has written the footer.
+        """
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bench-writer")
+
+        # Bound the memory held by queued batches
+        while len(self._pending_writes) >= MAX_PENDING_WRITES:
+            self._pending_writes.popleft().result()
+
+        # to_arrow is zero-copy, so the table may still view the sample
+        # buffers of the latest batch; hold them until it is written
+        future = self._write_executor.submit(self._write_row_group, df.to_arrow(), output_path)
+        self._pending_writes.append(future)
+        if self._sample_slot is not None:
+            self._sample_writes[self._sample_slot] = future
+
+    def _write_row_group(self, table: pa.Table, output_path: Path) -> None:
+        """Write one table to the persistent writer (background thread)."""
+        start_time = time.perf_counter_ns()
+
+        if self._pq_writer is None:
+            self._pq_writer = pq.ParquetWriter(output_path, table.schema, compression="zstd")
+        # One row group per batch rather than splitting it
+        self._pq_writer.write_table(table, row_group_size=len(table))
+
+        self.disk_write_total_ns += time.perf_counter_ns() - start_time
+        self.disk_write_count += 1
+
+    def close_writer(self) -> None:
+        """Wait for queued appends and close the writer, writing the footer."""
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+            pending, self._pending_writes = self._pending_writes, deque()
+            for future in pending:
+                # Re-raise any error from the background writes
+                future.result()
+
+        if self._pq_writer is None:
+            return
+
+        start_time = time.perf_counter_ns()
+        self._pq_writer.close()
+        self._pq_writer = None
+        self.disk_write_total_ns += time.perf_counter_ns() - start_time
+        self.disk_write_count += 1
+
+    def run_benchmark(
+        self,
+        num_events: int = 5_000_000,
+        batch_size: int = 100_000,
+        output_dir: Path = Path("data/benchmark_results")
+    ) -> PerformanceMetrics:
+        """Run the performance benchmark, writing sampled batches to output_dir."""
 
         logger.info(f"Starting benchmark with {num_events} events, batch size {batch_size}")
 
         # Create output directory
-        output_dir = Path("data/benchmark_results")
         output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / "benchmark_events.parquet"
 
         # Start profiling
         self.start_profiling()
@@ -279,11 +567,13 @@ class PerformanceHarness:
                 # Determine batch size for this iteration
                 current_batch_size = min(batch_size, num_events - events_processed)
 
-                # Record memory usage
-                self.memory_profiler.record_memory()
+                # Only time and measure a sample of batches to keep
+                # instrumentation cheap
+                self._time_batch = batch_count % TIMING_SAMPLE_INTERVAL == 0
+                sample_memory = batch_count % MEMORY_SAMPLE_INTERVAL == 0
 
                 # Create sample data batch
-                sample_df = create_sample_delta_data(current_batch_size)
+                sample_df = self._sample_batch(current_batch_size, batch_size)
 
                 # Parse events
                 parsed_df = self.parse_events(sample_df)
@@ -293,8 +583,7 @@ class PerformanceHarness:
 
                 # Write to disk (every 10th batch to avoid too much disk I/O)
                 if batch_count % 10 == 0:
-                    batch_output_path = output_dir / f"batch_{batch_count}.parquet"
-                    self.write_to_disk(parsed_df, batch_output_path)
+                    self.append_to_disk(parsed_df, output_path)
 
                 # Update counters
                 events_processed += current_batch_size
@@ -307,21 +596,19 @@ class PerformanceHarness:
                 if batch_count % 10 == 0:
                     logger.info(f"Processed {events_processed:,} / {num_events:,} events ({events_processed/num_events*100:.1f}%)")
 
-                # Force garbage collection periodically
-                if batch_count % 20 == 0:
-                    gc.collect()
+                # Record memory usage and check memory pressure on a sample
+                # of batches; each reading is a procfs read
+                if sample_memory:
+                    current_memory = self.memory_profiler.record_memory()
+                    if current_memory > self.memory_limit_gb * 0.9:
+                        logger.warning(f"Memory pressure: {current_memory:.2f}GB / {self.memory_limit_gb}GB")
+                        gc.collect()
 
-                # Check memory pressure
-                current_memory = self.process.memory_info().rss / (1024 * 1024 * 1024)
-                if current_memory > self.memory_limit_gb * 0.9:
-                    logger.warning(f"Memory pressure: {current_memory:.2f}GB / {self.memory_limit_gb}GB")
-                    gc.collect()
-
-                    # Check again after GC
-                    current_memory = self.process.memory_info().rss / (1024 * 1024 * 1024)
-                    if current_memory > self.memory_limit_gb * 0.95:
-                        logger.error(f"Critical memory pressure: {current_memory:.2f}GB, stopping benchmark")
-                        break
+                        # Check again after GC
+                        current_memory = self.process.memory_info().rss / (1024 * 1024 * 1024)
+                        if current_memory > self.memory_limit_gb * 0.95:
+                            logger.error(f"Critical memory pressure: {current_memory:.2f}GB, stopping benchmark")
+                            break
 
             self.metrics.events_processed = events_processed
 
@@ -338,6 +625,7 @@ class PerformanceHarness:
             logger.error(f"Benchmark failed: {e}")
             raise
         finally:
+            self._time_batch = True
             # Stop profiling
             self.stop_profiling()
 
@@ -352,6 +640,7 @@ def main():
     parser.add_argument("--output", "-o", help="Output JSON file path", default="data/benchmark_results/performance_results.json")
     parser.add_argument("--memory-limit", type=float, default=24.0, help="Memory limit in GB")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--profile-memory", action="store_true", help="Trace allocations with tracemalloc (slows the run)")
 
     args = parser.parse_args()
 
@@ -364,7 +653,7 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Run benchmark
-    harness = PerformanceHarness(memory_limit_gb=args.memory_limit)
+    harness = PerformanceHarness(memory_limit_gb=args.memory_limit, profile_memory=args.profile_memory)
 
     try:
         logger.info("Starting performance benchmark")
@@ -385,8 +674,9 @@ def main():
             "validation_results": {}
         }
 
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        output_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         logger.info(f"Benchmark completed. Results saved to {output_path}")
 
@@ -435,8 +725,9 @@ def main():
             print("\n❌ VALIDATION FAILED: Performance does not meet requirements")
 
         # Save updated results
-        with open(output_path, "w") as f:
-            json.dump(results, f, indent=2)
+        output_path.write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         return 0 if validation_passed else 1
 
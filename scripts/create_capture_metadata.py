@@ -1,43 +1,38 @@
 #!/usr/bin/env python3
 """Create metadata.json for a capture session."""
-import json
-import subprocess
-import sys
 from pathlib import Path
 
+import orjson
+
+from validate_capture_session import validate_capture_session
+
 
 def create_metadata(capture_dir: Path, market_regime: str, event_details: str = ""):
     """Create metadata.json for the capture session."""
     print(f"Creating metadata for {capture_dir}...")
 
     # Run validation to get statistics
-    result = subprocess.run(
-        [sys.executable, "scripts/validate_capture_session.py", str(capture_dir)],
-        check=False, capture_output=True,
-        text=True
-    )
+    try:
+        session_stats, passed = validate_capture_session(capture_dir)
+    except Exception as e:
+        # An unreadable or empty session still gets metadata, marked as failed
+        print(f"Validation failed: {e}")
+        session_stats, passed = {}, False
 
-    # Parse validation output
-    lines = result.stdout.split("\n")
-    stats = {}
-    for line in lines:
-        if "Total messages:" in line:
-            stats["total_messages"] = int(line.split(":")[1].strip().replace(",", ""))
-        elif "Trade messages:" in line:
-            stats["trade_messages"] = int(line.split(":")[1].strip().replace(",", ""))
-        elif "Depth messages:" in line:
-            stats["depth_messages"] = int(line.split(":")[1].strip().replace(",", ""))
-        elif "Duration:" in line and "hours" in line:
-            stats["duration_hours"] = float(line.split(":")[1].strip().split()[0])
-        elif "Rate:" in line and "msg/sec" in line:
-            stats["messages_per_second"] = float(line.split(":")[1].strip().split()[0])
-        elif "Sequence gaps:" in line and "Session Summary" in result.stdout[:result.stdout.find(line)]:
-            stats["sequence_gaps"] = int(line.split(":")[1].strip())
-        elif "Gap ratio:" in line:
-            stats["gap_ratio_percent"] = float(line.split(":")[1].strip().rstrip("%"))
+    stats = {
+        key: session_stats[key]
+        for key in ("total_messages", "trade_messages", "depth_messages", "duration_hours", "messages_per_second")
+        if key in session_stats
+    }
+    if "gaps_detected" in session_stats:
+        stats["sequence_gaps"] = session_stats["gaps_detected"]
+        if session_stats["total_messages"]:
+            stats["gap_ratio_percent"] = session_stats["gaps_detected"] / session_stats["total_messages"] * 100
 
     # Get capture start and end times from filenames
     files = sorted(capture_dir.glob("*.jsonl.gz"))
+    # Stat each file once; sizes feed both the totals and the file list
+    sizes = {file: file.stat().st_size for file in files}
     if files:
         # Extract timestamp from first file
         first_file = files[0].name
@@ -82,9 +77,9 @@ def create_metadata(capture_dir: Path, market_regime: str, event_details: str =
                 "sequence_gaps": stats.get("sequence_gaps", 0),
                 "gap_ratio_percent": stats.get("gap_ratio_percent", 0),
                 "file_count": len(files),
-                "total_size_mb": sum(f.stat().st_size for f in files) / (1024 * 1024)
+                "total_size_mb": sum(sizes.values()) / (1024 * 1024)
             },
-            "validation_status": "PASSED" if "ALL VALIDATION CRITERIA MET" in result.stdout else "FAILED",
+            "validation_status": "PASSED" if passed else "FAILED",
             "files": []
         }
     }
@@ -93,8 +88,8 @@ def create_metadata(capture_dir: Path, market_regime: str, event_details: str =
     for file in files:
         file_info = {
             "filename": file.name,
-            "size_bytes": file.stat().st_size,
-            "size_mb": file.stat().st_size / (1024 * 1024),
+            "size_bytes": sizes[file],
+            "size_mb": sizes[file] / (1024 * 1024),
             "sha256": checksums.get(file.name, "not calculated")
         }
         metadata["capture_session"]["files"].append(file_info)
@@ -111,8 +106,7 @@ def create_metadata(capture_dir: Path, market_regime: str, event_details: str =
 
     # Write metadata
     output_file = capture_dir / "metadata.json"
-    with open(output_file, "w") as f:
-        json.dump(metadata, f, indent=2)
+    output_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
     print(f"Metadata written to {output_file}")
     print(f"  Total messages: {stats.get('total_messages', 0):,}")
@@ -16,27 +16,36 @@ def inspect_data():
 
     print(f"📁 Inspecting: {data_file}")
 
-    # Read the file
-    df = pl.read_parquet(data_file)
+    # Scan lazily; each query below only reads the columns it needs
+    lf = pl.scan_parquet(data_file)
+    schema = lf.schema
+    num_rows = lf.select(pl.len()).collect().item()
 
-    print(f"\n📊 Data Shape: {df.shape}")
-    print(f"📋 Columns: {df.columns}")
+    print(f"\n📊 Data Shape: {(num_rows, len(schema))}")
+    print(f"📋 Columns: {list(schema)}")
     print("\n🔍 Data Types:")
-    for col, dtype in zip(df.columns, df.dtypes, strict=False):
+    for col, dtype in schema.items():
         print(f"  - {col}: {dtype}")
 
     print("\n📈 First 5 rows of origin_time:")
-    if "origin_time" in df.columns:
-        print(df.select("origin_time").head())
+    if "origin_time" in schema:
+        print(lf.select("origin_time").head().collect())
+
+        # Nulls and range of origin_time in one pass over that column
+        origin_time_stats = lf.select(
+            pl.col("origin_time").null_count().alias("nulls"),
+            pl.col("origin_time").min().alias("min"),
+            pl.col("origin_time").max().alias("max"),
+        ).collect(streaming=True)
 
         # Check for nulls
-        null_count = df.filter(pl.col("origin_time").is_null()).height
+        null_count = origin_time_stats["nulls"].item()
         print(f"\n❓ Null origin_time: {null_count}")
 
         # Get min/max
-        if df.schema["origin_time"] in [pl.Int64, pl.Float64]:
-            min_val = df.select(pl.col("origin_time").min()).item()
-            max_val = df.select(pl.col("origin_time").max()).item()
+        if schema["origin_time"] in [pl.Int64, pl.Float64]:
+            min_val = origin_time_stats["min"].item()
+            max_val = origin_time_stats["max"].item()
             print(f"📅 Min origin_time: {min_val}")
             print(f"📅 Max origin_time: {max_val}")
 
@@ -44,11 +53,11 @@ def inspect_data():
             if min_val and min_val > 1e15:
                 print("\n⏰ Appears to be nanosecond timestamps")
                 # Convert sample to datetime
-                sample_dt = pl.from_epoch(min_val, time_unit="ns")
+                sample_dt = pl.from_epoch(pl.Series([min_val]), time_unit="ns").item()
                 print(f"   Min as datetime: {sample_dt}")
 
     print("\n🔢 Sample of all columns (first 3 rows):")
-    print(df.head(3))
+    print(lf.head(3).collect())
 
 if __name__ == "__main__":
     inspect_data()
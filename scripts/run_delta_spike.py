@@ -22,6 +22,10 @@ from loguru import logger
 
 from rlx_datapipe.common.logging import setup_logging
 
+# Upper bounds (inclusive) of the gap size buckets reported in gaps_by_size
+GAP_SIZE_BREAKS = [10, 100, 1000]
+GAP_SIZE_LABELS = ["1-10", "11-100", "101-1000", "1000+"]
+
 
 class DeltaFeedAnalyzer:
     """Analyzes book_delta_v2 data for sequence gaps and performance metrics."""
@@ -82,61 +86,68 @@ class DeltaFeedAnalyzer:
         logger.info(f"Analyzing file: {file_path}")
 
         try:
-            # Read the file with memory monitoring
-            start_time = time.time()
             self._record_memory_usage()
 
-            # Read with streaming if file is large
             file_size_mb = file_path.stat().st_size / (1024 * 1024)
             logger.info(f"File size: {file_size_mb:.2f} MB")
 
-            if file_size_mb > 1000:  # > 1GB, use streaming
-                return self._analyze_streaming(file_path)
-            return self._analyze_batch(file_path)
+            return self._analyze_lazy(file_path)
 
         except Exception as e:
             logger.error(f"Error analyzing file {file_path}: {e}")
             return {"error": str(e)}
 
-    def _analyze_batch(self, file_path: Path) -> dict:
-        """Analyze file in single batch."""
+    def _analyze_lazy(self, file_path: Path) -> dict:
+        """Analyze file as one lazy query, collected with the streaming engine."""
         start_time = time.time()
 
-        # Load data
-        df = pl.read_parquet(file_path)
-        self._record_memory_usage()
-
-        # Basic validation
-        if df.is_empty():
-            logger.warning(f"File {file_path} is empty")
-            return {"error": "Empty file"}
+        lf = pl.scan_parquet(file_path)
+        schema = lf.schema
 
         # Check for required columns
         required_cols = ["update_id", "origin_time", "side", "price", "new_quantity"]
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in required_cols if col not in schema]
         if missing_cols:
             logger.error(f"Missing required columns: {missing_cols}")
             return {"error": f"Missing columns: {missing_cols}"}
 
-        # Sort by update_id for sequence analysis
-        df = df.sort("update_id")
+        # Sort by update_id for sequence analysis, then reduce every metric to
+        # a single row so nothing but the aggregates is materialised
+        stats = (
+            lf.sort("update_id")
+            .select([
+                pl.len().alias("total_events"),
+                *self._sequence_gap_exprs(),
+                *self._data_quality_exprs(schema),
+            ])
+            .collect(streaming=True)
+            .row(0, named=True)
+        )
         self._record_memory_usage()
 
+        # Basic validation
+        total_events = stats["total_events"]
+        if total_events == 0:
+            logger.warning(f"File {file_path} is empty")
+            return {"error": "Empty file"}
+
+        self.metrics["total_events"] = total_events
+
         # Analyze sequence gaps
-        self._analyze_sequence_gaps(df)
+        self._analyze_sequence_gaps(stats)
 
         # Analyze data quality
-        self._analyze_data_quality(df)
+        self._analyze_data_quality(stats)
 
         # Calculate throughput
         end_time = time.time()
         processing_time = end_time - start_time
-        self.metrics["throughput"]["events_per_second"] = len(df) / processing_time
+        self.metrics["throughput"]["events_per_second"] = total_events / processing_time
 
         # Calculate memory efficiency
         peak_memory_gb = max(self.memory_samples) / (1024 * 1024 * 1024)
         self.metrics["memory_usage"]["peak_gb"] = peak_memory_gb
-        self.metrics["memory_usage"]["events_per_gb"] = len(df) / peak_memory_gb if peak_memory_gb > 0 else 0
+        self.metrics["memory_usage"]["events_per_gb"] = total_events / peak_memory_gb if peak_memory_gb > 0 else 0
 
         # Calculate P95 memory usage
         if len(self.memory_samples) > 0:
@@ -145,152 +156,86 @@ class DeltaFeedAnalyzer:
 
         return self.metrics
 
-    def _analyze_streaming(self, file_path: Path) -> dict:
-        """Analyze file using streaming to handle large files."""
-        logger.info("Using streaming analysis for large file")
-
-        # Use batch reading for large files
-        batch_size = 100000  # 100k records per batch
-        total_events = 0
-        last_update_id = None
-
-        start_time = time.time()
-
-        try:
-            # Read in batches
-            for batch in pl.read_parquet(file_path, batch_size=batch_size):
-                self._record_memory_usage()
-
-                # Process each batch
-                if not batch.is_empty():
-                    batch = batch.sort("update_id")
-
-                    # Analyze sequence gaps within batch
-                    self._analyze_sequence_gaps_batch(batch, last_update_id)
-
-                    # Update counters
-                    total_events += len(batch)
-
-                    # Get last update_id for next batch
-                    last_update_id = batch.select(pl.col("update_id").max()).item()
-
-                # Check memory usage
-                current_memory_gb = self.process.memory_info().rss / (1024 * 1024 * 1024)
-                if current_memory_gb > self.memory_limit_gb * 0.9:
-                    logger.warning(f"Memory usage {current_memory_gb:.2f}GB approaching limit")
-
-        except Exception as e:
-            logger.error(f"Error in streaming analysis: {e}")
-            return {"error": str(e)}
-
-        # Calculate final metrics
-        end_time = time.time()
-        processing_time = end_time - start_time
-        self.metrics["total_events"] = total_events
-        self.metrics["throughput"]["events_per_second"] = total_events / processing_time
-
-        # Calculate memory efficiency
-        peak_memory_gb = max(self.memory_samples) / (1024 * 1024 * 1024)
-        self.metrics["memory_usage"]["peak_gb"] = peak_memory_gb
-        self.metrics["memory_usage"]["events_per_gb"] = total_events / peak_memory_gb if peak_memory_gb > 0 else 0
-
-        return self.metrics
-
-    def _analyze_sequence_gaps(self, df: pl.DataFrame) -> None:
-        """Analyze sequence gaps in update_id column."""
+    def _sequence_gap_exprs(self) -> list[pl.Expr]:
+        """Aggregations over gaps between consecutive (sorted) update_ids."""
+        # Gap size excluding the expected increment of 1
+        gap = pl.col("update_id").diff() - 1
+        gaps = gap.filter(gap > 0)
+
+        bucket_counts = []
+        bounds = zip(
+            GAP_SIZE_LABELS, [0, *GAP_SIZE_BREAKS], [*GAP_SIZE_BREAKS, None], strict=True
+        )
+        for label, lower, upper in bounds:
+            in_bucket = gap > lower if upper is None else gap.is_between(lower, upper, closed="right")
+            bucket_counts.append(in_bucket.sum().alias(f"gaps_{label}"))
+
+        return [
+            (pl.col("update_id").last() - pl.col("update_id").first()).alias("update_id_span"),
+            gaps.len().alias("gap_count"),
+            gaps.max().alias("max_gap"),
+            gaps.mean().alias("mean_gap"),
+            gaps.sum().alias("total_gap"),
+            *bucket_counts,
+        ]
+
+    def _data_quality_exprs(self, schema: dict[str, pl.DataType]) -> list[pl.Expr]:
+        """Counts of valid update_ids, prices and quantities.
+
+        Checks on a non-numeric column are left out rather than failing the
+        whole query; _analyze_data_quality reports them as skipped.
+        """
+        exprs = []
+        # Update IDs should be positive
+        if schema["update_id"].is_numeric():
+            exprs.append((pl.col("update_id") > 0).sum().alias("valid_update_ids"))
+        # Prices should be positive
+        if schema["price"].is_numeric():
+            exprs.append((pl.col("price") > 0).sum().alias("valid_prices"))
+        # Quantities should be >= 0
+        if schema["new_quantity"].is_numeric():
+            exprs.append((pl.col("new_quantity") >= 0).sum().alias("valid_quantities"))
+        return exprs
+
+    def _analyze_sequence_gaps(self, stats: dict) -> None:
+        """Record sequence gap metrics from the aggregated stats."""
         logger.info("Analyzing sequence gaps...")
 
-        # Calculate differences between consecutive update_ids
-        update_ids = df.select("update_id").to_series().to_list()
-
-        if len(update_ids) < 2:
+        if stats["total_events"] < 2:
             logger.warning("Not enough data to analyze sequence gaps")
             return
 
-        gaps = []
-        for i in range(1, len(update_ids)):
-            diff = update_ids[i] - update_ids[i-1]
-            if diff > 1:
-                gaps.append(diff - 1)  # Gap size (excluding the expected increment of 1)
+        gap_count = stats["gap_count"]
+        self.metrics["sequence_gaps"]["count"] = gap_count
 
-        self.metrics["total_events"] = len(df)
-        self.metrics["sequence_gaps"]["count"] = len(gaps)
-
-        if gaps:
-            self.metrics["sequence_gaps"]["max_gap"] = max(gaps)
-            self.metrics["sequence_gaps"]["mean_gap"] = sum(gaps) / len(gaps)
+        if gap_count:
+            self.metrics["sequence_gaps"]["max_gap"] = stats["max_gap"]
+            self.metrics["sequence_gaps"]["mean_gap"] = stats["mean_gap"]
 
             # Calculate gap ratio
-            total_possible_gaps = update_ids[-1] - update_ids[0]
-            actual_gaps = sum(gaps)
-            self.metrics["sequence_gaps"]["gap_ratio_percent"] = (actual_gaps / total_possible_gaps) * 100
+            self.metrics["sequence_gaps"]["gap_ratio_percent"] = (stats["total_gap"] / stats["update_id_span"]) * 100
 
             # Group gaps by size
-            gap_sizes = {}
-            for gap in gaps:
-                size_bucket = self._get_gap_size_bucket(gap)
-                gap_sizes[size_bucket] = gap_sizes.get(size_bucket, 0) + 1
-
-            self.metrics["sequence_gaps"]["gaps_by_size"] = gap_sizes
+            self.metrics["sequence_gaps"]["gaps_by_size"] = {
+                label: stats[f"gaps_{label}"] for label in GAP_SIZE_LABELS if stats[f"gaps_{label}"]
+            }
 
-            logger.info(f"Found {len(gaps)} sequence gaps, max gap: {max(gaps)}, ratio: {self.metrics['sequence_gaps']['gap_ratio_percent']:.4f}%")
+            logger.info(f"Found {gap_count} sequence gaps, max gap: {stats['max_gap']}, ratio: {self.metrics['sequence_gaps']['gap_ratio_percent']:.4f}%")
         else:
             logger.info("No sequence gaps found")
 
-    def _analyze_sequence_gaps_batch(self, batch: pl.DataFrame, last_update_id: int | None) -> None:
-        """Analyze sequence gaps within a batch (for streaming)."""
-        update_ids = batch.select("update_id").to_series().to_list()
-
-        # Check gap from previous batch
-        if last_update_id is not None and len(update_ids) > 0:
-            gap = update_ids[0] - last_update_id
-            if gap > 1:
-                self.metrics["sequence_gaps"]["count"] += 1
-                gap_size = gap - 1
-                self.metrics["sequence_gaps"]["max_gap"] = max(self.metrics["sequence_gaps"]["max_gap"], gap_size)
-
-        # Check gaps within batch
-        for i in range(1, len(update_ids)):
-            diff = update_ids[i] - update_ids[i-1]
-            if diff > 1:
-                self.metrics["sequence_gaps"]["count"] += 1
-                gap_size = diff - 1
-                self.metrics["sequence_gaps"]["max_gap"] = max(self.metrics["sequence_gaps"]["max_gap"], gap_size)
-
-    def _analyze_data_quality(self, df: pl.DataFrame) -> None:
-        """Analyze data quality metrics."""
+    def _analyze_data_quality(self, stats: dict) -> None:
+        """Record data quality metrics from the aggregated stats."""
         logger.info("Analyzing data quality...")
 
-        # Check update_id validity
-        valid_update_ids = df.filter(pl.col("update_id") > 0).height
-        self.metrics["data_quality"]["valid_update_ids"] = valid_update_ids
-        self.metrics["data_quality"]["invalid_update_ids"] = len(df) - valid_update_ids
-
-        # Check price validity (should be positive)
-        try:
-            valid_prices = df.filter(pl.col("price") > 0).height
-            self.metrics["data_quality"]["valid_prices"] = valid_prices
-            self.metrics["data_quality"]["invalid_prices"] = len(df) - valid_prices
-        except Exception as e:
-            logger.warning(f"Error checking price validity: {e}")
-
-        # Check quantity validity (should be >= 0)
-        try:
-            valid_quantities = df.filter(pl.col("new_quantity") >= 0).height
-            self.metrics["data_quality"]["valid_quantities"] = valid_quantities
-            self.metrics["data_quality"]["invalid_quantities"] = len(df) - valid_quantities
-        except Exception as e:
-            logger.warning(f"Error checking quantity validity: {e}")
-
-    def _get_gap_size_bucket(self, gap: int) -> str:
-        """Categorize gaps by size."""
-        if gap <= 10:
-            return "1-10"
-        if gap <= 100:
-            return "11-100"
-        if gap <= 1000:
-            return "101-1000"
-        return "1000+"
+        total_events = stats["total_events"]
+        for field in ("update_ids", "prices", "quantities"):
+            valid = stats.get(f"valid_{field}")
+            if valid is None:
+                logger.warning(f"Could not check {field}: column is not numeric")
+                continue
+            self.metrics["data_quality"][f"valid_{field}"] = valid
+            self.metrics["data_quality"][f"invalid_{field}"] = total_events - valid
 
     def _record_memory_usage(self) -> None:
         """Record current memory usage."""
@@ -13,15 +13,85 @@ import json
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 # Add src to path to import our modules
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import numpy as np
+import orjson
+import polars as pl
+import pyarrow as pa
+import pyarrow.json as paj
 from loguru import logger
 
 from rlx_datapipe.common.logging import setup_logging
 
+# Decompressed chunk size for the line-by-line fallback reader
+READ_BUFFER_SIZE = 1 << 20
+
+# Arrow JSON reader settings: only the stream name and the depth update IDs are
+# parsed, every other field is skipped
+MESSAGE_READ_OPTIONS = paj.ReadOptions(block_size=4 << 20)
+MESSAGE_PARSE_OPTIONS = paj.ParseOptions(
+    explicit_schema=pa.schema([
+        ("stream", pa.string()),
+        ("data", pa.struct([("U", pa.int64()), ("u", pa.int64())]))
+    ]),
+    unexpected_field_behavior="ignore"
+)
+MESSAGE_SCHEMA = {"stream": pl.Utf8, "U": pl.Int64, "u": pl.Int64}
+
+# Upper bounds (inclusive) of the gap size buckets reported in gaps_by_size
+GAP_SIZE_BREAKS = [10, 100, 1000]
+GAP_SIZE_LABELS = ["1-10", "11-100", "101-1000", "1000+"]
+
+
+def _scan_sequence(first_ids: np.ndarray, final_ids: np.ndarray) -> tuple[np.ndarray, int]:
+    """Find sequence gaps in one symbol's depth updates.
+
+    Each update is expected to start right after the previous update's final
+    ID. Updates starting later leave a gap; updates starting earlier are out
+    of order.
+
+    Args:
+        first_ids: First update ID (U) of each update, in arrival order
+        final_ids: Final update ID (u) of each update, in arrival order
+
+    Returns:
+        Tuple of (gap sizes, out-of-order count)
+    """
+    offsets = first_ids[1:] - (final_ids[:-1] + 1)
+    return offsets[offsets > 0], int(np.count_nonzero(offsets < 0))
+
+
+def _iter_lines(file_path: Path) -> Iterator[bytes]:
+    """Yield the lines of a gzip file, stopping cleanly if it was truncated.
+
+    The file is decompressed in large chunks to amortize reads from the gzip
+    stream. A truncated file (e.g. from a capture that was killed or is still
+    being written) yields every complete line before the truncation.
+
+    Args:
+        file_path: Path to a JSONL.gz capture file
+
+    Yields:
+        Each line, without its trailing newline
+    """
+    tail = b""
+    with gzip.open(file_path, "rb") as f:
+        try:
+            while chunk := f.read1(READ_BUFFER_SIZE):
+                lines = (tail + chunk).split(b"\n")
+                tail = lines.pop()
+                yield from lines
+        except (EOFError, OSError) as e:
+            logger.warning(f"Reading {file_path.name} stopped early: {e}")
+            return
+
+    if tail:
+        yield tail
+
 
 class GoldenSampleDeltaValidator:
     """Validates delta feed quality from golden sample captures."""
@@ -83,8 +153,8 @@ class GoldenSampleDeltaValidator:
 
         logger.info(f"Found {len(jsonl_files)} files to analyze")
 
-        # Track sequence IDs per symbol
-        symbol_sequences: Dict[str, Dict[str, Any]] = {}
+        # Valid depth updates of each file, in arrival order
+        depth_frames: List[pl.DataFrame] = []
 
         # Process each file
         for file_path in jsonl_files:
@@ -99,89 +169,61 @@ class GoldenSampleDeltaValidator:
             regime_results["files_analyzed"] += 1
 
             try:
-                with gzip.open(file_path, "rt", encoding="utf-8") as f:
-                    for line_num, line in enumerate(f):
-                        # Process in batches to control memory usage
-                        if line_num > 0 and line_num % 100000 == 0:
-                            logger.debug(f"Processed {line_num:,} lines from {file_path.name}")
-                        try:
-                            msg = json.loads(line.strip())
-                            regime_results["total_messages"] += 1
-
-                            # Extract stream type and data
-                            stream = msg.get("stream", "")
-                            data = msg.get("data", {})
-
-                            # We're interested in depth updates for delta feed analysis
-                            if "@depth" in stream:
-                                regime_results["depth_updates"] += 1
-
-                                # Extract symbol from stream
-                                symbol = stream.split("@")[0]
-
-                                # Get update IDs
-                                first_update_id = data.get("U")
-                                final_update_id = data.get("u")
-
-                                if first_update_id is None or final_update_id is None:
-                                    regime_results["data_quality"]["invalid_updates"] += 1
-                                    continue
-
-                                regime_results["data_quality"]["valid_updates"] += 1
-
-                                # Initialize symbol tracking if needed
-                                if symbol not in symbol_sequences:
-                                    symbol_sequences[symbol] = {
-                                        "last_update_id": None,
-                                        "gaps": []
-                                    }
-
-                                # Check for sequence gaps
-                                last_id = symbol_sequences[symbol]["last_update_id"]
-                                if last_id is not None:
-                                    expected_id = last_id + 1
-
-                                    # Check if there's a gap
-                                    if first_update_id > expected_id:
-                                        gap_size = first_update_id - expected_id
-                                        symbol_sequences[symbol]["gaps"].append(gap_size)
-                                        regime_results["sequence_gaps"]["count"] += 1
-                                        regime_results["sequence_gaps"]["max_gap"] = max(
-                                            regime_results["sequence_gaps"]["max_gap"],
-                                            gap_size
-                                        )
-
-                                        # Categorize gap size
-                                        gap_bucket = self._get_gap_size_bucket(gap_size)
-                                        gaps_by_size = regime_results["sequence_gaps"]["gaps_by_size"]
-                                        gaps_by_size[gap_bucket] = gaps_by_size.get(gap_bucket, 0) + 1
-
-                                    elif first_update_id < expected_id:
-                                        # Out of order update
-                                        regime_results["data_quality"]["out_of_order"] += 1
-
-                                # Update last seen ID
-                                symbol_sequences[symbol]["last_update_id"] = final_update_id
-
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                        except Exception as e:
-                            logger.warning(f"Error processing message at line {line_num}: {e}")
-
+                messages = self._read_messages(file_path)
             except Exception as e:
                 logger.error(f"Error processing file {file_path}: {e}")
+                continue
+
+            regime_results["total_messages"] += messages.height
 
-        # Calculate gap ratio
+            # We're interested in depth updates for delta feed analysis
+            depth = messages.filter(pl.col("stream").str.contains("@depth", literal=True))
+            regime_results["depth_updates"] += depth.height
+
+            valid = depth.drop_nulls(["U", "u"])
+            regime_results["data_quality"]["valid_updates"] += valid.height
+            regime_results["data_quality"]["invalid_updates"] += depth.height - valid.height
+
+            # Extract symbol from stream
+            depth_frames.append(valid.select(
+                pl.col("stream").str.split("@").list.first().alias("symbol"),
+                "U",
+                "u"
+            ))
+
+        # Check sequence gaps per symbol and calculate gap ratio
         total_gap_count = 0
         total_range = 0
+        gaps_by_size = np.zeros(len(GAP_SIZE_LABELS), dtype=np.int64)
+
+        symbol_updates = pl.concat(depth_frames).partition_by("symbol", maintain_order=True) if depth_frames else []
+        for updates in symbol_updates:
+            final_ids = updates["u"].to_numpy()
+            gaps, out_of_order = _scan_sequence(updates["U"].to_numpy(), final_ids)
+            regime_results["data_quality"]["out_of_order"] += out_of_order
+
+            if len(gaps) > 0:
+                regime_results["sequence_gaps"]["count"] += len(gaps)
+                regime_results["sequence_gaps"]["max_gap"] = max(
+                    regime_results["sequence_gaps"]["max_gap"],
+                    int(gaps.max())
+                )
+                total_gap_count += int(gaps.sum())
 
-        for symbol, seq_data in symbol_sequences.items():
-            if seq_data["gaps"]:
-                total_gap_count += sum(seq_data["gaps"])
+                # Categorize gap sizes
+                gaps_by_size += np.bincount(
+                    np.searchsorted(GAP_SIZE_BREAKS, gaps),
+                    minlength=len(GAP_SIZE_LABELS)
+                )
 
-            if seq_data["last_update_id"] is not None:
-                # Estimate the total range
-                total_range += seq_data["last_update_id"]
+            # Estimate the total range
+            total_range += int(final_ids[-1])
+
+        regime_results["sequence_gaps"]["gaps_by_size"] = {
+            label: int(count)
+            for label, count in zip(GAP_SIZE_LABELS, gaps_by_size, strict=True)
+            if count
+        }
 
         if total_range > 0:
             regime_results["sequence_gaps"]["gap_ratio_percent"] = (total_gap_count / total_range) * 100
@@ -197,22 +239,71 @@ class GoldenSampleDeltaValidator:
 
         return regime_results
 
-    def _get_gap_size_bucket(self, gap: int) -> str:
-        """Categorize gaps by size.
-        
+    def _read_messages(self, file_path: Path) -> pl.DataFrame:
+        """Read the stream name and depth update IDs of every message in a file.
+
+        The file is parsed by Arrow's threaded JSON reader. A file it rejects
+        (e.g. one with a malformed line, or a truncated gzip stream from a
+        capture that was killed or is still being written) is re-read line by
+        line instead, so bad lines are skipped rather than failing the whole
+        file.
+
         Args:
-            gap: The gap size to categorize
-            
+            file_path: Path to a JSONL.gz capture file
+
         Returns:
-            String representation of the gap size bucket
+            DataFrame with stream, U and u columns, one row per message
         """
-        if gap <= 10:
-            return "1-10"
-        if gap <= 100:
-            return "11-100"
-        if gap <= 1000:
-            return "101-1000"
-        return "1000+"
+        try:
+            # Arrow rejects an empty file outright; it simply has no messages
+            with pa.input_stream(file_path) as stream:
+                if not stream.read(1):
+                    return pl.DataFrame(schema=MESSAGE_SCHEMA)
+
+            table = paj.read_json(
+                file_path,
+                read_options=MESSAGE_READ_OPTIONS,
+                parse_options=MESSAGE_PARSE_OPTIONS
+            )
+        except (pa.ArrowInvalid, OSError) as e:
+            logger.warning(f"Parsing {file_path.name} line by line: {e}")
+            return self._read_messages_by_line(file_path)
+
+        return pl.from_arrow(table).select(
+            "stream",
+            pl.col("data").struct.field("U"),
+            pl.col("data").struct.field("u")
+        )
+
+    def _read_messages_by_line(self, file_path: Path) -> pl.DataFrame:
+        """Read messages one line at a time, skipping lines that fail to parse."""
+        streams: List[Optional[str]] = []
+        first_ids: List[Optional[int]] = []
+        final_ids: List[Optional[int]] = []
+
+        # Binary lines go straight to orjson, skipping the text-mode UTF-8 decode
+        for line_num, line in enumerate(_iter_lines(file_path)):
+            try:
+                msg = orjson.loads(line)
+                data = msg.get("data") or {}
+                stream = msg.get("stream", "")
+                first_update_id = data.get("U")
+                final_update_id = data.get("u")
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Invalid JSON at line {line_num}: {e}")
+                continue
+            except Exception as e:
+                logger.warning(f"Error processing message at line {line_num}: {e}")
+                continue
+
+            streams.append(stream)
+            first_ids.append(first_update_id)
+            final_ids.append(final_update_id)
+
+        return pl.DataFrame(
+            {"stream": streams, "U": first_ids, "u": final_ids},
+            schema=MESSAGE_SCHEMA
+        )
 
     def validate_all_regimes(self, golden_samples_path: Path) -> None:
         """
@@ -1,11 +1,35 @@
 """Data acquisition module for Crypto Lake API integration."""
 
-from .crypto_lake_client import CryptoLakeClient
-from .crypto_lake_api_client import CryptoLakeAPIClient
-from .data_downloader import DataDownloader
-from .lakeapi_downloader import LakeAPIDownloader
-from .integrity_validator import IntegrityValidator
-from .staging_manager import DataStagingManager
+import importlib
+from typing import TYPE_CHECKING
+
+# Submodules pull in boto3/lakeapi/polars, so exports are imported on first
+# attribute access rather than when the package is imported.
+_EXPORTS = {
+    "CryptoLakeClient": ".crypto_lake_client",
+    "CryptoLakeAPIClient": ".crypto_lake_api_client",
+    "DataDownloader": ".data_downloader",
+    "LakeAPIDownloader": ".lakeapi_downloader",
+    "IntegrityValidator": ".integrity_validator",
+    "DataStagingManager": ".staging_manager",
+}
+
+if TYPE_CHECKING:
+    from .crypto_lake_api_client import CryptoLakeAPIClient
+    from .crypto_lake_client import CryptoLakeClient
+    from .data_downloader import DataDownloader
+    from .integrity_validator import IntegrityValidator
+    from .lakeapi_downloader import LakeAPIDownloader
+    from .staging_manager import DataStagingManager
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CryptoLakeClient",
@@ -14,4 +38,4 @@ __all__ = [
     "LakeAPIDownloader",
     "IntegrityValidator", 
     "DataStagingManager"
-]
\ No newline at end of file
+]
@@ -5,20 +5,32 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import boto3
+import botocore.session
 import lakeapi
+from botocore.config import Config
 from dotenv import load_dotenv
 from loguru import logger
 
+# Region of the lakeapi login and data endpoints
+LAKEAPI_REGION = "eu-west-1"
+
 
 class CryptoLakeAPIClient:
     """Handles data access using the official Crypto Lake API."""
     
-    def __init__(self):
+    def __init__(self, max_pool_connections: int = 10):
         """Initialize Crypto Lake API client.
         
+        Args:
+            max_pool_connections: Default connection pool size of clients
+                created from the session; should cover the number of lakeapi
+                reads running at once
+        
         Raises:
             ValueError: If AWS credentials not found in environment
         """
+        self.max_pool_connections = max_pool_connections
         self._load_credentials()
         self._setup_api()
         
@@ -44,8 +56,20 @@ class CryptoLakeAPIClient:
     def _setup_api(self) -> None:
         """Setup the lakeapi client."""
         try:
-            # Test basic API access
-            # Note: lakeapi handles authentication automatically using AWS credentials
+            # One session for every query, so credentials are resolved once.
+            # Clients created from it default to a pool sized for concurrent
+            # reads; lakeapi's endpoints live in eu-west-1
+            botocore_session = botocore.session.Session()
+            botocore_session.set_default_client_config(
+                Config(max_pool_connections=self.max_pool_connections)
+            )
+            self.boto3_session = boto3.Session(
+                aws_access_key_id=self.aws_access_key_id,
+                aws_secret_access_key=self.aws_secret_access_key,
+                region_name=LAKEAPI_REGION,
+                botocore_session=botocore_session,
+            )
+            
             logger.info("Crypto Lake API client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Crypto Lake API: {e}")
@@ -64,7 +88,8 @@ class CryptoLakeAPIClient:
                 start=datetime.now() - timedelta(days=2),
                 end=datetime.now() - timedelta(days=1),
                 symbols=['BTC-USDT'],
-                exchanges=['BINANCE']
+                exchanges=['BINANCE'],
+                boto3_session=self.boto3_session
             )
             
             logger.info(f"✅ Connection test successful - found {len(test_data)} rows")
@@ -102,7 +127,8 @@ class CryptoLakeAPIClient:
                         start=start_date,
                         end=end_date,
                         symbols=[symbol],
-                        exchanges=[exchange]
+                        exchanges=[exchange],
+                        boto3_session=self.boto3_session
                     )
                     
                     availability[data_type] = {
@@ -178,7 +204,8 @@ class CryptoLakeAPIClient:
                 start=start_date,
                 end=end_date,
                 symbols=[symbol],
-                exchanges=[exchange]
+                exchanges=[exchange],
+                boto3_session=self.boto3_session
             )
             
             if len(data) == 0:
@@ -296,7 +323,8 @@ class CryptoLakeAPIClient:
                 start=start_date,
                 end=sample_end,
                 symbols=[symbol],
-                exchanges=[exchange]
+                exchanges=[exchange],
+                boto3_session=self.boto3_session
             )
             
             if len(sample_data) == 0:
@@ -1,31 +1,57 @@
 """Crypto Lake S3 client for data access."""
 
+import asyncio
 import os
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import boto3
+import polars as pl
 from botocore.exceptions import ClientError, NoCredentialsError
 from dotenv import load_dotenv
 from loguru import logger
 
 
+DATA_TYPES = ('trades', 'book', 'book_delta_v2')
+
+# Local inventory cache shared by CLI invocations
+INVENTORY_CACHE_DIR = Path.home() / ".cache" / "rlx"
+INVENTORY_CACHE_TTL = 3600  # seconds
+
+INVENTORY_SCHEMA = {
+    'key': pl.Utf8,
+    'size': pl.Int64,
+    'last_modified': pl.Datetime('us', 'UTC'),
+    'prefix_used': pl.Utf8,
+    'data_type': pl.Utf8,
+}
+
+
 class CryptoLakeClient:
     """Handles all interactions with Crypto Lake S3 buckets."""
     
-    def __init__(self, region_name: str = "us-east-1", bucket_name: Optional[str] = None):
+    def __init__(self, region_name: str = "us-east-1", bucket_name: Optional[str] = None,
+                 cache_dir: Optional[Path] = INVENTORY_CACHE_DIR,
+                 cache_ttl: float = INVENTORY_CACHE_TTL):
         """Initialize Crypto Lake S3 client.
         
         Args:
             region_name: AWS region for S3 client
             bucket_name: Specific bucket name to use (if known)
+            cache_dir: Directory for the on-disk inventory cache (None disables it)
+            cache_ttl: Age in seconds after which a cached inventory is re-listed
             
         Raises:
             ValueError: If AWS credentials not found in environment
             ClientError: If S3 client creation fails
         """
         self.region_name = region_name
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        self._inventory: Dict[Tuple[str, str], pl.DataFrame] = {}
+        self._inventory_lock = threading.Lock()
         self._load_credentials()
         self.s3_client = self._create_s3_client()
         
@@ -63,6 +89,8 @@ class CryptoLakeClient:
         Raises:
             ClientError: If S3 client creation fails
         """
+        import boto3  # deferred: boto3 adds hundreds of ms to import time
+
         try:
             return boto3.client(
                 's3',
@@ -173,6 +201,10 @@ class CryptoLakeClient:
     def list_available_data(self, symbol: str = 'BTC-USDT', exchange: str = 'binance') -> Dict[str, List[Dict[str, Any]]]:
         """List available data files for a symbol.
         
+        Results are memoized per client and persisted to the on-disk
+        inventory cache, so repeated queries within cache_ttl skip the
+        S3 LIST round-trips.
+        
         Args:
             symbol: Trading pair symbol (e.g., 'BTC-USDT')
             exchange: Exchange name (e.g., 'binance')
@@ -183,6 +215,101 @@ class CryptoLakeClient:
         Raises:
             ClientError: If S3 listing fails
         """
+        df = self.list_inventory_frame(symbol, exchange)
+        return {
+            data_type: df.filter(pl.col('data_type') == data_type).drop('data_type').to_dicts()
+            for data_type in DATA_TYPES
+        }
+        
+    def list_inventory_frame(self, symbol: str = 'BTC-USDT', exchange: str = 'binance') -> pl.DataFrame:
+        """List available data files for a symbol as a columnar inventory.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USDT')
+            exchange: Exchange name (e.g., 'binance')
+            
+        Returns:
+            DataFrame with key, size, last_modified, prefix_used and data_type
+            columns (one row per file and data type)
+            
+        Raises:
+            ClientError: If S3 listing fails
+        """
+        # Concurrent callers wait for a single listing instead of repeating it
+        with self._inventory_lock:
+            cache_key = (symbol, exchange)
+            if cache_key in self._inventory:
+                return self._inventory[cache_key]
+            
+            df = self._load_inventory_cache(symbol, exchange)
+            if df is None:
+                df = self._inventory_to_frame(self._list_available_data_s3(symbol, exchange))
+                self._save_inventory_cache(symbol, exchange, df)
+            
+            self._inventory[cache_key] = df
+            return df
+        
+    @staticmethod
+    def _inventory_to_frame(data: Dict[str, List[Dict[str, Any]]]) -> pl.DataFrame:
+        """Flatten a per-data-type listing into an inventory DataFrame."""
+        rows = [
+            {**file_info, 'data_type': data_type}
+            for data_type, files in data.items()
+            for file_info in files
+        ]
+        return pl.DataFrame(rows, schema=INVENTORY_SCHEMA)
+        
+    def _inventory_cache_path(self, symbol: str, exchange: str) -> Optional[Path]:
+        """Path of the cached inventory for a symbol, or None if caching is disabled."""
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"inventory_{self.bucket_name}_{exchange}_{symbol}.parquet"
+        
+    def _load_inventory_cache(self, symbol: str, exchange: str) -> Optional[pl.DataFrame]:
+        """Load a cached inventory if it is younger than cache_ttl.
+        
+        Returns:
+            Inventory DataFrame, or None on a miss
+        """
+        path = self._inventory_cache_path(symbol, exchange)
+        if path is None or not path.exists():
+            return None
+        
+        age = time.time() - path.stat().st_mtime
+        if age >= self.cache_ttl:
+            logger.debug(f"Inventory cache expired ({age:.0f}s old): {path}")
+            return None
+        
+        try:
+            df = pl.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable inventory cache {path}: {e}")
+            return None
+        
+        # S3 LastModified timestamps are UTC; keep them timezone-aware
+        if getattr(df.schema['last_modified'], 'time_zone', None) is None:
+            df = df.with_columns(pl.col('last_modified').dt.replace_time_zone('UTC'))
+        
+        logger.info(f"Using cached inventory ({age:.0f}s old): {path}")
+        return df
+        
+    def _save_inventory_cache(self, symbol: str, exchange: str, df: pl.DataFrame) -> None:
+        """Persist an inventory listing to the on-disk cache."""
+        path = self._inventory_cache_path(symbol, exchange)
+        # Empty listings usually mean a wrong prefix or bucket; don't pin them
+        if path is None or df.is_empty():
+            return
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            df.write_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write inventory cache {path}: {e}")
+        
+    def _list_available_data_s3(self, symbol: str, exchange: str) -> Dict[str, List[Dict[str, Any]]]:
+        """List available data files for a symbol directly from S3."""
         # Try multiple possible prefix patterns
         prefix_patterns = [
             f"{exchange}/{symbol}/",
@@ -254,56 +381,62 @@ class CryptoLakeClient:
         Returns:
             List of file metadata dictionaries
         """
-        all_data = self.list_available_data(symbol, exchange)
-        files = all_data.get(data_type, [])
-        
-        # Filter by date range (basic implementation - may need refinement based on actual S3 structure)
-        filtered_files = []
-        for file_info in files:
-            key = file_info['key']
-            file_date = self._extract_date_from_key(key)
+        return (
+            self.files_in_date_range_frame(symbol, exchange, data_type, start_date, end_date)
+            .drop('data_type')
+            .to_dicts()
+        )
+        
+    def files_in_date_range_frame(self, symbol: str, exchange: str, data_type: str,
+                                  start_date: datetime, end_date: datetime) -> pl.DataFrame:
+        """Inventory rows for a data type within a date range, sorted by date.
+        
+        Args:
+            symbol: Trading pair symbol
+            exchange: Exchange name
+            data_type: Type of data ('trades', 'book', 'book_delta_v2')
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
             
-            if file_date and start_date <= file_date <= end_date:
-                filtered_files.append(file_info)
+        Returns:
+            Inventory DataFrame filtered to the date range
+        """
+        # Date from the first YYYY-MM-DD in the key, else the first YYYY/MM/DD;
+        # keys with neither (or an invalid date) get null and are dropped
+        file_date = pl.coalesce(
+            pl.col('key').str.extract(r'(\d{4}-\d{2}-\d{2})').str.strptime(pl.Datetime, '%Y-%m-%d', strict=False),
+            pl.col('key').str.extract(r'(\d{4}/\d{2}/\d{2})').str.strptime(pl.Datetime, '%Y/%m/%d', strict=False),
+        )
         
-        # Sort by date
-        filtered_files.sort(key=lambda x: self._extract_date_from_key(x['key']) or datetime.min)
+        return (
+            self.list_inventory_frame(symbol, exchange)
+            .filter(pl.col('data_type') == data_type)
+            .with_columns(file_date.alias('_file_date'))
+            .filter(pl.col('_file_date').is_between(start_date, end_date))
+            .sort('_file_date', maintain_order=True)
+            .drop('_file_date')
+        )
         
-        return filtered_files
+    async def list_files_in_date_range_async(self, symbol: str, exchange: str, data_type: str,
+                                             start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+        """Async variant of list_files_in_date_range.
         
-    def _extract_date_from_key(self, key: str) -> Optional[datetime]:
-        """Extract date from S3 key path.
+        The S3 listing runs in a worker thread (boto3 clients are thread-safe),
+        so listings for several data types can be awaited concurrently.
         
         Args:
-            key: S3 object key
+            symbol: Trading pair symbol
+            exchange: Exchange name
+            data_type: Type of data ('trades', 'book', 'book_delta_v2')
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
             
         Returns:
-            datetime object if date found, None otherwise
+            List of file metadata dictionaries
         """
-        # Try to find date patterns in the key
-        import re
-        
-        # Look for YYYY-MM-DD pattern
-        date_pattern = r'(\d{4})-(\d{2})-(\d{2})'
-        match = re.search(date_pattern, key)
-        if match:
-            year, month, day = match.groups()
-            try:
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
-        
-        # Look for YYYY/MM/DD pattern
-        date_pattern = r'(\d{4})/(\d{2})/(\d{2})'
-        match = re.search(date_pattern, key)
-        if match:
-            year, month, day = match.groups()
-            try:
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
-                
-        return None
+        return await asyncio.to_thread(
+            self.list_files_in_date_range, symbol, exchange, data_type, start_date, end_date
+        )
         
     def get_file_info(self, key: str) -> Dict[str, Any]:
         """Get metadata for a specific S3 object.
@@ -1,7 +1,6 @@
 """Data downloader for Crypto Lake S3 files."""
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -142,7 +141,8 @@ class DataDownloader:
                                  exchange: str, 
                                  data_type: str,
                                  start_date: datetime,
-                                 end_date: datetime) -> Tuple[List[Path], List[Dict[str, Any]]]:
+                                 end_date: datetime,
+                                 semaphore: Optional[asyncio.Semaphore] = None) -> Tuple[List[Path], List[Dict[str, Any]]]:
         """Download data for a date range with concurrent processing.
         
         Args:
@@ -151,6 +151,8 @@ class DataDownloader:
             data_type: Data type ('trades', 'book', 'book_delta_v2')
             start_date: Start date (inclusive)
             end_date: End date (inclusive)
+            semaphore: Optional semaphore shared with other downloads to bound
+                total concurrency (defaults to one of size max_concurrent)
             
         Returns:
             Tuple of (successful_downloads, failed_downloads)
@@ -158,7 +160,7 @@ class DataDownloader:
         # Get list of files to download
         logger.info(f"Finding files for {symbol} {data_type} from {start_date.date()} to {end_date.date()}")
         
-        files = self.client.list_files_in_date_range(
+        files = await self.client.list_files_in_date_range_async(
             symbol, exchange, data_type, start_date, end_date
         )
         
@@ -177,11 +179,13 @@ class DataDownloader:
             chunks.append(DownloadChunk(key, local_path, size))
         
         # Update stats
-        self.stats['total_files'] = len(chunks)
-        self.stats['start_time'] = time.time()
+        self.stats['total_files'] += len(chunks)
+        if self.stats['start_time'] is None:
+            self.stats['start_time'] = time.time()
         
         # Download with concurrency control
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
         
         async def download_chunk(chunk: DownloadChunk) -> Optional[Path]:
             async with semaphore:
@@ -196,7 +200,7 @@ class DataDownloader:
         successful = []
         failed = []
         
-        for chunk, result in zip(chunks, results):
+        for chunk, result in zip(chunks, results, strict=True):
             if isinstance(result, Exception):
                 failed.append({
                     'key': chunk.key,
@@ -232,15 +236,12 @@ class DataDownloader:
         chunk.start_time = time.time()
         
         try:
-            # Run synchronous download in thread pool
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor() as executor:
-                result = await loop.run_in_executor(
-                    executor,
-                    self.download_file,
-                    chunk.key,
-                    chunk.local_path
-                )
+            # Run synchronous download in the default thread pool
+            result = await asyncio.to_thread(
+                self.download_file,
+                chunk.key,
+                chunk.local_path
+            )
             
             chunk.status = 'completed'
             chunk.end_time = time.time()
@@ -253,6 +254,50 @@ class DataDownloader:
             logger.error(f"Chunk download failed: {chunk.key} - {e}")
             return None
             
+    async def download_batch_async(self,
+                                   symbol: str,
+                                   exchange: str,
+                                   data_types: List[str],
+                                   start_date: datetime,
+                                   end_date: datetime) -> Dict[str, Tuple[List[Path], List[Dict[str, Any]]]]:
+        """Download multiple data types concurrently for a date range.
+        
+        All data types share one semaphore, so at most max_concurrent GETs
+        are in flight across the whole batch.
+        
+        Args:
+            symbol: Trading pair symbol
+            exchange: Exchange name
+            data_types: List of data types to download
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Dictionary mapping data type to (successful, failed) downloads
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        logger.info(f"Downloading {', '.join(data_types)} data")
+        outcomes = await asyncio.gather(
+            *(
+                self.download_date_range(
+                    symbol, exchange, data_type, start_date, end_date, semaphore
+                )
+                for data_type in data_types
+            ),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for data_type, outcome in zip(data_types, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to download {data_type}: {outcome}")
+                results[data_type] = ([], [{'key': 'all', 'error': str(outcome), 'retries': 0}])
+            else:
+                results[data_type] = outcome
+        
+        return results
+        
     def download_batch(self, 
                       symbol: str,
                       exchange: str,
@@ -271,24 +316,9 @@ class DataDownloader:
         Returns:
             Dictionary mapping data type to (successful, failed) downloads
         """
-        results = {}
-        
-        for data_type in data_types:
-            logger.info(f"\n=== Downloading {data_type} data ===")
-            
-            try:
-                successful, failed = asyncio.run(
-                    self.download_date_range(
-                        symbol, exchange, data_type, start_date, end_date
-                    )
-                )
-                results[data_type] = (successful, failed)
-                
-            except Exception as e:
-                logger.error(f"Failed to download {data_type}: {e}")
-                results[data_type] = ([], [{'key': 'all', 'error': str(e), 'retries': 0}])
-        
-        return results
+        return asyncio.run(
+            self.download_batch_async(symbol, exchange, data_types, start_date, end_date)
+        )
         
     def get_download_summary(self) -> Dict[str, Any]:
         """Get download statistics summary.
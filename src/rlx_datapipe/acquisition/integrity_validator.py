@@ -47,6 +47,13 @@ class IntegrityValidator:
             }
         }
         
+        # Columns read by the quality checks, resolved once per data type
+        # and reused for every file
+        self._checked_columns = {
+            data_type: self._quality_columns(data_type)
+            for data_type in self.expected_schemas
+        }
+        
     def validate_file(self, 
                      file_path: Path, 
                      data_type: str,
@@ -91,11 +98,22 @@ class IntegrityValidator:
         
         # Level 2: File format validation
         try:
-            df = pl.read_parquet(file_path)
+            # Schema comes from the footer; only the columns the quality
+            # checks inspect are decoded (bids/asks lists are never read).
+            columns = list(pl.read_parquet_schema(file_path))
+            checked = self._columns_to_check(columns, data_type)
+            if checked:
+                df = pl.read_parquet(file_path, columns=checked)
+                row_count = len(df)
+            else:
+                # Nothing for the quality checks to inspect: count rows from
+                # the footer instead of decoding every column
+                df = None
+                row_count = pl.scan_parquet(file_path).select(pl.len()).collect().item()
             checks['readable'] = True
-            metadata['row_count'] = len(df)
-            metadata['column_count'] = len(df.columns)
-            metadata['columns'] = df.columns
+            metadata['row_count'] = row_count
+            metadata['column_count'] = len(columns)
+            metadata['columns'] = columns
             
         except Exception as e:
             checks['readable'] = False
@@ -104,7 +122,7 @@ class IntegrityValidator:
         
         # Level 3: Schema validation
         if data_type in self.expected_schemas:
-            schema_result = self._validate_schema(df, data_type)
+            schema_result = self._validate_schema(columns, data_type)
             checks.update(schema_result['checks'])
             errors.extend(schema_result['errors'])
             warnings.extend(schema_result['warnings'])
@@ -113,12 +131,15 @@ class IntegrityValidator:
             warnings.append(f"Unknown data type: {data_type}")
         
         # Level 4: Data quality validation
-        if checks.get('readable', False):
+        if df is not None:
             quality_result = self._validate_data_quality(df, data_type)
             checks.update(quality_result['checks'])
             errors.extend(quality_result['errors'])
             warnings.extend(quality_result['warnings'])
             metadata.update(quality_result['metadata'])
+        elif row_count == 0:
+            # Without checked columns only the emptiness check applies
+            errors.append("DataFrame is empty")
         
         # Overall pass/fail
         passed = len(errors) == 0
@@ -141,11 +162,37 @@ class IntegrityValidator:
                 hash_func.update(chunk)
         return hash_func.hexdigest()
     
-    def _validate_schema(self, df: pl.DataFrame, data_type: str) -> Dict[str, Any]:
-        """Validate DataFrame schema.
+    def _quality_columns(self, data_type: str) -> Set[str]:
+        """Columns inspected by the data quality checks for a data type."""
+        schema = self.expected_schemas[data_type]
+        needed = {'origin_time', *schema['numeric_columns'], *schema['positive_columns']}
+        if data_type == 'trades':
+            needed.add('side')
+        elif data_type == 'book_delta_v2':
+            needed.add('update_id')
+        return needed
+    
+    def _columns_to_check(self, columns: List[str], data_type: str) -> List[str]:
+        """Select the file columns needed by the data quality checks.
         
         Args:
-            df: DataFrame to validate
+            columns: Column names present in the file
+            data_type: Data type being validated
+            
+        Returns:
+            Columns to read, in file order (empty if the type is unknown)
+        """
+        needed = self._checked_columns.get(data_type)
+        if needed is None:
+            return []
+        
+        return [col for col in columns if col in needed]
+    
+    def _validate_schema(self, columns: List[str], data_type: str) -> Dict[str, Any]:
+        """Validate file schema.
+        
+        Args:
+            columns: Column names present in the file
             data_type: Expected data type
             
         Returns:
@@ -161,14 +208,14 @@ class IntegrityValidator:
         optional_cols = schema.get('optional_columns', [])
         
         # Check required columns
-        missing_required = set(required_cols) - set(df.columns)
+        missing_required = set(required_cols) - set(columns)
         checks['has_required_columns'] = len(missing_required) == 0
         if missing_required:
             errors.append(f"Missing required columns: {missing_required}")
         
         # Check for unexpected columns
         expected_cols = set(required_cols + optional_cols)
-        unexpected_cols = set(df.columns) - expected_cols
+        unexpected_cols = set(columns) - expected_cols
         if unexpected_cols:
             warnings.append(f"Unexpected columns found: {unexpected_cols}")
         
@@ -325,15 +372,11 @@ class IntegrityValidator:
         if null_count > 0:
             warnings.append(f"Found {null_count} null values")
         
-        # Check if actually numeric
-        try:
-            # Try basic numeric operations
-            col.min()
-            col.max()
-            checks['is_numeric'] = True
-        except Exception:
-            checks['is_numeric'] = False
-            errors.append("Column is not numeric")
+        # Check if actually numeric; the Parquet schema types the column,
+        # so no pass over the values is needed
+        checks['is_numeric'] = col.dtype.is_numeric()
+        if not checks['is_numeric']:
+            errors.append(f"Column is not numeric ({col.dtype})")
         
         return {
             'checks': checks,
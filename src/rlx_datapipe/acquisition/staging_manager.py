@@ -1,16 +1,20 @@
 """Data staging area management for the acquisition pipeline."""
 
+from __future__ import annotations
+
+import bisect
 import json
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from loguru import logger
 
-from .integrity_validator import ValidationResult
+if TYPE_CHECKING:
+    from .integrity_validator import ValidationResult
 
 
 class FileStatus(Enum):
@@ -351,6 +355,25 @@ class DataStagingManager:
         
         return ready_files
     
+    def snapshot_ready_index(self) -> Dict[Tuple[str, str], List[FileManifest]]:
+        """Index ready files by (symbol, data_type) in one manifest pass.
+        
+        Certifying several symbols against the snapshot avoids rescanning
+        the manifest for every symbol and data type.
+        
+        Returns:
+            Dictionary mapping (symbol, data_type) to date-sorted FileManifest lists
+        """
+        index: Dict[Tuple[str, str], List[FileManifest]] = {}
+        for manifest in self.manifest.values():
+            if manifest.status == FileStatus.READY:
+                index.setdefault((manifest.symbol, manifest.data_type), []).append(manifest)
+        
+        for files in index.values():
+            files.sort(key=lambda f: f.date)
+        
+        return index
+    
     def get_staging_summary(self) -> Dict[str, Any]:
         """Get summary of staging area status.
         
@@ -393,7 +416,9 @@ class DataStagingManager:
                                      exchange: str,
                                      start_date: str,
                                      end_date: str,
-                                     required_data_types: List[str]) -> Dict[str, Any]:
+                                     required_data_types: List[str],
+                                     ready_index: Optional[Dict[Tuple[str, str], List[FileManifest]]] = None,
+                                     save: bool = True) -> Dict[str, Any]:
         """Generate data readiness certificate.
         
         Args:
@@ -402,6 +427,9 @@ class DataStagingManager:
             start_date: Start date (ISO format)
             end_date: End date (ISO format)  
             required_data_types: List of required data types
+            ready_index: Optional snapshot from snapshot_ready_index() to
+                look files up in instead of scanning the manifest
+            save: Whether to write the certificate to the staging root
             
         Returns:
             Readiness certificate dictionary
@@ -421,12 +449,17 @@ class DataStagingManager:
         # Check each required data type
         type_status = {}
         for data_type in required_data_types:
-            ready_files = self.get_ready_files(
-                data_type=data_type,
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date
-            )
+            if ready_index is not None:
+                files = ready_index.get((symbol, data_type), [])
+                dates = [f.date for f in files]
+                ready_files = files[bisect.bisect_left(dates, start_date):bisect.bisect_right(dates, end_date)]
+            else:
+                ready_files = self.get_ready_files(
+                    data_type=data_type,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date
+                )
             
             type_status[data_type] = {
                 'file_count': len(ready_files),
@@ -449,11 +482,12 @@ class DataStagingManager:
         certificate['ready'] = len(certificate['issues']) == 0
         
         # Save certificate
-        cert_file = self.staging_root / f"readiness_certificate_{symbol}_{start_date}_{end_date}.json"
-        with open(cert_file, 'w') as f:
-            json.dump(certificate, f, indent=2)
-        
-        logger.info(f"Generated readiness certificate: {cert_file}")
+        if save:
+            cert_file = self.staging_root / f"readiness_certificate_{symbol}_{start_date}_{end_date}.json"
+            with open(cert_file, 'w') as f:
+                json.dump(certificate, f, indent=2)
+            
+            logger.info(f"Generated readiness certificate: {cert_file}")
         
         if certificate['ready']:
             logger.info(f"✅ Data is READY for {symbol} from {start_date} to {end_date}")
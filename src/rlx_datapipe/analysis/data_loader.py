@@ -6,10 +6,64 @@ import polars as pl
 from loguru import logger
 
 
+def _scan_projected(
+    file_path: Path,
+    columns: list[str] | None,
+    symbol: str | None,
+    date_filter: tuple[str, str] | None,
+) -> pl.DataFrame:
+    """Lazily scan a file, reading only the requested columns.
+
+    Filters are pushed into the scan, so for Parquet only the column chunks
+    needed for filtering and the projection are read from disk, and row groups
+    whose statistics exclude the filters are skipped.
+
+    Args:
+        file_path: Path to the data file (CSV or Parquet)
+        columns: Columns to return; those absent from the file are skipped.
+            All columns are returned if omitted
+        symbol: Trading symbol to filter for
+        date_filter: Optional tuple of (start_date, end_date) in YYYY-MM-DD format
+
+    Returns:
+        Polars DataFrame with the projected columns
+
+    Raises:
+        ValueError: If the file format is unsupported
+    """
+    if file_path.suffix.lower() == ".csv":
+        lf = pl.scan_csv(file_path)
+    elif file_path.suffix.lower() == ".parquet":
+        lf = pl.scan_parquet(file_path)
+    else:
+        raise ValueError(f"Unsupported file format: {file_path.suffix}")
+
+    schema = lf.schema
+
+    if symbol and "symbol" in schema:
+        lf = lf.filter(pl.col("symbol") == symbol)
+
+    if date_filter and "origin_time" in schema:
+        start_date, end_date = date_filter
+        lf = lf.filter(
+            (pl.col("origin_time") >= start_date) & (pl.col("origin_time") <= end_date)
+        )
+
+    if columns is None:
+        return lf.collect(streaming=True)
+
+    missing_columns = [col for col in columns if col not in schema]
+    if missing_columns:
+        logger.warning(f"Missing requested columns: {missing_columns}")
+
+    return lf.select([col for col in columns if col in schema]).collect(streaming=True)
+
+
 def load_trades_data(
     file_path: str | Path,
     symbol: str = "BTC-USDT",
     date_filter: tuple[str, str] | None = None,
+    columns: list[str] | None = None,
 ) -> pl.DataFrame:
     """Load trades data from Crypto Lake format.
 
@@ -17,6 +71,7 @@ def load_trades_data(
         file_path: Path to the trades data file (CSV or Parquet)
         symbol: Trading symbol to filter for (default: BTC-USDT)
         date_filter: Optional tuple of (start_date, end_date) in YYYY-MM-DD format
+        columns: Optional columns to read; all columns are read if omitted
 
     Returns:
         Polars DataFrame with trades data
@@ -32,30 +87,15 @@ def load_trades_data(
 
     logger.info(f"Loading trades data from {file_path}")
 
-    # Determine file format and load accordingly
-    if file_path.suffix.lower() == ".csv":
-        df = pl.read_csv(file_path)
-    elif file_path.suffix.lower() == ".parquet":
-        df = pl.read_parquet(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {file_path.suffix}")
-
-    logger.info(f"Loaded {len(df)} rows from {file_path}")
+    if columns is not None:
+        df = _scan_projected(file_path, columns, symbol, date_filter)
+        logger.info(f"Loaded {len(df)} rows of {df.columns} from {file_path}")
+        return df
 
-    # Filter by symbol if specified
-    if symbol and "symbol" in df.columns:
-        df = df.filter(pl.col("symbol") == symbol)
-        logger.info(f"Filtered to {len(df)} rows for symbol {symbol}")
+    # Symbol and date filters are pushed down into the scan
+    df = _scan_projected(file_path, None, symbol, date_filter)
 
-    # Apply date filter if specified
-    if date_filter and "origin_time" in df.columns:
-        start_date, end_date = date_filter
-        df = df.filter(
-            (pl.col("origin_time") >= start_date) & (pl.col("origin_time") <= end_date)
-        )
-        logger.info(
-            f"Filtered to {len(df)} rows for date range {start_date} to {end_date}"
-        )
+    logger.info(f"Loaded {len(df)} rows from {file_path}")
 
     # Validate expected columns for trades data
     expected_columns = ["origin_time", "trade_id", "price", "quantity", "side"]
@@ -77,6 +117,7 @@ def load_book_data(
     file_path: str | Path,
     symbol: str = "BTC-USDT",
     date_filter: tuple[str, str] | None = None,
+    columns: list[str] | None = None,
 ) -> pl.DataFrame:
     """Load L2 book snapshot data from Crypto Lake format.
 
@@ -84,6 +125,7 @@ def load_book_data(
         file_path: Path to the book data file (CSV or Parquet)
         symbol: Trading symbol to filter for (default: BTC-USDT)
         date_filter: Optional tuple of (start_date, end_date) in YYYY-MM-DD format
+        columns: Optional columns to read; all columns are read if omitted
 
     Returns:
         Polars DataFrame with book data
@@ -99,30 +141,15 @@ def load_book_data(
 
     logger.info(f"Loading book data from {file_path}")
 
-    # Determine file format and load accordingly
-    if file_path.suffix.lower() == ".csv":
-        df = pl.read_csv(file_path)
-    elif file_path.suffix.lower() == ".parquet":
-        df = pl.read_parquet(file_path)
-    else:
-        raise ValueError(f"Unsupported file format: {file_path.suffix}")
-
-    logger.info(f"Loaded {len(df)} rows from {file_path}")
+    if columns is not None:
+        df = _scan_projected(file_path, columns, symbol, date_filter)
+        logger.info(f"Loaded {len(df)} rows of {df.columns} from {file_path}")
+        return df
 
-    # Filter by symbol if specified
-    if symbol and "symbol" in df.columns:
-        df = df.filter(pl.col("symbol") == symbol)
-        logger.info(f"Filtered to {len(df)} rows for symbol {symbol}")
+    # Symbol and date filters are pushed down into the scan
+    df = _scan_projected(file_path, None, symbol, date_filter)
 
-    # Apply date filter if specified
-    if date_filter and "origin_time" in df.columns:
-        start_date, end_date = date_filter
-        df = df.filter(
-            (pl.col("origin_time") >= start_date) & (pl.col("origin_time") <= end_date)
-        )
-        logger.info(
-            f"Filtered to {len(df)} rows for date range {start_date} to {end_date}"
-        )
+    logger.info(f"Loaded {len(df)} rows from {file_path}")
 
     # Validate expected columns for book data (wide format)
     expected_base_columns = ["origin_time", "sequence_number"]
@@ -168,6 +195,7 @@ def load_multiple_files(
     data_type: str,
     symbol: str = "BTC-USDT",
     date_filter: tuple[str, str] | None = None,
+    columns: list[str] | None = None,
 ) -> pl.DataFrame:
     """Load and concatenate multiple data files.
 
@@ -176,6 +204,7 @@ def load_multiple_files(
         data_type: Type of data ('trades' or 'book')
         symbol: Trading symbol to filter for (default: BTC-USDT)
         date_filter: Optional tuple of (start_date, end_date) in YYYY-MM-DD format
+        columns: Optional columns to read; all columns are read if omitted
 
     Returns:
         Concatenated Polars DataFrame
@@ -193,9 +222,9 @@ def load_multiple_files(
     for file_path in file_paths:
         try:
             if data_type == "trades":
-                df = load_trades_data(file_path, symbol, date_filter)
+                df = load_trades_data(file_path, symbol, date_filter, columns)
             else:
-                df = load_book_data(file_path, symbol, date_filter)
+                df = load_book_data(file_path, symbol, date_filter, columns)
 
             dataframes.append(df)
 
@@ -125,7 +125,7 @@ class DataQualityAnalyzer:
         
         # Check update_id validity (should be positive)
         try:
-            valid_update_ids = df.filter(pl.col("update_id") > 0).height
+            valid_update_ids = df.select((pl.col("update_id") > 0).sum()).item()
             self.metrics["valid_update_ids"] = valid_update_ids
             self.metrics["invalid_update_ids"] = total_rows - valid_update_ids
         except Exception as e:
@@ -135,7 +135,7 @@ class DataQualityAnalyzer:
         
         # Check price validity (should be positive)
         try:
-            valid_prices = df.filter(pl.col("price") > 0).height
+            valid_prices = df.select((pl.col("price") > 0).sum()).item()
             self.metrics["valid_prices"] = valid_prices
             self.metrics["invalid_prices"] = total_rows - valid_prices
         except Exception as e:
@@ -145,7 +145,7 @@ class DataQualityAnalyzer:
         
         # Check quantity validity (should be >= 0)
         try:
-            valid_quantities = df.filter(pl.col("new_quantity") >= 0).height
+            valid_quantities = df.select((pl.col("new_quantity") >= 0).sum()).item()
             self.metrics["valid_quantities"] = valid_quantities
             self.metrics["invalid_quantities"] = total_rows - valid_quantities
         except Exception as e:
@@ -13,6 +13,9 @@ from rlx_datapipe.analysis.origin_time_validator import OriginTimeValidator
 from rlx_datapipe.analysis.report_generator import OriginTimeReportGenerator
 from rlx_datapipe.common.logging import setup_logging
 
+# Validation only inspects origin_time, so no other column is read
+ANALYSIS_COLUMNS = ["origin_time"]
+
 
 class OriginTimeAnalyzer:
     """Orchestrates the complete origin_time analysis workflow."""
@@ -61,9 +64,19 @@ class OriginTimeAnalyzer:
 
         # Load data
         if data_type == "trades":
-            df = load_trades_data(file_path, symbol=symbol, date_filter=date_filter)
+            df = load_trades_data(
+                file_path,
+                symbol=symbol,
+                date_filter=date_filter,
+                columns=ANALYSIS_COLUMNS,
+            )
         elif data_type == "book":
-            df = load_book_data(file_path, symbol=symbol, date_filter=date_filter)
+            df = load_book_data(
+                file_path,
+                symbol=symbol,
+                date_filter=date_filter,
+                columns=ANALYSIS_COLUMNS,
+            )
         else:
             raise ValueError(
                 f"Invalid data_type: {data_type}. Must be 'trades' or 'book'"
@@ -104,7 +117,11 @@ class OriginTimeAnalyzer:
         if trades_files:
             try:
                 trades_df = load_multiple_files(
-                    trades_files, "trades", symbol=symbol, date_filter=date_filter
+                    trades_files,
+                    "trades",
+                    symbol=symbol,
+                    date_filter=date_filter,
+                    columns=ANALYSIS_COLUMNS,
                 )
                 trades_results = self.validator.validate_origin_time(
                     trades_df, "trades"
@@ -117,7 +134,11 @@ class OriginTimeAnalyzer:
         if book_files:
             try:
                 book_df = load_multiple_files(
-                    book_files, "book", symbol=symbol, date_filter=date_filter
+                    book_files,
+                    "book",
+                    symbol=symbol,
+                    date_filter=date_filter,
+                    columns=ANALYSIS_COLUMNS,
                 )
                 book_results = self.validator.validate_origin_time(book_df, "book")
                 results.append(book_results)
@@ -59,15 +59,21 @@ class OriginTimeValidator:
         # Check for various zero representations as separate conditions
         zero_count = 0
 
-        # Check for string zeros
-        zero_count += df.filter(pl.col("origin_time") == "0").height
-        zero_count += df.filter(pl.col("origin_time") == "").height
-        zero_count += df.filter(pl.col("origin_time") == "1970-01-01T00:00:00").height
-        zero_count += df.filter(pl.col("origin_time") == "1970-01-01 00:00:00").height
+        # Check for string zeros, counting all representations in one select
+        zero_count += sum(
+            df.select(
+                [
+                    (pl.col("origin_time") == zero).sum().alias(f"zero_{i}")
+                    for i, zero in enumerate(
+                        ["0", "", "1970-01-01T00:00:00", "1970-01-01 00:00:00"]
+                    )
+                ]
+            ).row(0)
+        )
 
         # Check for numeric zeros (if possible)
         try:
-            zero_count += df.filter(pl.col("origin_time") == 0).height
+            zero_count += df.select((pl.col("origin_time") == 0).sum()).item()
         except Exception:
             # Column is not numeric, skip numeric zero check
             pass
@@ -95,18 +101,14 @@ class OriginTimeValidator:
 
         try:
             # Convert to datetime if it's not already, handling null values
-            df_with_datetime = df.with_columns(
-                [
-                    pl.col("origin_time")
-                    .str.to_datetime(strict=False)
-                    .alias("origin_time_dt")
-                ]
-            )
+            origin_time_dt = pl.col("origin_time").str.to_datetime(strict=False)
 
-            future_count = df_with_datetime.filter(
-                pl.col("origin_time_dt").is_not_null()
-                & (pl.col("origin_time_dt") > pl.lit(self.current_time))
-            ).height
+            future_count = df.select(
+                (
+                    origin_time_dt.is_not_null()
+                    & (origin_time_dt > pl.lit(self.current_time))
+                ).sum()
+            ).item()
 
             future_percentage = (
                 (future_count / total_rows * 100) if total_rows > 0 else 0.0
@@ -137,15 +139,9 @@ class OriginTimeValidator:
 
         try:
             # Check if origin_time is numeric (timestamp)
-            numeric_df = df.with_columns(
-                [
-                    pl.col("origin_time")
-                    .cast(pl.Float64, strict=False)
-                    .alias("origin_time_numeric")
-                ]
-            )
+            origin_time_numeric = pl.col("origin_time").cast(pl.Float64, strict=False)
 
-            negative_count = numeric_df.filter(pl.col("origin_time_numeric") < 0).height
+            negative_count = df.select((origin_time_numeric < 0).sum()).item()
 
             negative_percentage = (
                 (negative_count / total_rows * 100) if total_rows > 0 else 0.0
@@ -180,18 +176,13 @@ class OriginTimeValidator:
 
         try:
             # Try to parse as datetime and count failures
-            df_with_parsed = df.with_columns(
-                [
-                    pl.col("origin_time")
-                    .str.to_datetime(strict=False)
-                    .alias("origin_time_parsed")
-                ]
-            )
+            origin_time_parsed = pl.col("origin_time").str.to_datetime(strict=False)
 
-            invalid_count = df_with_parsed.filter(
-                pl.col("origin_time_parsed").is_null()
-                & pl.col("origin_time").is_not_null()
-            ).height
+            invalid_count = df.select(
+                (
+                    origin_time_parsed.is_null() & pl.col("origin_time").is_not_null()
+                ).sum()
+            ).item()
 
             invalid_percentage = (
                 (invalid_count / total_rows * 100) if total_rows > 0 else 0.0
@@ -1,13 +1,18 @@
 """JSONL file writer with compression support."""
 
+import asyncio
+import contextlib
 import gzip
-import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 from loguru import logger
 
+_DUMPS_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
 
 class JSONLWriter:
     """Writes data to JSONL files with optional compression."""
@@ -35,12 +40,24 @@ class JSONLWriter:
         self.buffer_size = buffer_size
         self.rotation_interval = rotation_interval
 
-        self._buffer = []
+        # Lines are copied into one reusable bytearray; it keeps its
+        # capacity across flushes so steady-state writes do not allocate
+        self._buffer = bytearray(buffer_size * 512)
+        self._buffer_pos = 0
+        self._buffer_records = 0
+
+        # flush_async hands the filled buffer to a single writer thread and
+        # swaps in the spare, so the event loop keeps buffering meanwhile
+        self._spare_buffer = bytearray(buffer_size * 512)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_write: Future | None = None
+        self._pending_records = 0
         self._current_file = None
         self._file_handle = None
         self._file_start_time = None
         self._record_count = 0
         self._total_records = 0
+        self._failed_records = 0
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -64,20 +81,22 @@ class JSONLWriter:
         self._record_count = 0
 
         if self.compress:
-            self._file_handle = gzip.open(self._current_file, "wt", encoding="utf-8")
+            self._file_handle = gzip.open(self._current_file, "wb")
         else:
-            self._file_handle = open(self._current_file, "w", encoding="utf-8")
+            self._file_handle = open(self._current_file, "wb")
 
         logger.info(f"Opened new file: {self._current_file}")
 
     def _close_file(self) -> None:
         """Close current file if open."""
         if self._file_handle:
-            # Flush any remaining buffer
-            self._flush_buffer()
-
-            self._file_handle.close()
-            self._file_handle = None
+            try:
+                # Flush any remaining buffer
+                self._wait_pending_write()
+                self._flush_buffer()
+            finally:
+                self._file_handle.close()
+                self._file_handle = None
 
             if self._current_file:
                 logger.info(f"Closed file: {self._current_file} ({self._record_count} records)")
@@ -90,18 +109,58 @@ class JSONLWriter:
         elapsed = (datetime.now() - self._file_start_time).total_seconds()
         return elapsed >= self.rotation_interval
 
+    def _wait_pending_write(self) -> None:
+        """Block until a write started by flush_async has completed."""
+        if self._pending_write is not None:
+            self._complete_pending_write(self._pending_write)
+
+    def _complete_pending_write(self, pending: Future) -> None:
+        """Settle a finished flush_async write.
+
+        Its records are counted once the write has succeeded. A failed write
+        is recorded and its error raised here, to the one caller that settles
+        it; the writer then carries on with later records.
+        """
+        if self._pending_write is not pending:
+            # Already settled by another caller
+            return
+
+        records = self._pending_records
+        self._pending_write = None
+        self._pending_records = 0
+
+        try:
+            pending.result()
+        except Exception:
+            self._failed_records += records
+            logger.error(f"Failed to write {records} records to {self._current_file}")
+            raise
+
+        self._record_count += records
+        self._total_records += records
+
+    @staticmethod
+    def _write_out(file_handle: Any, data: bytearray, end: int) -> None:
+        """Write the first end bytes of data and flush the handle."""
+        with memoryview(data) as view:
+            file_handle.write(view[:end])
+        file_handle.flush()
+
     def _flush_buffer(self) -> None:
         """Write buffer contents to file."""
-        if not self._buffer or not self._file_handle:
+        if not self._buffer_records or not self._file_handle:
             return
 
-        for record in self._buffer:
-            json_line = json.dumps(record, separators=(",", ":"))
-            self._file_handle.write(json_line + "\n")
+        # Keep ordering with a write still running on the writer thread
+        self._wait_pending_write()
 
-        self._record_count += len(self._buffer)
-        self._total_records += len(self._buffer)
-        self._buffer.clear()
+        with memoryview(self._buffer) as view:
+            self._file_handle.write(view[:self._buffer_pos])
+
+        self._record_count += self._buffer_records
+        self._total_records += self._buffer_records
+        self._buffer_pos = 0
+        self._buffer_records = 0
 
     def write(self, record: dict[str, Any]) -> None:
         """Write a record to JSONL file.
@@ -109,27 +168,75 @@ class JSONLWriter:
         Args:
             record: Dictionary to write as JSON line
         """
+        self.write_bytes(orjson.dumps(record, option=_DUMPS_OPTIONS))
+
+    def write_bytes(self, line: bytes | bytearray | memoryview) -> None:
+        """Write an already serialized JSON line.
+        
+        Args:
+            line: UTF-8 encoded JSON document terminated by a newline
+        """
         # Check if we need to open a new file
         if not self._file_handle or self._should_rotate():
             self._open_file()
 
-        # Add to buffer
-        self._buffer.append(record)
+        # Copy into buffer, growing it only if the line does not fit
+        end = self._buffer_pos + len(line)
+        self._buffer[self._buffer_pos:end] = line
+        self._buffer_pos = end
+        self._buffer_records += 1
 
         # Flush if buffer is full
-        if len(self._buffer) >= self.buffer_size:
+        if self._buffer_records >= self.buffer_size:
             self._flush_buffer()
 
     def flush(self) -> None:
         """Force flush buffer to disk."""
+        # The writer thread may still be using the handle
+        self._wait_pending_write()
         self._flush_buffer()
 
         if self._file_handle:
             self._file_handle.flush()
 
+    async def flush_async(self) -> None:
+        """Flush buffer to disk on the writer thread without blocking the loop."""
+        # The spare buffer is only free once the previous write has finished
+        while self._pending_write is not None:
+            pending = self._pending_write
+            with contextlib.suppress(Exception):
+                await asyncio.wrap_future(pending)
+            self._complete_pending_write(pending)
+
+        if not self._buffer_records or not self._file_handle:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jsonl-writer")
+
+        data, end = self._buffer, self._buffer_pos
+        records = self._buffer_records
+        self._buffer, self._spare_buffer = self._spare_buffer, data
+        self._buffer_pos = 0
+        self._buffer_records = 0
+
+        # Records are counted once the write completes, not when it is queued
+        pending = self._executor.submit(self._write_out, self._file_handle, data, end)
+        self._pending_write = pending
+        self._pending_records = records
+        # A failure is raised by _complete_pending_write, to one caller only
+        with contextlib.suppress(Exception):
+            await asyncio.wrap_future(pending)
+        self._complete_pending_write(pending)
+
     def close(self) -> None:
         """Close writer and flush remaining data."""
-        self._close_file()
+        try:
+            self._close_file()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
         logger.info(f"JSONL writer closed. Total records written: {self._total_records}")
 
     def get_stats(self) -> dict[str, Any]:
@@ -138,5 +245,6 @@ class JSONLWriter:
             "current_file": str(self._current_file) if self._current_file else None,
             "current_file_records": self._record_count,
             "total_records": self._total_records,
-            "buffer_size": len(self._buffer)
+            "failed_records": self._failed_records,
+            "buffer_size": self._buffer_records
         }
@@ -1,14 +1,24 @@
 """WebSocket connection handler with automatic reconnection."""
 
 import asyncio
-import json
 import time
 from collections.abc import Callable
+from typing import Any
 
+import orjson
 import websockets
 from loguru import logger
 from websockets.exceptions import WebSocketException
 
+# Largest frame accepted before the connection is closed (1009). This is the
+# websockets default, spelled out so every connect site shares one bound; it
+# is not tuned to measured Binance frame sizes. permessage-deflate is also
+# skipped, so each frame reaches the parser without inflating.
+MAX_FRAME_SIZE = 2**20
+# Buffer up to this many incoming bytes before asyncio pauses the transport,
+# so bursts on the combined stream don't toggle reading on and off.
+READ_LIMIT = 2**20
+
 
 class WebSocketHandler:
     """Handles WebSocket connections with automatic reconnection and message buffering."""
@@ -16,11 +26,12 @@ class WebSocketHandler:
     def __init__(
         self,
         url: str,
-        on_message: Callable[[dict, int], None],
+        on_message: Callable[[Any, int], None],
         on_connect: Callable[[], None] | None = None,
         on_disconnect: Callable[[], None] | None = None,
         max_reconnect_attempts: int = 5,
-        reconnect_delay: float = 5.0
+        reconnect_delay: float = 5.0,
+        decode: bool = True
     ):
         """Initialize WebSocket handler.
         
@@ -31,6 +42,8 @@ class WebSocketHandler:
             on_disconnect: Optional callback when disconnected
             max_reconnect_attempts: Maximum reconnection attempts
             reconnect_delay: Delay between reconnection attempts in seconds
+            decode: Parse messages as JSON before calling on_message; when
+                False the raw frame (str or bytes) is passed through
         """
         self.url = url
         self.on_message = on_message
@@ -38,6 +51,7 @@ class WebSocketHandler:
         self.on_disconnect = on_disconnect
         self.max_reconnect_attempts = max_reconnect_attempts
         self.reconnect_delay = reconnect_delay
+        self.decode = decode
         self._websocket: websockets.WebSocketClientProtocol | None = None
         self._running = False
         self._reconnect_count = 0
@@ -45,7 +59,12 @@ class WebSocketHandler:
     async def connect(self) -> None:
         """Establish WebSocket connection."""
         try:
-            self._websocket = await websockets.connect(self.url)
+            self._websocket = await websockets.connect(
+                self.url,
+                max_size=MAX_FRAME_SIZE,
+                read_limit=READ_LIMIT,
+                compression=None,
+            )
             self._reconnect_count = 0
             logger.info(f"Connected to WebSocket: {self.url}")
 
@@ -67,22 +86,22 @@ class WebSocketHandler:
 
             logger.info("Disconnected from WebSocket")
 
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: str | bytes) -> None:
         """Process incoming WebSocket message.
         
         Args:
-            message: Raw message string from WebSocket
+            message: Raw message from WebSocket, passed to the parser undecoded
         """
         receive_ns = time.perf_counter_ns()
 
         try:
-            data = json.loads(message)
+            data = orjson.loads(message) if self.decode else message
             # Check if on_message is async and await it
             if asyncio.iscoroutinefunction(self.on_message):
                 await self.on_message(data, receive_ns)
             else:
                 self.on_message(data, receive_ns)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
@@ -164,12 +164,20 @@ class OrderBookEngine:
             bid_depth = np.zeros(num_deltas, dtype=np.int32)
             ask_depth = np.zeros(num_deltas, dtype=np.int32)
             
-            # Process each delta
-            for i, row in enumerate(delta_batch.iter_rows(named=True)):
+            # Process each delta, iterating the columns together instead of
+            # building a dict per row
+            rows = zip(
+                delta_batch["update_id"].to_list(),
+                delta_batch["price"].to_list(),
+                delta_batch["new_quantity"].to_list(),
+                delta_batch["side"].to_list(),
+                strict=True,
+            )
+            for i, (update_id, price, new_quantity, side) in enumerate(rows):
                 # Validate sequence if enabled
                 if validate_sequence and self.last_update_id is not None:
                     expected_id = self.last_update_id + 1
-                    actual_id = row["update_id"]
+                    actual_id = update_id
                     
                     if actual_id != expected_id:
                         self.gap_stats.record_gap(expected_id, actual_id)
@@ -185,10 +193,10 @@ class OrderBookEngine:
                 
                 # Apply delta to book state
                 self.book_state.apply_delta(
-                    price=row["price"],
-                    quantity=row["new_quantity"],
-                    side=row["side"],
-                    update_id=row["update_id"],
+                    price=price,
+                    quantity=new_quantity,
+                    side=side,
+                    update_id=update_id,
                 )
                 
                 # Get current book state for enrichment
@@ -211,7 +219,7 @@ class OrderBookEngine:
                 # Get book depth
                 bid_depth[i], ask_depth[i] = self.book_state.get_book_depth()
                 
-                self.last_update_id = row["update_id"]
+                self.last_update_id = update_id
                 self.updates_processed += 1
                 
                 # Manual GC control
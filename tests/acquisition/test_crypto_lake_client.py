@@ -0,0 +1,84 @@
+"""Tests for CryptoLakeClient inventory caching."""
+
+import os
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rlx_datapipe.acquisition.crypto_lake_client import CryptoLakeClient
+
+
+class TestCryptoLakeClientInventoryCache:
+    """Test suite for the CryptoLakeClient inventory cache."""
+
+    @pytest.fixture
+    def mock_env_vars(self):
+        """Mock environment variables."""
+        with patch.dict(os.environ, {
+            'aws_access_key_id': 'test_access_key',
+            'aws_secret_access_key': 'test_secret_key'
+        }):
+            yield
+
+    @pytest.fixture
+    def mock_dotenv(self):
+        """Mock dotenv loading."""
+        with patch('rlx_datapipe.acquisition.crypto_lake_client.load_dotenv'):
+            yield
+
+    @pytest.fixture
+    def listing(self):
+        """S3 listing pages for one symbol."""
+        modified = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        return [{
+            'Contents': [
+                {'Key': 'binance/BTC-USDT/trades/2024-01-01.parquet', 'Size': 100, 'LastModified': modified},
+                {'Key': 'binance/BTC-USDT/book/2024-01-01.parquet', 'Size': 200, 'LastModified': modified},
+                {'Key': 'binance/BTC-USDT/book_delta_v2/2024-01-01.parquet', 'Size': 300, 'LastModified': modified},
+            ]
+        }]
+
+    def make_client(self, tmp_path, listing, **kwargs):
+        """Create a client whose S3 paginator returns the given listing."""
+        with patch('boto3.client') as mock_boto:
+            s3 = MagicMock()
+            s3.get_paginator.return_value.paginate.return_value = listing
+            mock_boto.return_value = s3
+            return CryptoLakeClient(bucket_name='test-bucket', cache_dir=tmp_path, **kwargs)
+
+    def test_inventory_written_and_reused(self, mock_env_vars, mock_dotenv, tmp_path, listing):
+        """Second client serves the inventory from disk without listing S3."""
+        first = self.make_client(tmp_path, listing)
+        data = first.list_available_data()
+
+        assert [f['key'] for f in data['trades']] == ['binance/BTC-USDT/trades/2024-01-01.parquet']
+        assert len(data['book']) == 1
+        assert len(data['book_delta_v2']) == 1
+        assert list(tmp_path.glob('inventory_*.parquet'))
+
+        second = self.make_client(tmp_path, listing)
+        cached = second.list_available_data()
+
+        second.s3_client.get_paginator.assert_not_called()
+        assert cached['trades'][0]['size'] == 100
+        assert cached['trades'][0]['last_modified'] == data['trades'][0]['last_modified']
+
+    def test_memoized_within_client(self, mock_env_vars, mock_dotenv, tmp_path, listing):
+        """Date-range queries for several data types share one listing."""
+        client = self.make_client(tmp_path, listing)
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 31)
+
+        for data_type in ('trades', 'book', 'book_delta_v2'):
+            assert len(client.list_files_in_date_range('BTC-USDT', 'binance', data_type, start, end)) == 1
+
+        assert client.s3_client.get_paginator.call_count == 1
+
+    def test_expired_cache_relists(self, mock_env_vars, mock_dotenv, tmp_path, listing):
+        """A zero TTL forces a fresh S3 listing."""
+        self.make_client(tmp_path, listing).list_available_data()
+
+        client = self.make_client(tmp_path, listing, cache_ttl=0)
+        client.list_available_data()
+
+        client.s3_client.get_paginator.assert_called_once()
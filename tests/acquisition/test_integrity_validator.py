@@ -159,4 +159,40 @@ class TestIntegrityValidator:
         assert 'columns' in result.metadata
         
         assert result.metadata['row_count'] == len(sample_trades_data)
-        assert result.metadata['file_size_bytes'] > 0
\ No newline at end of file
+        assert result.metadata['file_size_bytes'] > 0
+
+    def test_validate_file_reads_checked_columns_only(self, validator, tmp_path, sample_trades_data):
+        """Test that only quality-checked columns are decoded but all are reported."""
+        file_path = tmp_path / "trades.parquet"
+        sample_trades_data.to_parquet(file_path, index=False)
+        
+        with patch.object(validator, '_validate_data_quality', wraps=validator._validate_data_quality) as quality:
+            result = validator.validate_file(file_path, 'trades')
+        
+        checked_df = quality.call_args.args[0]
+        assert checked_df.columns == ['origin_time', 'price', 'quantity', 'side']
+        assert result.metadata['columns'] == list(sample_trades_data.columns)
+        assert result.passed
+
+    def test_validate_file_without_checked_columns_reads_no_columns(self, validator, tmp_path):
+        """Test that a file with no quality-checked columns is not decoded."""
+        file_path = tmp_path / "book.parquet"
+        pd.DataFrame({'symbol': ['BTC-USDT'] * 3, 'bids': [1.0, 2.0, 3.0]}).to_parquet(file_path, index=False)
+
+        with patch('rlx_datapipe.acquisition.integrity_validator.pl.read_parquet') as read_parquet:
+            result = validator.validate_file(file_path, 'book')
+
+        read_parquet.assert_not_called()
+        assert result.metadata['row_count'] == 3
+        assert result.checks['readable']
+        assert any("Missing required columns" in error for error in result.errors)
+
+    def test_validate_file_string_price_not_numeric(self, validator, tmp_path, sample_trades_data):
+        """Test that a string-typed numeric column fails the dtype check."""
+        file_path = tmp_path / "trades.parquet"
+        sample_trades_data.assign(price=sample_trades_data['price'].astype(str)).to_parquet(file_path, index=False)
+        
+        result = validator.validate_file(file_path, 'trades')
+        
+        assert result.checks['price_is_numeric'] is False
+        assert any("not numeric" in error for error in result.errors)
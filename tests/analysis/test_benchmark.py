@@ -4,12 +4,14 @@ Tests for performance benchmark harness.
 
 import pytest
 import tempfile
+import time
 import json
 from pathlib import Path
+import numpy as np
 import polars as pl
 
 from rlx_datapipe.analysis.delta_analyzer import create_sample_delta_data
-from scripts.bench_replay import PerformanceHarness, PerformanceMetrics, OrderBookEngine
+from scripts.bench_replay import SIDE_ASK, SIDE_BID, PerformanceHarness, PerformanceMetrics, OrderBookEngine
 
 
 class TestOrderBookEngine:
@@ -104,6 +106,64 @@ class TestOrderBookEngine:
         assert success
         assert engine.last_update_id == 5
 
+    def test_update_batch_matches_per_event_updates(self):
+        """Test batch updates leave the same book as per-event updates."""
+        df = create_sample_delta_data(500).with_columns(
+            pl.col("new_quantity").alias("quantity")
+        )
+        per_event = OrderBookEngine(max_levels=1000)
+        for event in df.to_dicts():
+            per_event.update(
+                price=event["price"],
+                quantity=event["quantity"],
+                side=event["side"],
+                update_id=event["update_id"]
+            )
+
+        batched = OrderBookEngine(max_levels=1000)
+        success = batched.update_batch(
+            prices=df["price"].to_numpy(),
+            quantities=df["quantity"].to_numpy(),
+            sides=np.where(df["side"].to_numpy() == "bid", SIDE_BID, SIDE_ASK),
+            update_ids=df["update_id"].to_numpy(),
+        )
+
+        assert success
+        assert batched.bids == per_event.bids
+        assert batched.asks == per_event.asks
+        assert batched.update_count == 500
+        assert batched.last_update_id == per_event.last_update_id
+
+    def test_update_batch_max_levels(self):
+        """Test max levels constraint after a batch update."""
+        engine = OrderBookEngine(max_levels=5)
+
+        engine.update_batch(
+            prices=np.arange(100.0, 110.0),
+            quantities=np.ones(10),
+            sides=np.full(10, SIDE_BID, dtype=np.int8),
+            update_ids=np.arange(1, 11),
+        )
+
+        assert len(engine.bids) == 5
+        assert min(engine.bids.keys()) == 105.0
+
+    def test_tick_keyed_book(self):
+        """Test levels keyed by integer ticks."""
+        engine = OrderBookEngine(max_levels=10, tick_size=0.01)
+
+        engine.update(price=100.01, quantity=1.0, side="bid", update_id=1)
+        engine.update_batch(
+            prices=np.array([100.02, 100.01]),
+            quantities=np.array([2.0, 0.0]),
+            sides=np.array([SIDE_ASK, SIDE_BID], dtype=np.int8),
+            update_ids=np.array([2, 3]),
+        )
+
+        assert engine.bids == {}
+        assert engine.asks == {10002: 2.0}
+        assert engine.get_best_bid_ask() == (None, pytest.approx(100.02))
+
 
 class TestPerformanceMetrics:
     """Test the PerformanceMetrics class."""
@@ -166,7 +226,7 @@ class TestPerformanceHarness:
         assert parsed_df["update_id"].dtype == pl.Int64
         
         # Check parse times were recorded
-        assert len(harness.parse_times) > 0
+        assert harness.parse_count > 0
     
     def test_update_order_book(self):
         """Test order book updates."""
@@ -184,7 +244,7 @@ class TestPerformanceHarness:
         assert harness.order_book.get_depth() > 0
         
         # Check update times were recorded
-        assert len(harness.order_book_update_times) > 0
+        assert harness.order_book_update_count > 0
     
     def test_write_to_disk(self):
         """Test disk writing."""
@@ -207,8 +267,49 @@ class TestPerformanceHarness:
             assert len(read_df) == 100
         
         # Check write times were recorded
-        assert len(harness.disk_write_times) > 0
+        assert harness.disk_write_count > 0
     
+    def test_append_to_disk(self):
+        """Test appending batches to a single file."""
+        harness = PerformanceHarness()
+
+        parsed_df = harness.parse_events(create_sample_delta_data(100))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "test_output.parquet"
+            harness.append_to_disk(parsed_df, output_path)
+            harness.append_to_disk(parsed_df, output_path)
+            harness.close_writer()
+
+            read_df = pl.read_parquet(output_path)
+            assert len(read_df) == 200
+
+        assert harness.disk_write_count == 3
+
+    def test_append_to_disk_keeps_sample_buffers(self):
+        """Test sample buffers are not refilled while a queued write reads them."""
+        harness = PerformanceHarness()
+        write_row_group = harness._write_row_group
+
+        def slow_write_row_group(table, output_path):
+            time.sleep(0.2)
+            write_row_group(table, output_path)
+
+        harness._write_row_group = slow_write_row_group
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = Path(tmp_dir) / "test_output.parquet"
+            parsed_df = harness.parse_events(harness._sample_batch(100, 100))
+            expected_ids = parsed_df["update_id"].to_list()
+            harness.append_to_disk(parsed_df, output_path)
+
+            # Cycle through the whole buffer pool while the write is queued
+            for _ in range(len(harness._sample_buffers)):
+                harness._sample_batch(100, 100)
+            harness.close_writer()
+
+            assert pl.read_parquet(output_path)["update_id"].to_list() == expected_ids
+
     def test_profiling_start_stop(self):
         """Test profiling start/stop."""
         harness = PerformanceHarness()
@@ -242,7 +343,8 @@ class TestPerformanceHarness:
         harness = PerformanceHarness()
         
         # Run small benchmark
-        metrics = harness.run_benchmark(num_events=1000, batch_size=100)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            metrics = harness.run_benchmark(num_events=1000, batch_size=100, output_dir=Path(tmp_dir))
         
         # Check metrics
         assert metrics.events_processed == 1000
@@ -258,6 +360,7 @@ class TestPerformanceHarness:
         harness = PerformanceHarness(memory_limit_gb=0.1)
         
         # Should complete without crashing
-        metrics = harness.run_benchmark(num_events=500, batch_size=100)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            metrics = harness.run_benchmark(num_events=500, batch_size=100, output_dir=Path(tmp_dir))
         
         assert metrics.events_processed > 0
\ No newline at end of file
@@ -0,0 +1,14 @@
+"""Tests for the analysis command-line entry points."""
+
+from click.testing import CliRunner
+
+from rlx_datapipe.analysis.cli import main
+
+
+def test_analyze_origin_time_without_data(tmp_path):
+    """An empty data directory is reported as a failed analysis."""
+    (tmp_path / "staging" / "raw").mkdir(parents=True)
+
+    result = CliRunner().invoke(main, ["--data-dir", str(tmp_path)])
+
+    assert result.exit_code == 3
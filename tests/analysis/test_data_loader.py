@@ -118,6 +118,26 @@ def test_load_trades_data_with_date_filter(sample_trades_data):
         assert len(df) == 2  # Only first two trades
 
 
+def test_load_trades_data_projected_columns(sample_trades_data):
+    """Test loading only the requested columns with filters applied."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mixed_data = sample_trades_data.with_columns(
+            pl.Series("symbol", ["BTC-USDT", "ETH-USDT", "BTC-USDT"])
+        )
+        file_path = Path(temp_dir) / "trades.parquet"
+        mixed_data.write_parquet(file_path)
+
+        df = load_trades_data(
+            file_path,
+            symbol="BTC-USDT",
+            date_filter=("2024-01-01T10:00:00", "2024-01-01T10:01:00"),
+            columns=["origin_time"],
+        )
+
+        assert df.columns == ["origin_time"]
+        assert df["origin_time"].to_list() == ["2024-01-01T10:00:00"]
+
+
 def test_load_book_data_csv(sample_book_data):
     """Test loading book data from CSV file."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -73,8 +73,10 @@ class TestCaptureIntegration:
         ]
         
     @pytest.mark.asyncio
-    async def test_capture_workflow(self, temp_dir, mock_websocket_messages):
+    async def test_capture_workflow(self, temp_dir, mock_websocket_messages, monkeypatch):
         """Test complete capture workflow."""
+        # The capture log file is relative to the working directory
+        monkeypatch.chdir(temp_dir)
         configure_logging()
         
         # Create capture instance
@@ -185,8 +187,10 @@ class TestCaptureIntegration:
         # Should not be synchronized
         assert not capture.orderbook_sync.is_synchronized()
         
-    def test_capture_cli_invocation(self, temp_dir):
+    def test_capture_cli_invocation(self, temp_dir, monkeypatch):
         """Test capture CLI invocation."""
+        # main configures a log file relative to the working directory
+        monkeypatch.chdir(temp_dir)
         from click.testing import CliRunner
         from src.rlx_datapipe.capture.main import main
         
@@ -1,5 +1,6 @@
 """Unit tests for JSONLWriter."""
 
+import asyncio
 import json
 import gzip
 from pathlib import Path
@@ -86,6 +87,180 @@ class TestJSONLWriter:
             data = json.loads(line.strip())
             assert data == records[i]
             
+    def test_write_bytes(self, temp_dir):
+        """Test writing pre-serialized lines alongside records."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=False,
+            buffer_size=10
+        )
+        
+        writer.write({"id": 1})
+        writer.write_bytes(b'{"id":2}\n')
+        
+        stats = writer.get_stats()
+        assert stats["buffer_size"] == 2
+        
+        writer.close()
+        
+        files = list(Path(temp_dir).glob("test_*.jsonl"))
+        with open(files[0], "r") as f:
+            lines = f.readlines()
+            
+        assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}]
+        
+    @pytest.mark.asyncio
+    async def test_flush_async(self, temp_dir):
+        """Test async flush writes in order while new records are buffered."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=True,
+            buffer_size=100
+        )
+        
+        writer.write({"id": 1})
+        flush = asyncio.ensure_future(writer.flush_async())
+        await asyncio.sleep(0)  # let the flush hand off its buffer
+        writer.write({"id": 2})
+        await flush
+        
+        assert writer.get_stats()["buffer_size"] == 1
+        
+        await writer.flush_async()
+        writer.write({"id": 3})
+        writer.close()
+        
+        files = list(Path(temp_dir).glob("test_*.jsonl.gz"))
+        with gzip.open(files[0], "rt") as f:
+            lines = f.readlines()
+            
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert writer.get_stats()["total_records"] == 3
+
+    @pytest.mark.asyncio
+    async def test_flush_async_failed_write_not_counted(self, temp_dir):
+        """Test records of a failed async write are not counted as written."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=False,
+            buffer_size=100
+        )
+
+        def failing_write_out(file_handle, data, end):
+            raise OSError("disk full")
+
+        writer._write_out = failing_write_out
+        writer.write({"id": 1})
+
+        with pytest.raises(OSError):
+            await writer.flush_async()
+
+        stats = writer.get_stats()
+        assert stats["current_file_records"] == 0
+        assert stats["total_records"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_async_failure_raised_once(self, temp_dir):
+        """Test a failed async write is reported once and the writer recovers."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=False,
+            buffer_size=100
+        )
+
+        class FailOnceHandle:
+            """File handle whose first write fails."""
+
+            def __init__(self, handle):
+                self.handle = handle
+                self.failed = False
+
+            def write(self, data):
+                if not self.failed:
+                    self.failed = True
+                    raise OSError("disk full")
+                return self.handle.write(data)
+
+            def flush(self):
+                self.handle.flush()
+
+            def close(self):
+                self.handle.close()
+
+        writer.write({"id": 1})
+        writer._file_handle = FailOnceHandle(writer._file_handle)
+
+        with pytest.raises(OSError):
+            await writer.flush_async()
+
+        # Later flushes and close() are not stuck on the old failure
+        writer.write({"id": 2})
+        writer.flush()
+        await writer.flush_async()
+        writer.close()
+
+        assert writer._file_handle is None
+        assert writer._executor is None
+
+        files = list(Path(temp_dir).glob("test_*.jsonl"))
+        with open(files[0], "r") as f:
+            lines = f.readlines()
+
+        assert [json.loads(line) for line in lines] == [{"id": 2}]
+        stats = writer.get_stats()
+        assert stats["total_records"] == 1
+        assert stats["failed_records"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_after_failed_write_releases_resources(self, temp_dir):
+        """Test close() still closes the file when it settles a failed write."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=False,
+            buffer_size=100
+        )
+
+        def failing_write_out(file_handle, data, end):
+            raise OSError("disk full")
+
+        writer._write_out = failing_write_out
+        writer.write({"id": 1})
+        flush = asyncio.ensure_future(writer.flush_async())
+        await asyncio.sleep(0)  # let the flush queue its write
+
+        with pytest.raises(OSError):
+            writer.close()
+        await flush
+
+        assert writer._file_handle is None
+        assert writer._executor is None
+        assert writer.get_stats()["failed_records"] == 1
+
+    def test_buffer_reused_after_flush(self, temp_dir):
+        """Test shorter lines after a flush do not carry stale buffer bytes."""
+        writer = JSONLWriter(
+            output_dir=temp_dir,
+            file_prefix="test",
+            compress=False,
+            buffer_size=10
+        )
+        
+        writer.write({"payload": "x" * 2000})
+        writer.flush()
+        writer.write_bytes(memoryview(b'{"id":2}\n'))
+        writer.close()
+        
+        files = list(Path(temp_dir).glob("test_*.jsonl"))
+        with open(files[0], "r") as f:
+            lines = f.readlines()
+            
+        assert [json.loads(line) for line in lines] == [{"payload": "x" * 2000}, {"id": 2}]
+        
     def test_buffer_behavior(self, temp_dir):
         """Test buffer flushing behavior."""
         writer = JSONLWriter(
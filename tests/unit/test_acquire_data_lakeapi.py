@@ -0,0 +1,172 @@
+"""Unit tests for the lakeapi acquisition CLI."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import call, create_autospec, patch
+
+import pytest
+from click.testing import CliRunner
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from rlx_datapipe.acquisition.integrity_validator import (
+    IntegrityValidator,
+    ValidationResult,
+)
+from rlx_datapipe.acquisition.staging_manager import (
+    DataStagingManager,
+    FileManifest,
+    FileStatus,
+)
+from scripts.acquire_data_lakeapi import _register_raw_files, cli
+
+
+def _manifest(key, data_type, staging_path):
+    """Create a RAW manifest entry for a staged file."""
+    now = datetime.utcnow()
+    return FileManifest(
+        key=key,
+        local_path=str(staging_path / "raw" / key),
+        status=FileStatus.RAW,
+        size_bytes=1024,
+        checksum=None,
+        data_type=data_type,
+        symbol="BTC-USDT",
+        exchange="BINANCE",
+        date="2024-01-01",
+        created_at=now,
+        updated_at=now
+    )
+
+
+def _result(file_path, errors=()):
+    """Create a validation result that passes unless errors are given."""
+    return ValidationResult(file_path, not errors, {}, list(errors), [], {})
+
+
+class TestValidateCommand:
+    """Test the validate command against stub staging manager and validator."""
+
+    @pytest.fixture
+    def staging_manager(self, tmp_path):
+        """Stub staging manager holding one trades and one book file."""
+        manager = create_autospec(DataStagingManager, instance=True)
+        manager.raw_dir = tmp_path / "raw"
+        manager.manifest = {}
+
+        files = [
+            _manifest(f"BINANCE_BTC-USDT_{data_type}_20240101_20240107.parquet",
+                      data_type, tmp_path)
+            for data_type in ["trades", "book"]
+        ]
+        manager.get_files_by_status.return_value = files
+
+        def move_to_validating(s3_key):
+            manifest = next(m for m in files if m.key == s3_key)
+            manifest.local_path = str(tmp_path / "validating" / s3_key)
+            return True
+
+        manager.move_to_validating.side_effect = move_to_validating
+        manager.move_to_ready.return_value = True
+        manager.move_to_quarantine.return_value = True
+        manager.get_staging_summary.return_value = {
+            "status_counts": {"ready": 1, "quarantined": 1},
+            "total_size_mb": 0.0
+        }
+        return manager
+
+    def _invoke(self, tmp_path, staging_manager, validator, *args):
+        with patch(
+            "rlx_datapipe.acquisition.staging_manager.DataStagingManager",
+            return_value=staging_manager
+        ), patch(
+            "rlx_datapipe.acquisition.integrity_validator.IntegrityValidator",
+            return_value=validator
+        ):
+            return CliRunner().invoke(
+                cli, ["validate", "--staging-path", str(tmp_path), *args]
+            )
+
+    def test_validate_moves_files_by_result(self, tmp_path, staging_manager):
+        """Test passing files move to ready and failing files to quarantine."""
+        validator = create_autospec(IntegrityValidator, instance=True)
+        results = {
+            "trades": _result(Path("trades.parquet")),
+            "book": _result(Path("book.parquet"), errors=["Missing columns"]),
+        }
+        validator.validate_file.side_effect = (
+            lambda _path, data_type: results[data_type]
+        )
+
+        result = self._invoke(tmp_path, staging_manager, validator)
+
+        assert result.exit_code == 0
+        raw_files = staging_manager.get_files_by_status.return_value
+        trades_key, book_key = (m.key for m in raw_files)
+        staging_manager.get_files_by_status.assert_called_once_with(FileStatus.RAW)
+        assert sorted(staging_manager.move_to_validating.call_args_list) == sorted(
+            [call(trades_key), call(book_key)]
+        )
+        validator.validate_file.assert_any_call(
+            tmp_path / "validating" / trades_key, "trades"
+        )
+        staging_manager.move_to_ready.assert_called_once_with(
+            trades_key, results["trades"]
+        )
+        staging_manager.move_to_quarantine.assert_called_once_with(
+            book_key, results["book"], "Missing columns"
+        )
+        assert "Ready files: 1" in result.output
+        assert "Quarantined files: 1" in result.output
+
+    def test_validate_continues_after_a_failing_file(self, tmp_path, staging_manager):
+        """Test one file raising does not stop the other files."""
+        validator = create_autospec(IntegrityValidator, instance=True)
+
+        def validate_file(path, data_type):
+            if data_type == "book":
+                raise OSError("corrupt footer")
+            return _result(path)
+
+        validator.validate_file.side_effect = validate_file
+
+        result = self._invoke(tmp_path, staging_manager, validator)
+
+        assert result.exit_code == 0
+        assert staging_manager.move_to_ready.call_count == 1
+        staging_manager.move_to_quarantine.assert_not_called()
+        assert "VALIDATION SUMMARY" in result.output
+
+    def test_validate_filters_by_data_type(self, tmp_path, staging_manager):
+        """Test --data-type limits validation to matching files."""
+        validator = create_autospec(IntegrityValidator, instance=True)
+        validator.validate_file.side_effect = lambda path, _data_type: _result(path)
+
+        result = self._invoke(
+            tmp_path, staging_manager, validator, "--data-type", "book"
+        )
+
+        assert result.exit_code == 0
+        assert validator.validate_file.call_count == 1
+        assert validator.validate_file.call_args.args[1] == "book"
+
+
+def test_register_raw_files(tmp_path):
+    """Test lakeapi downloads in raw/ are added to the staging manifest once."""
+    staging_manager = DataStagingManager(staging_root=tmp_path)
+    name = "BINANCE_BTC-USDT_book_delta_v2_20240101_20240107.parquet"
+    (staging_manager.raw_dir / name).write_bytes(b"data")
+    (staging_manager.raw_dir / "unexpected.parquet").write_bytes(b"data")
+
+    _register_raw_files(staging_manager)
+    _register_raw_files(staging_manager)
+
+    assert list(staging_manager.manifest) == [name]
+    manifest = staging_manager.manifest[name]
+    assert manifest.status == FileStatus.RAW
+    assert manifest.exchange == "BINANCE"
+    assert manifest.symbol == "BTC-USDT"
+    assert manifest.data_type == "book_delta_v2"
+    assert manifest.date == "2024-01-01"
+    assert manifest.size_bytes == 4
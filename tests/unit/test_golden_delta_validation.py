@@ -127,12 +127,28 @@ class TestGoldenSampleDeltaValidator:
         assert result["sequence_gaps"]["gaps_by_size"]["1-10"] == 1
         assert result["sequence_gaps"]["gap_ratio_percent"] > 0
 
-    def test_gap_size_buckets(self, validator):
-        """Test gap size bucket categorization."""
-        assert validator._get_gap_size_bucket(5) == "1-10"
-        assert validator._get_gap_size_bucket(50) == "11-100"
-        assert validator._get_gap_size_bucket(500) == "101-1000"
-        assert validator._get_gap_size_bucket(5000) == "1000+"
+    def test_gap_size_buckets(self, validator, tmp_path):
+        """Test gaps are bucketed by size, with each break in the lower bucket."""
+        test_file = tmp_path / "test.jsonl.gz"
+        first_id = 1000
+        with gzip.open(test_file, "wt") as f:
+            for gap in [0, 5, 10, 50, 100, 500, 1000, 5000]:
+                first_id += gap
+                msg = {
+                    "stream": "btcusdt@depth@100ms",
+                    "data": {"e": "depthUpdate", "U": first_id, "u": first_id + 9}
+                }
+                f.write(json.dumps(msg) + "\n")
+                first_id += 10
+
+        result = validator.validate_regime("test_regime", tmp_path)
+
+        assert result["sequence_gaps"]["gaps_by_size"] == {
+            "1-10": 2,
+            "11-100": 2,
+            "101-1000": 2,
+            "1000+": 1,
+        }
 
     def test_validate_regime_empty_directory(self, validator, tmp_path):
         """Test validation with empty directory."""
@@ -156,6 +172,37 @@ class TestGoldenSampleDeltaValidator:
         assert result["files_analyzed"] == 1
         assert result["total_messages"] == 1  # Only valid message counted
 
+    def test_validate_regime_empty_file(self, validator, tmp_path):
+        """Test an empty capture file counts as zero messages."""
+        gzip.open(tmp_path / "test.jsonl.gz", "wb").close()
+
+        with patch.object(validator, "_read_messages_by_line") as read_by_line:
+            result = validator.validate_regime("test_regime", tmp_path)
+
+        read_by_line.assert_not_called()
+        assert result["files_analyzed"] == 1
+        assert result["total_messages"] == 0
+        assert result["depth_updates"] == 0
+
+    def test_validate_regime_truncated_file(self, validator, tmp_path):
+        """Test a truncated capture keeps the messages before the truncation."""
+        lines = [
+            json.dumps({
+                "stream": "btcusdt@depth@100ms",
+                "data": {"e": "depthUpdate", "U": i * 10, "u": i * 10 + 9}
+            }) + "\n"
+            for i in range(5000)
+        ]
+        data = gzip.compress("".join(lines).encode())
+        (tmp_path / "test.jsonl.gz").write_bytes(data[: len(data) * 2 // 3])
+
+        result = validator.validate_regime("test_regime", tmp_path)
+
+        assert result["files_analyzed"] == 1
+        assert 0 < result["total_messages"] < 5000
+        assert result["depth_updates"] == result["total_messages"]
+        assert result["sequence_gaps"]["count"] == 0
+
     def test_validate_all_regimes(self, validator, tmp_path):
         """Test validation across all regimes."""
         # Create regime directories